@@ -0,0 +1,92 @@
+"""
+Keyword talk-track classification: compiled rule table vs. the original if/elif chain.
+
+    PYTHONPATH=src python benchmarks/bench_bridge_rules.py [--items 100000] [--seed 0]
+
+Generates synthetic titles from the watchlist sources and vocabulary, checks that the rule
+engine returns exactly what the original chain returned for every item, and reports items/s
+for single-item and batch classification.
+"""
+import time
+import random
+import argparse
+
+from ai_tpc_agent.core.bridge_rules import bridge_engine
+
+VOCABULARY = ('vertex ai gemini 2.5 flash pro claude opus sonnet haiku anthropic openai swarm multi-agent mcp '
+              'model context protocol genkit firebase autogen crewai langgraph agent builder generative engine '
+              'security compliance governance adk agent development kit a2ui a2a release notes patch update '
+              'preview ga launch sdk python java storage bigquery message page change tooling cloud run').split()
+SOURCES = ('vertex-ai-releases', 'anthropic-news', 'openai-agents-sdk', 'genkit', 'langgraph', 'adk-python', 'misc-blog')
+
+
+def legacy_bridge(knowledge_item):
+    """The if/elif chain the rule table replaced, kept verbatim as the reference."""
+    title = knowledge_item.get('title', '').lower()
+    bridge_context = 'This update improves developer velocity and aligns with the 2026 Sovereign AI themes.'
+    title_and_source = (title + ' ' + knowledge_item.get('source', '').lower())
+    if any((term in title_and_source for term in ['claude', 'anthropic', 'opus', 'sonnet', 'haiku'])):
+        bridge_context = 'PARTNER DEPTH: New Claude/Anthropic updates. Essential for multi-model strategy and agentic tool diversity.'
+    elif any((term in title_and_source for term in ['openai', 'multi-agent', 'swarm'])):
+        bridge_context = 'PARTNER CONTEXT: OpenAI Agent SDK update. Critical for cross-ecosystem multi-agent orchestration and comparison.'
+    elif any((term in title_and_source for term in ['mcp', 'model context protocol'])):
+        bridge_context = 'INDUSTRY STANDARD: Model Context Protocol (MCP) update. Essential for standardizing how agents connect to data and tools.'
+    elif any((term in title_and_source for term in ['genkit', 'firebase'])):
+        bridge_context = "GOOGLE ECOSYSTEM: Firebase Genkit update. Key for developers building AI-orchestrated apps in the Google/Firebase stack."
+    elif any((term in title_and_source for term in ['autogen', 'crewai', 'langgraph'])):
+        bridge_context = "COMPETITIVE PULSE: Major update in rival agent frameworks (AutoGen/CrewAI/LangGraph). Monitor for feature parity and market shift."
+    elif any((term in title_and_source for term in ['agent', 'builder'])):
+        bridge_context = "CRITICAL: Enhances Agent Builder. Field should focus on 'Low-Code to Pro-Code' transition stories."
+    elif any((term in title_and_source for term in ['gemini', 'ge', 'generative engine'])):
+        bridge_context = "GE UPDATE: New Gemini models/features. Highlight 'Context Window' and 'Reasoning Engine' improvements."
+    elif any((term in title_and_source for term in ['security', 'compliance', 'governance'])):
+        bridge_context = 'GOVERNANCE: Directly addresses Enterprise Security concerns. Use to unblock FinServ/Healthcare deals.'
+    elif 'adk' in title or 'agent development kit' in title:
+        bridge_context = "DEV EXPERIENCE: ADK Update. Promotes standardized agent building. Essential for 'Agent-First' architecture talks."
+    elif 'a2ui' in title:
+        bridge_context = 'UX REVOLUTION: Agent-Driven UI (A2UI). Allows agents to render native UI components. Key for premium client demos.'
+    elif 'a2a' in title:
+        bridge_context = "INTEROPERABILITY: A2A Protocol. Standardizes how different agents talk to each other. Sell the 'Agentic Ecosystem' story."
+    return bridge_context
+
+
+def synthetic_items(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    items = []
+    for _ in range(n):
+        words = [rng.choice(VOCABULARY) for _ in range(rng.randint(1, 8))]
+        # Mixed case and glued words exercise the case-insensitive substring (not word-boundary) semantics
+        words = [w.upper() if rng.random() < 0.2 else w.title() if rng.random() < 0.3 else w for w in words]
+        title = ' '.join(words) if rng.random() < 0.9 else ''.join(words)
+        items.append({'title': title, 'source': rng.choice(SOURCES)})
+    return items
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    items = synthetic_items(args.items, args.seed)
+    engine = bridge_engine()
+    reference, legacy_s = timed(lambda xs: [legacy_bridge(i) for i in xs], items)
+    single, single_s = timed(lambda xs: [engine.classify(i) for i in xs], items)
+    batch, batch_s = timed(engine.classify_many, items)
+
+    mismatches = sum(a != b for a, b in zip(reference, single)) + sum(a != b for a, b in zip(reference, batch))
+    for label, seconds in (('if/elif chain', legacy_s), ('rule engine', single_s), ('rule engine batch', batch_s)):
+        print(f'{label:>18}: {seconds:.3f}s ({args.items / seconds:,.0f} items/s, {legacy_s / seconds:.2f}x)')
+    print(f'{mismatches} mismatches against the if/elif chain over {args.items:,} items')
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark for the HTML email renderer on large digests.
+
+    PYTHONPATH=src python benchmarks/bench_html_render.py [--items 1000] [--recipients 50]
+
+Reports cold render time (empty fragment cache), warm render time (every item card
+cached, as for the 2nd..Nth recipient) and scaling across digest sizes.
+"""
+import argparse
+import json
+import random
+import time
+from ai_tpc_agent.core.html_renderer import HTMLReportRenderer
+
+SOURCES = ['vertex-ai-releases', 'generative-ai-releases', 'anthropic-news', 'openai-agents-python',
+           'google-adk-python', 'genkit', 'langgraph', 'gemini-enterprise-releases']
+
+
+def make_digest(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [{
+        'title': f'Update {i}: {rng.choice(["Agent Builder", "Gemini", "Claude", "MCP"])} feature {i}',
+        'source': rng.choice(SOURCES),
+        'impact_score': rng.randint(0, 100),
+        'summary': f'**Key Feature:** capability {i}\n- **Customer Value:** faster delivery\n- **Sales Play:** lead with governance',
+        'bridge': f'Field talk track {i} 🚀',
+        'tags': rng.choice([[], ['Security'], ['Governance', 'UX'], ['Performance']]),
+        'source_url': f'https://example.com/{i}',
+        'date': '2026-02-06T12:00:00Z'
+    } for i in range(n)]
+
+
+def timed(fn, repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--recipients', type=int, default=50)
+    args = parser.parse_args()
+
+    digest = make_digest(args.items)
+    renderer = HTMLReportRenderer()
+    kwargs = dict(tldr='Executive synthesis', date_range='2026-01-01 to 2026-01-31', gaps='- **Gap:** parity')
+
+    cold = timed(lambda: renderer.render(digest, **kwargs))
+    warm = timed(lambda: renderer.render(digest, **kwargs), repeat=args.recipients)
+    scaling = {}
+    for n in (100, 1000, 5000):
+        sized = make_digest(n)
+        scaling[n] = round(timed(lambda: HTMLReportRenderer().render(sized, **kwargs)) * 1000, 2)
+
+    print(json.dumps({
+        'items': args.items,
+        'cold_render_ms': round(cold * 1000, 2),
+        'warm_render_ms': round(warm * 1000, 2),
+        'recipients': args.recipients,
+        'total_for_recipients_ms': round((cold + warm * (args.recipients - 1)) * 1000, 2),
+        'fragment_hit_rate': round(renderer.fragment_hits / max(1, renderer.fragment_hits + renderer.fragment_misses), 3),
+        'cold_render_ms_by_size': scaling,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+"""
+Offline end-to-end benchmark: browse_knowledge -> synthesize_reports -> render.
+
+    PYTHONPATH=src python benchmarks/bench_pipeline.py [--scales 20 200 2000] [--latency 0.05]
+        [--failure-rate 0.02] [--output results.json] [--compare previous.json]
+
+Recorded Atom/RSS/HTML fixtures (benchmarks/fixtures) are replayed through the real watcher
+for a generated watchlist sized to each scale, and every model call goes to a deterministic
+FakeGeminiClient. No network, credentials or Vertex AI corpus are needed. Reports wall time,
+model calls, peak traced memory and the per-stage breakdown from the pipeline tracer, and
+stores everything as JSON so runs can be compared for regressions.
+"""
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import contextlib
+import subprocess
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from fake_gemini import FakeGeminiClient
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+FIXTURE_FILES = (('release_notes.atom', '.xml'), ('news.rss', '.rss'), ('release_notes.html', ''))
+CATEGORIES = ('platform', 'roadmap', 'trends')
+ITEMS_PER_SOURCE = 5  # browse_ai_knowledge reads the 5 most recent items per source
+
+
+class FixtureReplay:
+    """Serves recorded fixtures in place of urllib.request.urlopen, keyed by URL."""
+
+    def __init__(self):
+        self.routes = {}
+        self.templates = {}
+        for name, _ in FIXTURE_FILES:
+            with open(os.path.join(FIXTURES, name), 'r') as f:
+                self.templates[name] = f.read()
+        self.requests = 0
+
+    def add(self, url: str, fixture: str, source: str):
+        self.routes[url] = self.templates[fixture].replace('{source}', source).encode('utf-8')
+
+    def __call__(self, request, timeout=None):
+        url = request.full_url if hasattr(request, 'full_url') else request
+        self.requests += 1
+        if url not in self.routes:
+            raise OSError(f'No recorded fixture for {url}')
+        return io.BytesIO(self.routes[url])
+
+
+def build_watchlist(n_items: int, directory: str, replay: FixtureReplay) -> str:
+    """Writes a watchlist with enough sources to yield n_items and registers their fixtures."""
+    hub = {}
+    for i in range((n_items + ITEMS_PER_SOURCE - 1) // ITEMS_PER_SOURCE):
+        fixture, suffix = FIXTURE_FILES[i % len(FIXTURE_FILES)]
+        name = f'bench-source-{i:04d}'
+        url = f'https://fixtures.local/{name}/feed{suffix}'
+        replay.add(url, fixture, name)
+        hub[name] = {'feed': url, 'description': f'Recorded fixture {fixture}', 'category': CATEGORIES[i % len(CATEGORIES)]}
+    path = os.path.join(directory, f'watchlist-{n_items}.json')
+    with open(path, 'w') as f:
+        json.dump({'ai_knowledge_hub': hub, 'roadmap_trackers': {}}, f)
+    return path
+
+
+def run_scale(n_items: int, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0,
+              seed: int = 0, track_memory: bool = True) -> dict:
+    from ai_tpc_agent.core import agent as agent_module
+    from ai_tpc_agent.core import watcher
+    from ai_tpc_agent.core.vector_store import TPCVectorStore
+    from ai_tpc_agent.core.tracing import tracer, TracedClient
+    from ai_tpc_agent.core.html_renderer import HTMLReportRenderer
+    from ai_tpc_agent.core.chat_bridge import GoogleChatBridge
+
+    class OfflineVectorStore(TPCVectorStore):
+        """Accepts writes in memory so the persistence stage runs without Vertex AI."""
+
+        def __init__(self, *args, **kwargs):
+            self.enabled = True
+            self._write_listeners = []
+            self.pulses = []
+
+        def upsert_pulses(self, pulses):
+            self.pulses.extend(pulses)
+            self._notify_write()
+
+        def query(self, text, n_results=5):
+            return []
+
+    fake = FakeGeminiClient(latency=latency, jitter=jitter, failure_rate=failure_rate, seed=seed)
+    replay = FixtureReplay()
+    with tempfile.TemporaryDirectory() as tmp, contextlib.ExitStack() as stack:
+        env = {k: v for k, v in os.environ.items() if k != 'GOOGLE_API_KEY'}
+        env['TPC_STATE_DIR'] = os.path.join(tmp, 'state')
+        stack.enter_context(patch.dict(os.environ, env, clear=True))
+        stack.enter_context(patch.object(agent_module, 'WATCHLIST_PATH', build_watchlist(n_items, tmp, replay)))
+        stack.enter_context(patch.object(agent_module, 'TPCVectorStore', OfflineVectorStore))
+        stack.enter_context(patch.object(watcher.urllib.request, 'urlopen', replay))
+        stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+
+        tpc = agent_module.TPCAgent(project_id='bench')
+        tpc.client = TracedClient(fake)
+        if track_memory:
+            tracemalloc.start()
+        tracer.enable()
+        start = time.perf_counter()
+        try:
+            with tracer.span('bench.pipeline'):
+                knowledge = tpc.browse_knowledge()
+                fetched = len(knowledge)
+                synthesized = tpc.synthesize_reports(knowledge)
+                with tracer.span('bench.render'):
+                    items = synthesized['items']
+                    html = HTMLReportRenderer().render(items, tldr=synthesized['tldr'], date_range='benchmark', gaps=synthesized['gaps'])
+                    cards = GoogleChatBridge('https://chat.googleapis.com/v1/spaces/BENCH/messages').build_messages(items)
+            wall = time.perf_counter() - start
+        finally:
+            tracer.disable()
+            peak = tracemalloc.get_traced_memory()[1] if track_memory else None
+            if track_memory:
+                tracemalloc.stop()
+        stages = tracer.summary()
+        tracer.reset()
+
+    return {
+        'items': n_items,
+        'items_fetched': fetched,
+        'items_synthesized': len(synthesized['items']),
+        'wall_seconds': round(wall, 4),
+        'model_calls': fake.total_calls,
+        'model_calls_by_model': dict(fake.calls),
+        'model_failures': sum(fake.failures.values()),
+        'tokens': synthesized['ledger']['total_tokens'],
+        'cost_usd': synthesized['ledger']['cost_usd'],
+        'tokens_by_site': {f"{s['site']}:{s['model']}": s['input_tokens'] + s['output_tokens'] for s in synthesized['ledger']['by_site']},
+        'feed_requests': replay.requests,
+        'peak_memory_mb': round(peak / 2 ** 20, 2) if peak is not None else None,
+        'html_bytes': len(html.encode('utf-8')),
+        'chat_messages': len(cards),
+        'stages': [{k: (round(v, 4) if isinstance(v, float) else v) for k, v in stage.items()} for stage in stages],
+    }
+
+
+def compare(current: dict, previous: dict, max_regression: float) -> list:
+    """Prints per-scale deltas; returns the scales whose wall time regressed beyond the threshold."""
+    before = {s['items']: s for s in previous.get('scales', [])}
+    regressions = []
+    print(f"\n{'items':>7} {'wall s':>10} {'prev s':>10} {'delta':>8} {'calls':>7} {'prev':>7} {'peak MB':>9} {'prev':>7}")
+    for scale in current['scales']:
+        old = before.get(scale['items'])
+        if not old:
+            print(f"{scale['items']:>7} {scale['wall_seconds']:>10.3f} {'-':>10}")
+            continue
+        delta = (scale['wall_seconds'] - old['wall_seconds']) / old['wall_seconds'] if old['wall_seconds'] else 0.0
+        flag = '  REGRESSION' if delta > max_regression else ''
+        print(f"{scale['items']:>7} {scale['wall_seconds']:>10.3f} {old['wall_seconds']:>10.3f} {delta:>+8.1%} "
+              f"{scale['model_calls']:>7} {old['model_calls']:>7} {scale['peak_memory_mb'] or 0:>9.1f} {old.get('peak_memory_mb') or 0:>7.1f}{flag}")
+        if flag:
+            regressions.append(scale['items'])
+    return regressions
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[20, 200, 2000])
+    parser.add_argument('--latency', type=float, default=0.0, help='Fake model latency per call (seconds)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency per call, up to this many seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of model calls that fail')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true', help='Skip tracemalloc peak-memory tracking (lower overhead)')
+    parser.add_argument('--output', help='Results JSON path (default: .tpc_state/benchmarks/pipeline-<timestamp>.json)')
+    parser.add_argument('--compare', help='Previous results JSON to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.2, help='Allowed wall-time increase before failing --compare')
+    args = parser.parse_args()
+
+    results = {
+        'benchmark': 'pipeline',
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'config': {'latency': args.latency, 'jitter': args.jitter, 'failure_rate': args.failure_rate, 'seed': args.seed},
+        'scales': [],
+    }
+    for n in args.scales:
+        scale = run_scale(n, args.latency, args.jitter, args.failure_rate, args.seed, track_memory=not args.no_memory)
+        results['scales'].append(scale)
+        top = sorted((s for s in scale['stages'] if s['depth'] > 0), key=lambda s: s['total_seconds'], reverse=True)[:3]
+        print(f"{n:>6} items: {scale['wall_seconds']:.3f}s wall, {scale['model_calls']} model calls, "
+              f"peak {scale['peak_memory_mb']} MB; top stages: " + ', '.join(f"{s['stage']} {s['total_seconds']:.3f}s" for s in top))
+
+    from ai_tpc_agent.core.state import state_path
+    output = args.output or state_path('benchmarks', f"pipeline-{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json")
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'Results written to {output}')
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        if regressions:
+            print(f'Wall time regressed more than {args.max_regression:.0%} at scales: {regressions}')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
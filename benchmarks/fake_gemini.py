@@ -0,0 +1,99 @@
+"""
+Deterministic stand-in for genai.Client used by the offline benchmarks.
+
+Responses, latencies and failures depend only on (seed, model, prompt, attempt), so runs
+are reproducible regardless of thread scheduling. Token usage is estimated at ~4 chars/token.
+"""
+import re
+import json
+import time
+import hashlib
+import threading
+from collections import Counter
+from types import SimpleNamespace
+
+
+def _unit(*parts) -> float:
+    """Stable pseudo-random number in [0, 1) derived from the parts."""
+    digest = hashlib.sha256('\x1f'.join(map(str, parts)).encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') / 2 ** 64
+
+
+class FakeModelError(RuntimeError):
+    pass
+
+
+class _FakeImage:
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n' + b'\x00' * 1024)
+
+
+class _FakeModels:
+    def __init__(self, client: 'FakeGeminiClient'):
+        self._client = client
+
+    def generate_content(self, model: str, contents, config=None, **kwargs):
+        prompt = contents if isinstance(contents, str) else json.dumps(contents, default=str)
+        self._client._begin(model, prompt)
+        text = _respond(prompt)
+        return SimpleNamespace(text=text, usage_metadata=SimpleNamespace(
+            prompt_token_count=max(1, len(prompt) // 4), candidates_token_count=max(1, len(text) // 4)))
+
+    def generate_image(self, model: str, prompt: str, **kwargs):
+        self._client._begin(model, prompt)
+        return _FakeImage()
+
+
+class FakeGeminiClient:
+    """
+    Offline client exposing `models.generate_content` / `models.generate_image`.
+    `latency` (seconds) plus up to `jitter` is slept per call; a `failure_rate`
+    fraction of calls raises FakeModelError.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self.calls: Counter = Counter()
+        self.failures: Counter = Counter()
+        self._attempts: Counter = Counter()
+        self._lock = threading.Lock()
+        self.models = _FakeModels(self)
+
+    def _begin(self, model: str, prompt: str):
+        key = hashlib.sha1(f'{model}\x1f{prompt}'.encode('utf-8')).hexdigest()
+        with self._lock:
+            self.calls[model] += 1
+            self._attempts[key] += 1
+            attempt = self._attempts[key]
+        delay = self.latency + self.jitter * _unit(self.seed, key, attempt, 'latency')
+        if delay:
+            time.sleep(delay)
+        if _unit(self.seed, key, attempt, 'failure') < self.failure_rate:
+            with self._lock:
+                self.failures[model] += 1
+            raise FakeModelError(f'injected failure for {model}')
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+
+def _respond(prompt: str) -> str:
+    if "'index' and 'score'" in prompt:
+        indices = [int(i) for i in re.findall(r'^\s*\[(\d+)\]', prompt, flags=re.MULTILINE)]
+        return json.dumps([{'index': i, 'score': int(_unit('score', i, prompt[-64:]) * 100)} for i in indices])
+    if prompt.startswith('Categorize this technical update'):
+        return ['Governance, Security', 'Performance', 'UX, Scalability'][int(_unit(prompt) * 3)]
+    if 'markdown bullet points' in prompt:
+        return ('- **Key Feature:** Faster, governed agent workflows.\n'
+                '- **Customer Value:** Lower latency and cost at scale.\n'
+                '- **Sales Play:** Lead with enterprise readiness.')
+    if 'Executive Synthesis' in prompt:
+        return '🚀 Platform and partner ecosystems converged on governed, production-grade agents this period. 🎯'
+    if 'Strategic AI Analyst' in prompt:
+        return '- **Parity:** Maintain parity across core agentic workflows.\n- **Edge:** Grounding and data governance.'
+    return f'📈 Field talk track {hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:8]}: this update lets architects ship production agents faster.'
@@ -1,10 +1,35 @@
-from fastapi import FastAPI, Query
-from typing import List, Dict, Any, Optional
+import time
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from starlette.routing import Match
+from typing import List, Dict, Any, Optional, Literal
 from .agent import TPCAgent
+from .metrics import (registry, CONTENT_TYPE, HTTP_REQUEST_SECONDS, HTTP_IN_FLIGHT,
+                      QUERY_CACHE_LOOKUPS, QUERY_CACHE_HIT_RATIO, QUERY_CACHE_ENTRIES)
 
 app = FastAPI(title="AI TPC Agent API", version="0.1.0-RAG")
 agent = TPCAgent()
 
+def _route_template(request: Request) -> str:
+    # Label by route template, never the raw path, to keep series cardinality bounded
+    for route in app.router.routes:
+        if route.matches(request.scope)[0] == Match.FULL:
+            return route.path
+    return "unmatched"
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    route = _route_template(request)
+    HTTP_IN_FLIGHT.inc(method=request.method, route=route)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_IN_FLIGHT.dec(method=request.method, route=route)
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - start, method=request.method, route=route, status=str(status))
+
 @app.get("/")
 def read_root():
     return {"message": "AI TPC Agent API is active", "status": "healthy"}
@@ -14,6 +39,39 @@ def query_agent(q: str = Query(..., description="The search query for the AI kno
     results = agent.query_knowledge(q)
     return {"query": q, "results": results}
 
+@app.get("/pulses")
+def list_pulses(since: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+                until: Optional[str] = Query(None, description="End date, inclusive (YYYY-MM-DD)"),
+                source: Optional[List[str]] = Query(None, description="Source name or prefix (repeatable)"),
+                category: Optional[List[str]] = Query(None),
+                tag: Optional[List[str]] = Query(None),
+                min_score: Optional[int] = Query(None, ge=0, le=100),
+                max_score: Optional[int] = Query(None, ge=0, le=100),
+                order_by: Literal['date', 'impact_score'] = 'date',
+                facets: bool = False,
+                limit: int = Query(50, ge=1, le=500),
+                offset: int = Query(0, ge=0)):
+    try:
+        return agent.pulse_history(limit=limit, offset=offset, order_by=order_by, with_facets=facets,
+                                   since=since, until=until, sources=source, categories=category,
+                                   tags=tag, min_score=min_score, max_score=max_score)
+    except ValueError as e:
+        # Malformed since/until (the archive also accepts full ISO timestamps)
+        raise HTTPException(status_code=422, detail=f"Invalid date bound: {e}")
+
+@app.get("/cache")
+def cache_stats():
+    return {"query_cache": agent.query_cache.stats()}
+
+@app.get("/metrics")
+def metrics():
+    stats = agent.query_cache.stats()
+    QUERY_CACHE_LOOKUPS.sync(stats['hits'], result='hit')
+    QUERY_CACHE_LOOKUPS.sync(stats['misses'], result='miss')
+    QUERY_CACHE_HIT_RATIO.set(stats['hit_rate'])
+    QUERY_CACHE_ENTRIES.set(stats['entries'])
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
 @app.get("/pulse")
 def get_pulse(days: int = 1):
     knowledge = agent.browse_knowledge()
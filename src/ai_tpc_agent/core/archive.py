@@ -0,0 +1,158 @@
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Iterable
+from .state import state_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pulses (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    source TEXT NOT NULL COLLATE NOCASE,
+    category TEXT NOT NULL COLLATE NOCASE,
+    title TEXT NOT NULL,
+    summary TEXT,
+    bridge TEXT,
+    source_url TEXT,
+    impact_score INTEGER,
+    tags_json TEXT,
+    archived_at TEXT NOT NULL,
+    business_summary TEXT
+);
+CREATE TABLE IF NOT EXISTS pulse_tags (
+    pulse_id TEXT NOT NULL REFERENCES pulses(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, pulse_id)
+);
+CREATE INDEX IF NOT EXISTS idx_pulses_date ON pulses(date);
+CREATE INDEX IF NOT EXISTS idx_pulses_source ON pulses(source, date);
+CREATE INDEX IF NOT EXISTS idx_pulses_category ON pulses(category, date);
+CREATE INDEX IF NOT EXISTS idx_pulses_impact ON pulses(impact_score, date);
+CREATE INDEX IF NOT EXISTS idx_pulse_tags_pulse ON pulse_tags(pulse_id);
+"""
+
+FACETS = ('source', 'category', 'tag')
+
+
+def pulse_key(pulse: Dict[str, Any]) -> str:
+    """Stable identifier for a pulse across runs (same shape as the RAG file name)."""
+    return pulse.get('id') or f"{pulse.get('source')}_{pulse.get('title')}_{pulse.get('date', '')}"
+
+
+def _normalize_date(date_str: str) -> str:
+    from .agent import parse_date
+    return parse_date(date_str or '').astimezone(timezone.utc).isoformat()
+
+
+def _day_bound(day: str, end: bool = False) -> str:
+    """Turns a YYYY-MM-DD (or ISO) bound into a UTC ISO string; 'until' bounds are inclusive of the day."""
+    dt = datetime.fromisoformat(day) if 'T' in day else datetime.strptime(day[:10], '%Y-%m-%d')
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    if end and 'T' not in day:
+        dt += timedelta(days=1)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+class PulseArchive:
+    """
+    Local SQLite archive of synthesized pulses, indexed for range and facet queries
+    by date, source, category, tags and impact_score. No remote calls involved.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or state_path('pulse_archive.db')
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+            # Archives created before business summaries were stored
+            if 'business_summary' not in {row[1] for row in conn.execute('PRAGMA table_info(pulses)')}:
+                conn.execute('ALTER TABLE pulses ADD COLUMN business_summary TEXT')
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA foreign_keys=ON')
+        return conn
+
+    def add_pulses(self, pulses: Iterable[Dict[str, Any]]) -> int:
+        """Upserts pulses (re-archiving the same item replaces it) and returns the count written."""
+        now = datetime.now(timezone.utc).isoformat()
+        rows, tag_rows = [], []
+        for pulse in pulses:
+            key = pulse_key(pulse)
+            tags = pulse.get('tags') if isinstance(pulse.get('tags'), list) else []
+            rows.append((key, _normalize_date(pulse.get('date', '')), pulse.get('source', 'unknown'),
+                         pulse.get('category', 'general'), pulse.get('title', ''), pulse.get('summary', ''),
+                         pulse.get('bridge', ''), pulse.get('source_url', ''), pulse.get('impact_score'),
+                         json.dumps(tags), now, pulse.get('business_summary')))
+            tag_rows.extend((key, t.strip().lower()) for t in tags if t and t.strip())
+        if not rows:
+            return 0
+        with closing(self._connect()) as conn, conn:
+            conn.executemany('DELETE FROM pulse_tags WHERE pulse_id = ?', [(r[0],) for r in rows])
+            conn.executemany('INSERT OR REPLACE INTO pulses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            conn.executemany('INSERT OR IGNORE INTO pulse_tags VALUES (?, ?)', tag_rows)
+        return len(rows)
+
+    def _where(self, since: str = None, until: str = None, sources: List[str] = None,
+               categories: List[str] = None, tags: List[str] = None,
+               min_score: int = None, max_score: int = None):
+        clauses, params = [], []
+        if since:
+            clauses.append('p.date >= ?')
+            params.append(_day_bound(since))
+        if until:
+            clauses.append('p.date < ?')
+            params.append(_day_bound(until, end=True))
+        if sources:
+            # Prefix match so "anthropic" covers anthropic-news and anthropic-blog
+            clauses.append('(' + ' OR '.join('p.source LIKE ?' for _ in sources) + ')')
+            params.extend(f'{s}%' for s in sources)
+        if categories:
+            clauses.append(f"p.category IN ({', '.join('?' for _ in categories)})")
+            params.extend(categories)
+        if tags:
+            clauses.append(f"p.id IN (SELECT pulse_id FROM pulse_tags WHERE tag IN ({', '.join('?' for _ in tags)}))")
+            params.extend(t.lower() for t in tags)
+        if min_score is not None:
+            clauses.append('p.impact_score >= ?')
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append('p.impact_score <= ?')
+            params.append(max_score)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def query(self, limit: int = 50, offset: int = 0, order_by: str = 'date', **filters) -> Dict[str, Any]:
+        """
+        Paginated range/facet query. Filters: since, until (YYYY-MM-DD, inclusive), sources,
+        categories, tags, min_score, max_score. order_by is 'date' or 'impact_score' (both descending).
+        """
+        where, params = self._where(**filters)
+        order = 'p.impact_score DESC, p.date DESC' if order_by == 'impact_score' else 'p.date DESC'
+        with closing(self._connect()) as conn:
+            total = conn.execute(f'SELECT COUNT(*) FROM pulses p{where}', params).fetchone()[0]
+            rows = conn.execute(f'SELECT p.* FROM pulses p{where} ORDER BY {order} LIMIT ? OFFSET ?',
+                                params + [limit, offset]).fetchall()
+        return {'total': total, 'limit': limit, 'offset': offset, 'items': [self._row_to_pulse(r) for r in rows]}
+
+    def facets(self, **filters) -> Dict[str, Dict[str, int]]:
+        """Counts per source, category and tag for the pulses matching the filters."""
+        where, params = self._where(**filters)
+        result = {}
+        with closing(self._connect()) as conn:
+            for facet in FACETS:
+                if facet == 'tag':
+                    sql = f'SELECT t.tag, COUNT(*) FROM pulse_tags t JOIN pulses p ON p.id = t.pulse_id{where} GROUP BY t.tag'
+                else:
+                    sql = f'SELECT p.{facet}, COUNT(*) FROM pulses p{where} GROUP BY p.{facet}'
+                rows = conn.execute(sql + ' ORDER BY 2 DESC', params).fetchall()
+                result[facet] = {r[0]: r[1] for r in rows}
+        return result
+
+    @staticmethod
+    def _row_to_pulse(row: sqlite3.Row) -> Dict[str, Any]:
+        pulse = {k: row[k] for k in row.keys() if k not in ('tags_json', 'archived_at')}
+        pulse['tags'] = json.loads(row['tags_json'] or '[]')
+        return pulse
@@ -0,0 +1,141 @@
+import os
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from rich.console import Console
+from .state import state_path
+from .tracing import tracer
+from .watcher import fetch_history_page
+from .pipeline import StreamingPipeline, StreamCheckpoint, batched
+console = Console()
+
+
+class BackfillJournal:
+    """
+    Local JSON journal of per-source backfill progress (next page to fetch, items loaded).
+    Completed sources are skipped and unfinished ones resume at their next page on rerun.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or state_path('backfill_journal.json')
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.entries = json.load(f).get('sources', {})
+            except (OSError, ValueError):
+                console.print(f'[yellow]Warning: Backfill journal {self.path} is unreadable, starting fresh.[/yellow]')
+
+    def status(self, source: str) -> Optional[str]:
+        return self.entries.get(source, {}).get('status')
+
+    def next_page(self, source: str) -> int:
+        return self.entries.get(source, {}).get('next_page', 1)
+
+    def record(self, source: str, **fields):
+        with self._lock:
+            entry = self.entries.setdefault(source, {'next_page': 1, 'items': 0})
+            entry.update(fields, updated=datetime.now(timezone.utc).isoformat())
+            self._save()
+
+    def _save(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'sources': self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class HistoricalBackfill:
+    """
+    Pages through the full history of every source in parallel (bounded queue of fetched pages)
+    while the calling thread scores, enriches and bulk-loads the pages in batches through a
+    StreamingPipeline. A source's next page is journaled only after its items are persisted.
+    """
+
+    def __init__(self, agent, since: datetime, journal: BackfillJournal = None, max_pages: int = 50,
+                 workers: int = 4, batch_size: int = 25, upload_workers: int = 8, checkpoint: StreamCheckpoint = None):
+        self.agent = agent
+        self.since = since
+        self.journal = journal or BackfillJournal()
+        self.max_pages = max_pages
+        self.workers = max(1, workers)
+        # Item-level checkpoint shared with --stream runs; one run ID per journal
+        run_id = f"backfill:{os.path.basename(self.journal.path)}"
+        self.pipeline = StreamingPipeline(agent, run_id, batch_size=batch_size, checkpoint=checkpoint,
+                                          upload_workers=upload_workers)
+        self._stop = threading.Event()
+
+    def _put(self, pages: queue.Queue, message) -> bool:
+        while not self._stop.is_set():
+            try:
+                pages.put(message, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _page_source(self, name: str, info: Dict[str, Any], pages: queue.Queue):
+        """Producer: fetches pages newest to oldest until the history ends or passes `since`."""
+        from .agent import parse_date
+        page = self.journal.next_page(name)
+        try:
+            while page <= self.max_pages and not self._stop.is_set():
+                with tracer.span('backfill.fetch_page', source=name, page=page) as span:
+                    raw = fetch_history_page(info['feed'], page)
+                    span.set(items=len(raw))
+                if not raw and page == 1:
+                    # Every source has at least one entry; an empty first page is a fetch or parse failure
+                    raise ValueError('no entries on the first page')
+                dated = [(parse_date(item.get('date', '')), item) for item in raw]
+                items = []
+                for date, item in dated:
+                    if date >= self.since:
+                        item.update(source=name, category=info.get('category', 'general'), description=info['description'])
+                        items.append(item)
+                last = not raw or page == self.max_pages or min(d for d, _ in dated) < self.since
+                if not self._put(pages, ('page', name, page, items, last)) or last:
+                    break
+                page += 1
+        except Exception as e:
+            self._put(pages, ('error', name, page, f'{type(e).__name__}: {e}'[:200], True))
+            return
+        self._put(pages, ('end', name, page, None, True))
+
+    def run(self, sources: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        pending = {name: info for name, info in sources.items() if self.journal.status(name) != 'completed'}
+        report = {'sources': len(sources), 'skipped_sources': len(sources) - len(pending), 'pages': 0, 'failed': []}
+        if not pending:
+            return dict(report, **self.pipeline.finish())
+        pages: queue.Queue = queue.Queue(maxsize=self.workers * 2)
+        self.pipeline.begin()
+        open_sources = len(pending)
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(pending))) as pool:
+                for name, info in pending.items():
+                    pool.submit(tracer.bind(self._page_source), name, info, pages)
+                try:
+                    while open_sources:
+                        kind, name, page, payload, last = pages.get()
+                        if kind == 'page':
+                            for batch in batched(payload, self.pipeline.batch_size):
+                                self.pipeline.process(batch)
+                            report['pages'] += 1
+                            items = self.journal.entries.get(name, {}).get('items', 0) + len(payload)
+                            self.journal.record(name, status='completed' if last else 'running', next_page=page + 1, items=items)
+                            console.print(f'[dim]📚 {name}: page {page} ({len(payload)} updates in range)[/dim]')
+                        elif kind == 'error':
+                            self.journal.record(name, status='failed', next_page=page, error=payload)
+                            report['failed'].append(name)
+                            console.print(f'[yellow]Warning: Backfill of {name} stopped at page {page}: {payload}[/yellow]')
+                        # Each producer ends with exactly one 'end' or 'error' message
+                        if kind != 'page':
+                            open_sources -= 1
+                finally:
+                    self._stop.set()
+        finally:
+            summary = self.pipeline.finish()
+        return dict(report, **summary)
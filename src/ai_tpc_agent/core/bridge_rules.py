@@ -0,0 +1,100 @@
+import os
+import re
+import json
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(__file__), 'watchlist.json')
+FIELDS = ('title', 'source')
+
+
+class BridgeRule:
+    """One row of the field-bridge table: any term found in `fields` selects `bridge`."""
+
+    __slots__ = ('name', 'terms', 'fields', 'bridge', 'pattern')
+
+    def __init__(self, name: str, terms: Sequence[str], bridge: str, fields: Sequence[str] = FIELDS):
+        unknown = set(fields) - set(FIELDS)
+        if unknown or not fields:
+            raise ValueError(f"Bridge rule '{name}' has invalid fields {sorted(unknown) or list(fields)}; use {list(FIELDS)}")
+        if not terms:
+            raise ValueError(f"Bridge rule '{name}' has no terms")
+        self.name = name
+        self.terms = [t.lower() for t in terms]
+        self.fields = tuple(f for f in FIELDS if f in fields)
+        self.bridge = bridge
+        # Plain substring semantics (no word boundaries), one C-level scan per rule
+        self.pattern = re.compile('|'.join(re.escape(t) for t in self.terms))
+
+
+class BridgeRuleEngine:
+    """
+    Keyword talk tracks from a declarative, priority-ordered rule table (first match wins).
+    Rules are compiled once; matching is a lowercase substring search over the title, or
+    "title source" for rules on both fields, exactly like the original if/elif chain.
+    """
+
+    def __init__(self, rules: Sequence[BridgeRule], default: str):
+        self.rules = list(rules)
+        self.default = default
+        # Scope per rule: 0 = title, 1 = source, 2 = "title source"
+        self._scans = [(rule.pattern.search, FIELDS.index(rule.fields[0]) if len(rule.fields) == 1 else 2, rule)
+                       for rule in self.rules]
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'BridgeRuleEngine':
+        rules = [BridgeRule(r.get('name', f'rule-{i}'), r.get('terms', []), r['bridge'], r.get('fields', FIELDS))
+                 for i, r in enumerate(config.get('rules', []))]
+        return cls(rules, config['default'])
+
+    def match(self, item: Dict[str, Any]) -> Optional[BridgeRule]:
+        """Highest-priority rule matching the item, or None."""
+        title = (item.get('title') or '').lower()
+        source = (item.get('source') or '').lower()
+        texts = (title, source, f'{title} {source}')
+        for search, scope, rule in self._scans:
+            if search(texts[scope]):
+                return rule
+        return None
+
+    def classify(self, item: Dict[str, Any]) -> str:
+        rule = self.match(item)
+        return rule.bridge if rule else self.default
+
+    def classify_many(self, items: Sequence[Dict[str, Any]]) -> List[str]:
+        """Bridges for a batch of items, in order."""
+        match, default = self.match, self.default
+        return [rule.bridge if rule else default for rule in map(match, items)]
+
+
+def load_bridge_config(path: str = None) -> Dict[str, Any]:
+    """
+    Reads the rule table from `path`, TPC_BRIDGE_RULES, or the packaged watchlist. A file may be
+    a watchlist with a 'field_bridges' section or just {"default": ..., "rules": [...]}.
+    """
+    path = path or os.environ.get('TPC_BRIDGE_RULES') or DEFAULT_RULES_PATH
+    with open(path, 'r') as f:
+        data = json.load(f)
+    config = data.get('field_bridges', data)
+    if 'default' not in config or 'rules' not in config:
+        if path != DEFAULT_RULES_PATH:
+            return load_bridge_config(DEFAULT_RULES_PATH)
+        raise ValueError(f'No field_bridges rule table in {path}')
+    return config
+
+
+_engines: Dict[Tuple[str, float], BridgeRuleEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def bridge_engine(path: str = None) -> BridgeRuleEngine:
+    """Compiled engine for the rule file, rebuilt only when the file changes."""
+    path = path or os.environ.get('TPC_BRIDGE_RULES') or DEFAULT_RULES_PATH
+    key = (path, os.path.getmtime(path))
+    engine = _engines.get(key)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = _engines[key] = BridgeRuleEngine.from_config(load_bridge_config(path))
+    return engine
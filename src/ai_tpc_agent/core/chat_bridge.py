@@ -1,46 +1,164 @@
-from tenacity import retry, wait_exponential, stop_after_attempt
-import requests
+import time
 import json
-from typing import List, Dict, Any
+import hashlib
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Union
+from urllib.parse import urlparse, parse_qs
 from rich.console import Console
+from .rate_limiter import RateLimiter, parse_retry_after
+from .tracing import tracer, traced
 console = Console()
 
+# Google Chat rejects messages above ~32 KB; keep headroom for the envelope
+MAX_MESSAGE_BYTES = 28000
+ROADMAP_CARD = {'title': 'AI TPC AGENT: ROADMAP BRIDGE', 'subtitle': 'Actionable Field Intel', 'imageUrl': 'https://fonts.gstatic.com/s/i/short-term/release/googleg/bolt/default/24px.svg'}
+TRENDS_CARD = {'title': 'AI KNOWLEDGE & TRENDS', 'subtitle': 'Market Pulse'}
+
+
+def space_name(webhook_url: str) -> str:
+    """Short, secret-free label for a webhook (e.g. 'spaces/AAAA')."""
+    parts = urlparse(webhook_url).path.split('/')
+    if 'spaces' in parts and parts.index('spaces') + 1 < len(parts):
+        return f"spaces/{parts[parts.index('spaces') + 1]}"
+    return urlparse(webhook_url).netloc or webhook_url[:32]
+
+
+def space_labels(webhook_urls: List[str]) -> List[str]:
+    """space_name per webhook, suffixed '#2', '#3'... where two webhooks share a label."""
+    labels, seen = [], {}
+    for url in webhook_urls:
+        name = space_name(url)
+        seen[name] = seen.get(name, 0) + 1
+        labels.append(name if seen[name] == 1 else f'{name}#{seen[name]}')
+    return labels
+
+
 class GoogleChatBridge:
     """
     Bridge to send updates to Google Chat via Webhooks.
+    Full pulses are split into size-limited card messages that are posted as one
+    thread per space (a parent message plus threaded replies), fanned out to many
+    spaces concurrently with per-space rate limiting, retry and backoff.
     """
 
-    def __init__(self, webhook_url: str):
-        self.webhook_url = webhook_url
+    def __init__(self, webhook_url: Union[str, List[str]], max_message_bytes: int = MAX_MESSAGE_BYTES,
+                 max_sections_per_message: int = 20, rate_per_space: float = 1.0, max_workers: int = 8,
+                 max_attempts: int = 4, backoff_seconds: float = 1.0):
+        if isinstance(webhook_url, str):
+            webhook_url = webhook_url.split(',')
+        self.webhook_urls = list(dict.fromkeys(u.strip() for u in (webhook_url or []) if u and u.strip()))
+        self.webhook_url = self.webhook_urls[0] if self.webhook_urls else None
+        self.max_message_bytes = max_message_bytes
+        self.max_sections_per_message = max_sections_per_message
+        self.rate_per_space = rate_per_space
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3))
-    def post_report(self, knowledge: List[Dict[str, Any]]):
+    def build_messages(self, knowledge: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Formats and posts the report to Google Chat.
+        Splits the pulse into card messages, each under the byte and section limits.
+        The first message is the thread parent; the rest are replies.
         """
-        if not self.webhook_url:
+        roadmap_items = [k for k in knowledge if k['category'] == 'roadmap' or 'release' in k['source']]
+        trend_items = [k for k in knowledge if k['category'] != 'roadmap']
+        sections = []
+        for item in roadmap_items:
+            sections.append((ROADMAP_CARD, {'header': f"🗺️ {item['source'].upper()}: {item['title']}", 'widgets': [{'textParagraph': {'text': item.get('bridge', 'New tech detected.')}}, {'buttons': [{'textButton': {'text': 'OPEN DOCS', 'onClick': {'openLink': {'url': item.get('source_url', 'https://cloud.google.com/vertex-ai/docs/release-notes')}}}}]}]}))
+        for item in trend_items:
+            sections.append((TRENDS_CARD, {'header': f"💡 {item['title']}", 'widgets': [{'textParagraph': {'text': item.get('summary', '')[:200] + '...'}}, {'buttons': [{'textButton': {'text': 'READ MORE', 'onClick': {'openLink': {'url': item.get('source_url', '#')}}}}]}]}))
+
+        messages, cards, size, count = [], [], 0, 0
+        for header, section in sections:
+            section_size = len(json.dumps(section).encode('utf-8'))
+            if cards and (size + section_size > self.max_message_bytes or count >= self.max_sections_per_message):
+                messages.append({'cards': cards})
+                cards, size, count = [], 0, 0
+            if not cards or cards[-1]['header'] is not header:
+                cards.append({'header': header, 'sections': []})
+                size += len(json.dumps(header).encode('utf-8'))
+            cards[-1]['sections'].append(section)
+            size += section_size
+            count += 1
+        if cards:
+            messages.append({'cards': cards})
+        if len(messages) > 1:
+            messages[0] = dict(messages[0], text=f'📡 *AI TPC Pulse*: {len(knowledge)} updates in {len(messages)} parts (replies in thread).')
+        return messages
+
+    @traced('chat.post_report')
+    def post_report(self, knowledge: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Formats and posts the report to every configured Google Chat space.
+        Returns delivery status and latency per webhook, keyed by space label.
+        """
+        if not self.webhook_urls:
             console.print('[red]Error: Google Chat Webhook URL not configured.[/red]')
             return
         if not knowledge:
             return
-        cards = []
-        roadmap_items = [k for k in knowledge if k['category'] == 'roadmap' or 'release' in k['source']]
-        if roadmap_items:
-            sections = []
-            for item in roadmap_items[:3]:
-                sections.append({'header': f"🗺️ {item['source'].upper()}: {item['title']}", 'widgets': [{'textParagraph': {'text': item.get('bridge', 'New tech detected.')}}, {'buttons': [{'textButton': {'text': 'OPEN DOCS', 'onClick': {'openLink': {'url': item.get('source_url', 'https://cloud.google.com/vertex-ai/docs/release-notes')}}}}]}]})
-            cards.append({'header': {'title': 'AI TPC AGENT: ROADMAP BRIDGE', 'subtitle': 'Actionable Field Intel', 'imageUrl': 'https://fonts.gstatic.com/s/i/short-term/release/googleg/bolt/default/24px.svg'}, 'sections': sections})
-        trend_items = [k for k in knowledge if k['category'] != 'roadmap']
-        if trend_items:
-            trend_sections = []
-            for item in trend_items[:3]:
-                trend_sections.append({'header': f"💡 {item['title']}", 'widgets': [{'textParagraph': {'text': item.get('summary', '')[:200] + '...'}}, {'buttons': [{'textButton': {'text': 'READ MORE', 'onClick': {'openLink': {'url': item.get('source_url', '#')}}}}]}]})
-            cards.append({'header': {'title': 'AI KNOWLEDGE & TRENDS', 'subtitle': 'Market Pulse'}, 'sections': trend_sections})
-        message = {'cards': cards}
-        try:
-            response = requests.post(self.webhook_url, json=message, timeout=10)
-            response.raise_for_status()
-            console.print('[green]Successfully posted report to Google Chat.[/green]')
-        except Exception as e:
-            console.print(f'[red]Failed to post to Google Chat: {e}[/red]')
-            raise e
\ No newline at end of file
+        messages = self.build_messages(knowledge)
+        digest = hashlib.sha1(json.dumps(messages, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        thread_key = f"tpc-pulse-{datetime.now(timezone.utc).strftime('%Y%m%d')}-{digest}"
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(self.webhook_urls)))) as pool:
+            results = dict(zip(
+                space_labels(self.webhook_urls),
+                pool.map(tracer.bind(lambda url: self._deliver_space(url, messages, thread_key)), self.webhook_urls)
+            ))
+
+        delivered = [s for s, r in results.items() if r['status'] == 'delivered']
+        for space, r in results.items():
+            color = 'green' if r['status'] == 'delivered' else 'red'
+            console.print(f"[{color}]{space}: {r['status']} {r['messages_sent']}/{len(messages)} messages in {r['latency_seconds']:.2f}s ({r['attempts']} attempts)[/{color}]")
+        if delivered:
+            console.print(f'[green]Successfully posted report to {len(delivered)}/{len(results)} Google Chat spaces.[/green]')
+        else:
+            raise RuntimeError(f'Failed to post to all {len(results)} Google Chat spaces.')
+        return results
+
+    def _deliver_space(self, webhook_url: str, messages: List[Dict[str, Any]], thread_key: str) -> Dict[str, Any]:
+        """Posts the parent message and threaded replies to one space, in order."""
+        with tracer.span('chat.deliver_space', space=space_name(webhook_url)) as span:
+            result = self._post_thread(webhook_url, messages, thread_key)
+            span.set(status=result['status'], messages=result['messages_sent'])
+            span.add('retries', result['attempts'] - result['messages_sent'] - (result['status'] == 'failed'))
+            return result
+
+    def _post_thread(self, webhook_url: str, messages: List[Dict[str, Any]], thread_key: str) -> Dict[str, Any]:
+        limiter = RateLimiter(self.rate_per_space)
+        start = time.monotonic()
+        result = {'status': 'delivered', 'messages_sent': 0, 'attempts': 0, 'error': None}
+        url = self._threaded_url(webhook_url)
+        for message in messages:
+            payload = dict(message, thread={'threadKey': thread_key})
+            for attempt in range(1, self.max_attempts + 1):
+                limiter.acquire()
+                result['attempts'] += 1
+                try:
+                    response = requests.post(url, json=payload, timeout=10)
+                    if response.status_code == 429 or response.status_code >= 500:
+                        raise requests.HTTPError(f'{response.status_code} from Google Chat', response=response)
+                    response.raise_for_status()
+                    result['messages_sent'] += 1
+                    break
+                except requests.RequestException as e:
+                    retryable = e.response is None or e.response.status_code == 429 or e.response.status_code >= 500
+                    if not retryable or attempt == self.max_attempts:
+                        result.update(status='failed', error=str(e))
+                        break
+                    retry_after = parse_retry_after(e.response.headers.get('Retry-After')) if e.response is not None else None
+                    time.sleep(retry_after if retry_after is not None else self.backoff_seconds * (2 ** (attempt - 1)))
+            if result['status'] == 'failed':
+                break
+        result['latency_seconds'] = time.monotonic() - start
+        return result
+
+    @staticmethod
+    def _threaded_url(webhook_url: str) -> str:
+        if 'messageReplyOption' in parse_qs(urlparse(webhook_url).query):
+            return webhook_url
+        separator = '&' if '?' in webhook_url else '?'
+        return f'{webhook_url}{separator}messageReplyOption=REPLY_MESSAGE_FALLBACK_TO_NEW_THREAD'
@@ -0,0 +1,144 @@
+import time
+import threading
+from typing import Any, Dict, Optional
+from .ledger import usage_tokens
+from .model_router import ModelRouter
+from .tracing import tracer
+
+# Smallest prefix Gemini accepts as explicit cached content, by model
+MIN_CACHE_TOKENS = {'gemini-2.5-pro': 4096}
+DEFAULT_MIN_CACHE_TOKENS = 1024
+
+
+class ContextCacheManager:
+    """
+    Registers a shared system-instruction prefix as Gemini cached content once per run and
+    references it from every call, so the prefix is billed at the cached-token rate instead
+    of being resent in full. The cache is refreshed before its TTL lapses; if caching is not
+    available (API error, prefix below the model's minimum cacheable size, fake client) the
+    prefix is prepended to the prompt exactly as before.
+    """
+
+    def __init__(self, client, model: str, system_instruction: str, ttl_seconds: int = 3600,
+                 refresh_margin_seconds: int = 300, display_name: str = 'tpc-system-prompt'):
+        self.client = client
+        self.model = model
+        self.system_instruction = system_instruction
+        self.ttl_seconds = int(ttl_seconds)
+        self.refresh_margin_seconds = min(refresh_margin_seconds, self.ttl_seconds // 2)
+        self.display_name = display_name
+        self._lock = threading.Lock()
+        self._name: Optional[str] = None
+        self._expires_at = 0.0
+        self.min_tokens = MIN_CACHE_TOKENS.get(model, DEFAULT_MIN_CACHE_TOKENS)
+        self._prefix_tokens: Optional[int] = None
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.disabled_reason: Optional[str] = None
+        self.created = 0
+        self.refreshes = 0
+        self.hits = 0
+        self.fallbacks = 0
+        self.tokens_saved = 0
+
+    def start_run(self):
+        """Drops any cache left over from a previous run and re-arms a disabled manager."""
+        self.release()
+        self.reset_stats()
+
+    def ensure(self) -> Optional[str]:
+        """Name of a live cache for the prefix, creating or refreshing it as needed; None when unavailable."""
+        with self._lock:
+            if self.disabled_reason:
+                return None
+            now = time.monotonic()
+            if self._name and now < self._expires_at - self.refresh_margin_seconds:
+                return self._name
+            if self._name:
+                try:
+                    with tracer.span('context_cache.refresh'):
+                        self.client.caches.update(name=self._name, config={'ttl': f'{self.ttl_seconds}s'})
+                    self._expires_at = now + self.ttl_seconds
+                    self.refreshes += 1
+                    return self._name
+                except Exception:
+                    # Expired or deleted server-side: register a fresh one
+                    self._name = None
+            tokens = self._count_prefix_tokens()
+            if tokens is not None and tokens < self.min_tokens:
+                # caches.create would reject it: skip the round trip and inline the prefix
+                self.disabled_reason = f'prefix is {tokens} tokens, below the {self.min_tokens}-token cache minimum for {self.model}'
+                return None
+            try:
+                with tracer.span('context_cache.create'):
+                    cache = self.client.caches.create(model=self.model, config={
+                        'system_instruction': self.system_instruction,
+                        'display_name': self.display_name,
+                        'ttl': f'{self.ttl_seconds}s',
+                    })
+                name = getattr(cache, 'name', None)
+                if not isinstance(name, str) or not name:
+                    raise ValueError('cache creation returned no name')
+            except Exception as e:
+                self.disabled_reason = f'{type(e).__name__}: {e}'[:200]
+                return None
+            self._name = name
+            self._expires_at = now + self.ttl_seconds
+            self.created += 1
+            return name
+
+    def _count_prefix_tokens(self) -> Optional[int]:
+        """Token count of the prefix, counted once per manager; None when it cannot be counted."""
+        if self._prefix_tokens is None:
+            try:
+                with tracer.span('context_cache.count_tokens'):
+                    total = self.client.models.count_tokens(model=self.model, contents=self.system_instruction).total_tokens
+            except Exception:
+                return None
+            if not isinstance(total, int):
+                return None
+            self._prefix_tokens = total
+        return self._prefix_tokens
+
+    def generate(self, router: ModelRouter, site: str, contents: str):
+        """Generates with the cached prefix, or with the prefix inlined when caching is unavailable."""
+        name = self.ensure()
+        if name:
+            try:
+                response = router.generate(self.client, site, contents, model=self.model, config={'cached_content': name})
+            except Exception:
+                # The cache may have been evicted mid-run; recreate it on the next call
+                with self._lock:
+                    if self._name == name:
+                        self._name = None
+            else:
+                with self._lock:
+                    self.hits += 1
+                    self.tokens_saved += usage_tokens(response)['cached_tokens']
+                return response
+        with self._lock:
+            self.fallbacks += 1
+        return router.generate(self.client, site, f'{self.system_instruction}\n{contents}', model=self.model)
+
+    def release(self):
+        """Deletes the cached content so it stops accruing storage cost."""
+        with self._lock:
+            name, self._name = self._name, None
+        if name:
+            try:
+                self.client.caches.delete(name=name)
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'model': self.model,
+            'active': self.disabled_reason is None and self.created > 0,
+            'created': self.created,
+            'refreshes': self.refreshes,
+            'cached_calls': self.hits,
+            'uncached_calls': self.fallbacks,
+            'tokens_saved': self.tokens_saved,
+            'disabled_reason': self.disabled_reason,
+        }
@@ -0,0 +1,144 @@
+import os
+import json
+import hashlib
+import threading
+from datetime import timezone
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from .state import state_path
+from .tracing import tracer
+from .archive import pulse_key
+from .ledger import TokenLedger
+from .model_router import ModelRouter
+
+DIGEST_MODEL = 'gemini-2.5-flash'
+
+PARTIAL_PROMPT = """
+<system_instructions>
+You are a Technical Program Consultant condensing one day of updates from a single source.
+</system_instructions>
+
+<context>
+Source: {source}
+Day: {day}
+Updates:
+{updates}
+</context>
+
+<task>
+Summarize these updates in 2-4 terse bullet points for a later cross-ecosystem gap analysis.
+Keep product, model and feature names exactly as written. No preamble.
+</task>
+"""
+
+# Partials are only reused while the prompt and model that produced them are unchanged
+PARTIAL_VERSION = hashlib.sha256(f'{DIGEST_MODEL}\n{PARTIAL_PROMPT}'.encode('utf-8')).hexdigest()[:12]
+
+
+def _day(item: Dict[str, Any]) -> str:
+    from .agent import parse_date
+    return parse_date(item.get('date', '')).astimezone(timezone.utc).date().isoformat()
+
+
+def group_by_day_and_source(items: List[Dict[str, Any]]) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+    groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for item in items:
+        groups.setdefault((_day(item), item.get('source', 'unknown')), []).append(item)
+    return dict(sorted(groups.items()))
+
+
+def partial_key(day: str, source: str, items: List[Dict[str, Any]]) -> str:
+    """Content key of one (day, source) group: same items under the same prompt reuse the partial."""
+    payload = '\n'.join([PARTIAL_VERSION, day, source] + sorted(pulse_key(i) for i in items))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+class PartialSummaryCache:
+    """On-disk cache of per-day, per-source partial summaries, shared by every look-back window."""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or state_path('digests')
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, partial: Dict[str, Any]):
+        tmp = self._path(key) + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(partial, f)
+        os.replace(tmp, self._path(key))
+
+
+class HierarchicalDigest:
+    """
+    Map-reduce condensation of a large look-back window. Items are grouped per day and source,
+    each group is summarized in parallel by a fast model (cached on disk, so a 90-day window
+    reuses the daily partials a 30-day run already paid for), and the partials are rendered
+    as one compact context for the battlecard and executive synthesis prompts.
+    """
+
+    def __init__(self, client, ledger: TokenLedger, cache: PartialSummaryCache = None, max_workers: int = 4,
+                 max_context_chars: int = 60000, router: ModelRouter = None):
+        self.client = client
+        self.ledger = ledger
+        self.router = router or ModelRouter(ledger)
+        self.cache = cache or PartialSummaryCache()
+        self.max_workers = max_workers
+        self.max_context_chars = max_context_chars
+        self.stats = {'groups': 0, 'cached': 0, 'summarized': 0, 'fallback': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, outcome: str):
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def _summarize_group(self, day: str, source: str, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        key = partial_key(day, source, items)
+        cached = self.cache.get(key)
+        if cached:
+            self._count('cached')
+            return cached
+        titles = [i.get('title', '') for i in items]
+        if self.client and not self.ledger.exhausted():
+            updates = '\n'.join(f"- {i.get('title', '')}: {(i.get('summary') or '')[:200]}" for i in items)
+            try:
+                with tracer.span('digest.map', source=source, items=len(items)):
+                    resp = self.router.generate(self.client, 'digest_partial',
+                                                PARTIAL_PROMPT.format(source=source, day=day, updates=updates),
+                                                model=DIGEST_MODEL)
+                partial = {'day': day, 'source': source, 'count': len(items), 'summary': resp.text.strip()}
+                self.cache.put(key, partial)
+                self._count('summarized')
+                return partial
+            except Exception:
+                pass
+        # No model, budget spent or call failed: keep the titles (not cached, retried next run)
+        self._count('fallback')
+        return {'day': day, 'source': source, 'count': len(items), 'summary': '\n'.join(f'- {t}' for t in titles)}
+
+    def partials(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        groups = group_by_day_and_source(items)
+        self.stats['groups'] = len(groups)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(groups) or 1))) as pool:
+            return list(pool.map(tracer.bind(lambda g: self._summarize_group(g[0][0], g[0][1], g[1])), groups.items()))
+
+    def context(self, items: List[Dict[str, Any]]) -> str:
+        """Day-by-day digest of the window, newest first, trimmed to max_context_chars."""
+        with tracer.span('digest.reduce', items=len(items)):
+            blocks, used = [], 0
+            for p in sorted(self.partials(items), key=lambda p: (p['day'], p['source']), reverse=True):
+                block = f"[{p['day']}] {p['source']} ({p['count']} updates)\n{p['summary']}"
+                if used + len(block) > self.max_context_chars:
+                    blocks.append(f'... {len(items)} updates in total; older days omitted for length.')
+                    break
+                blocks.append(block)
+                used += len(block)
+            return '\n\n'.join(blocks)
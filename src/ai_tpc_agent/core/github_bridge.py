@@ -1,43 +1,234 @@
 from typing import Literal
 from tenacity import retry, wait_exponential, stop_after_attempt
 import os
+import json
+import time
 import requests
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
 from rich.console import Console
+from .rate_limiter import RateLimiter, parse_retry_after
+from .state import state_path
+from .tracing import tracer, traced
 console = Console()
 
+# GitHub rejects issue/comment bodies above 65,536 characters; keep headroom for part markers
+GITHUB_BODY_LIMIT = 65536
+CHUNK_LIMIT = 60000
+ROLLING_LABELS = ['pulse', 'automated', 'rolling']
+
+
+def split_markdown(body: str, limit: int = CHUNK_LIMIT) -> List[str]:
+    """
+    Splits a markdown body into chunks of at most `limit` characters.
+    Chunks break before headings where possible so items are not cut in half,
+    then on line boundaries, and only split mid-line as a last resort.
+    """
+    if len(body) <= limit:
+        return [body]
+    blocks, block = [], []
+    for line in body.splitlines(keepends=True):
+        if line.startswith('#') and block:
+            blocks.append(''.join(block))
+            block = []
+        block.append(line)
+    if block:
+        blocks.append(''.join(block))
+
+    pieces = []
+    for block in blocks:
+        if len(block) <= limit:
+            pieces.append(block)
+            continue
+        for line in block.splitlines(keepends=True):
+            pieces.extend(line[i:i + limit] for i in range(0, len(line), limit))
+
+    chunks, current = [], ''
+    for piece in pieces:
+        if current and len(current) + len(piece) > limit:
+            chunks.append(current)
+            current = ''
+        current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 class GitHubBridge:
     """
     Bridge to post AI TPC reports as GitHub Issues.
     This provides an automated notification channel without requiring email credentials.
+
+    Modes:
+    - issue: a new issue per run (default).
+    - rolling: one long-lived pulse issue; each run is appended as comments.
+    - daily: one issue per UTC day; runs on the same day are appended as comments.
     """
 
-    def __init__(self, repo: str=None, token: str=None):
+    def __init__(self, repo: str=None, token: str=None, mode: Literal['issue', 'rolling', 'daily']='issue',
+                 api_base: str=None, etag_path: str=None, min_write_interval: float=1.0,
+                 rate_limit_floor: int=10, max_rate_wait: float=120.0, max_attempts: int=3):
         self.repo = repo or os.environ.get('GITHUB_REPOSITORY')
         self.token = token or os.environ.get('GITHUB_TOKEN')
-        self.api_url = f'https://api.github.com/repos/{self.repo}/issues'
+        self.mode = mode
+        self.api_base = (api_base or os.environ.get('GITHUB_API_URL') or 'https://api.github.com').rstrip('/')
+        self.api_url = f'{self.api_base}/repos/{self.repo}/issues'
+        self.session = requests.Session()
+        self.session.headers.update({'Authorization': f'token {self.token}', 'Accept': 'application/vnd.github.v3+json'})
+        # GitHub asks integrations to space out content-creating requests to avoid secondary limits
+        self.write_limiter = RateLimiter(1.0 / min_write_interval if min_write_interval > 0 else 0)
+        self.rate_limit_floor = rate_limit_floor
+        self.max_rate_wait = max_rate_wait
+        self.max_attempts = max_attempts
+        self.rate_limit_remaining: Optional[int] = None
+        self.rate_limit_reset: Optional[float] = None
+        self.etag_path = etag_path
+        self._etags: Optional[Dict[str, Dict[str, Any]]] = None
 
-    @retry(wait=wait_exponential(min=1, max=10), stop=stop_after_attempt(3))
+    @traced('github.post_report')
     def post_report(self, knowledge: List[Dict[str, Any]], tldr: str=None, date_range: str=None, gaps: str=None):
         """
-        Posts the synthesized report as a new GitHub Issue.
+        Posts the synthesized report as a new GitHub Issue, or appends it to the
+        rolling/daily pulse issue. Oversized reports are split across comments.
         """
         if not self.repo or not self.token:
             console.print('[yellow]Skipping GitHub Issue: GITHUB_TOKEN or GITHUB_REPOSITORY not set.[/yellow]')
             return
         if not knowledge:
             return
-        date_suffix = f' ({date_range})' if date_range else ''
-        title = f'🚀 AI TPC Pulse: {len(knowledge)} New Updates{date_suffix}'
         body = self._format_markdown_report(knowledge, tldr, date_range, gaps)
+        chunks = split_markdown(body)
+        if len(chunks) > 1:
+            chunks = [f'{c}\n\n*(part {i + 1}/{len(chunks)})*' for i, c in enumerate(chunks)]
         try:
-            response = requests.post(self.api_url, headers={'Authorization': f'token {self.token}', 'Accept': 'application/vnd.github.v3+json'}, json={'title': title, 'body': body, 'labels': ['pulse', 'automated']}, timeout=15)
-            response.raise_for_status()
-            console.print(f"[green]Successfully posted report to GitHub Issues: {response.json().get('html_url')}[/green]")
+            if self.mode == 'issue':
+                date_suffix = f' ({date_range})' if date_range else ''
+                title = f'🚀 AI TPC Pulse: {len(knowledge)} New Updates{date_suffix}'
+                issue = self._create_issue(title, chunks[0], ['pulse', 'automated'])
+                remaining = chunks[1:]
+            else:
+                title = self._rolling_title()
+                issue = self._find_open_issue(title)
+                if issue is None:
+                    intro = f'# {title}\n\nEach pulse run is appended below as a comment.'
+                    issue = self._create_issue(title, intro, ROLLING_LABELS)
+                remaining = chunks
+            for chunk in remaining:
+                self._request('POST', f"{self.api_url}/{issue['number']}/comments", json={'body': chunk})
+            console.print(f"[green]Successfully posted report to GitHub Issues: {issue.get('html_url')} "
+                          f"({len(remaining)} comment(s), rate limit remaining: {self.rate_limit_remaining})[/green]")
+            return issue
         except Exception as e:
             console.print(f'[red]Failed to post to GitHub: {e}[/red]')
-            raise e # Re-raise for retry
+            raise e
+
+    def _rolling_title(self) -> str:
+        if self.mode == 'daily':
+            return f"🚀 AI TPC Daily Pulse: {datetime.now(timezone.utc).strftime('%Y-%m-%d')}"
+        return '🚀 AI TPC Pulse: Rolling Feed'
+
+    def _create_issue(self, title: str, body: str, labels: List[str]) -> Dict[str, Any]:
+        response = self._request('POST', self.api_url, json={'title': title, 'body': body, 'labels': labels})
+        return response.json()
+
+    def _find_open_issue(self, title: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up the open rolling/daily issue with a conditional request: an unchanged
+        listing returns 304, which GitHub does not count against the rate limit.
+        """
+        params = {'state': 'open', 'labels': ','.join(ROLLING_LABELS), 'per_page': 100}
+        etags = self._load_etags()
+        cached = etags.get(self.api_url)
+        headers = {'If-None-Match': cached['etag']} if cached else {}
+        response = self._request('GET', self.api_url, params=params, headers=headers)
+        if response.status_code == 304:
+            issues = cached['issues']
+        else:
+            issues = [{'number': i['number'], 'title': i['title'], 'html_url': i.get('html_url')} for i in response.json()]
+            if response.headers.get('ETag'):
+                etags[self.api_url] = {'etag': response.headers['ETag'], 'issues': issues}
+                self._save_etags()
+        return next((i for i in issues if i['title'] == title), None)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends one API request, pacing writes and honouring primary and secondary rate limits.
+        """
+        with tracer.span('github.request', method=method) as span:
+            return self._send(method, url, span, **kwargs)
+
+    def _send(self, method: str, url: str, span, **kwargs) -> requests.Response:
+        for attempt in range(1, self.max_attempts + 1):
+            span.set(attempts=attempt)
+            if attempt > 1:
+                span.add('retries')
+            self._wait_for_rate_limit()
+            if method != 'GET':
+                self.write_limiter.acquire()
+            response = self.session.request(method, url, timeout=15, **kwargs)
+            span.add('bytes', len(response.content or b''))
+            self._track_rate_limit(response)
+            if response.status_code in (403, 429) and attempt < self.max_attempts and self._is_rate_limited(response):
+                self._sleep(self._retry_after(response))
+                continue
+            if response.status_code >= 500 and attempt < self.max_attempts:
+                self._sleep(2 ** attempt)
+                continue
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        return response
+
+    def _track_rate_limit(self, response: requests.Response):
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None:
+            self.rate_limit_remaining = int(remaining)
+        if reset is not None:
+            self.rate_limit_reset = float(reset)
+
+    def _is_rate_limited(self, response: requests.Response) -> bool:
+        return ('Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0'
+                or 'rate limit' in response.text.lower())
+
+    def _retry_after(self, response: requests.Response) -> float:
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is not None:
+            return retry_after
+        if response.headers.get('X-RateLimit-Remaining') == '0' and self.rate_limit_reset:
+            return max(0.0, self.rate_limit_reset - time.time())
+        # Secondary limit without hints: GitHub recommends waiting at least a minute
+        return 60.0
+
+    def _wait_for_rate_limit(self):
+        if self.rate_limit_remaining is None or self.rate_limit_remaining > self.rate_limit_floor:
+            return
+        wait = max(0.0, (self.rate_limit_reset or time.time()) - time.time())
+        if wait > self.max_rate_wait:
+            raise RuntimeError(f'GitHub rate limit nearly exhausted ({self.rate_limit_remaining} left); resets in {wait:.0f}s.')
+        self._sleep(wait)
+
+    def _sleep(self, seconds: float):
+        if seconds > self.max_rate_wait:
+            raise RuntimeError(f'GitHub asked to wait {seconds:.0f}s, longer than the {self.max_rate_wait:.0f}s budget.')
+        console.print(f'[yellow]GitHub rate limiting: waiting {seconds:.0f}s...[/yellow]')
+        time.sleep(seconds)
+
+    def _load_etags(self) -> Dict[str, Dict[str, Any]]:
+        if self._etags is None:
+            self.etag_path = self.etag_path or state_path('github_etags.json')
+            self._etags = {}
+            if os.path.exists(self.etag_path):
+                try:
+                    with open(self.etag_path, 'r') as f:
+                        self._etags = json.load(f)
+                except (OSError, ValueError):
+                    pass
+        return self._etags
+
+    def _save_etags(self):
+        with open(self.etag_path, 'w') as f:
+            json.dump(self._etags, f)
 
     def _format_markdown_report(self, knowledge: List[Dict[str, Any]], tldr: str=None, date_range: str=None, gaps: str=None) -> str:
         report = '# 🚀 AI TPC Field Pulse\n'
@@ -0,0 +1,347 @@
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+
+_PLACEHOLDER = re.compile(r'\$\{(\w+)\}')
+_BOLD = re.compile(r'\*\*(.*?)\*\*')
+
+
+class CompiledTemplate:
+    """
+    A template split once into static chunks and ${field} slots.
+    Rendering is a single join, so output cost is linear in its size.
+    """
+
+    def __init__(self, source: str):
+        parts = _PLACEHOLDER.split(source)
+        self._static = parts[0::2]
+        self._fields = parts[1::2]
+
+    def render(self, **values) -> str:
+        out = [self._static[0]]
+        for field, static in zip(self._fields, self._static[1:]):
+            out.append(str(values[field]))
+            out.append(static)
+        return ''.join(out)
+
+
+# Designer Color Palette
+COLOR_MAP = {
+    'Gemini': '#6366f1',   # Indigo 500
+    'Vertex': '#0ea5e9',   # Sky 500
+    'Security': '#f43f5e', # Rose 500
+    'Agent': '#10b981',    # Emerald 500
+    'Infrastructure': '#64748b', # Slate 500
+    'Search': '#f59e0b',   # Amber 500
+    'Openai': '#10a37f',   # OpenAI Green
+    'Anthropic': '#cc785c' # Anthropic Tan/Orange
+}
+DEFAULT_CARD_COLOR = '#3b82f6' # Blue 500
+
+BULLET_LINE = CompiledTemplate('<div style="margin-bottom: 8px; padding-left: 20px; position: relative;"><span style="position: absolute; left: 0; color: #6366f1;">•</span>${text}</div>')
+TEXT_LINE = CompiledTemplate('<div style="margin-bottom: 8px;">${text}</div>')
+
+RADAR_LINK = CompiledTemplate('''
+                <div style="margin-bottom: 10px;">
+                    <a href="#${item_id}" style="text-decoration: none; color: #334155; display: flex; align-items: center; font-size: 0.9rem;">
+                        <span style="color: ${score_color}; font-weight: 800; font-family: monospace; margin-right: 12px; font-size: 0.8rem;">[${impact_score}]</span>
+                        <span style="flex-grow: 1; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; font-weight: 600;">${title}</span>
+                        <span style="color: #6366f1; font-weight: 800; margin-left: 8px;">&rarr;</span>
+                    </a>
+                </div>
+                ''')
+
+RADAR = CompiledTemplate('''
+            <div style="background-color: #f8fafc; border: 1px solid #e2e8f0; border-radius: 12px; padding: 24px; margin-bottom: 32px;">
+                <h2 style="margin: 0 0 16px 0; color: #1e293b; font-size: 0.85rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.1em; border-bottom: 2px solid #e2e8f0; padding-bottom: 8px;">🛰️ Pulse Radar: High-Signal Updates</h2>
+                ${radar_links}
+            </div>
+            ''')
+
+SOURCE_HEADER = CompiledTemplate('''
+            <div style="margin-top: 48px; margin-bottom: 24px; border-left: 4px solid ${card_color}; padding-left: 16px;">
+                <h2 style="color: ${card_color}; font-size: 1rem; text-transform: uppercase; font-weight: 800; letter-spacing: 0.1em; margin: 0;">
+                    ${source}
+                </h2>
+            </div>
+            ''')
+
+TAG = CompiledTemplate('<span style="background-color: #f8fafc; color: #475569; padding: 2px 8px; border-radius: 9999px; font-size: 10px; margin-right: 4px; font-weight: 600; text-transform: uppercase; border: 1px solid #e2e8f0;">${tag}</span>')
+
+SCORE_BADGE = CompiledTemplate('<span style="margin-left: 8px; background-color: #f1f5f9; color: #475569; padding: 2px 6px; border-radius: 4px; font-size: 9px; font-family: monospace; font-weight: 700; border: 1px solid #e2e8f0;">INTEL SCORE: ${impact_score}</span>')
+
+ITEM_CARD = CompiledTemplate('''
+                <div id="${item_id}" style="margin-bottom: 32px; background-color: #ffffff; border-radius: 12px; border: 1px solid #e2e8f0; overflow: hidden; box-shadow: 0 4px 6px -1px rgba(0,0,0,0.05);">
+                    <div style="padding: 24px;">
+                        <div style="margin-bottom: 12px; display: flex; align-items: center; justify-content: space-between;">
+                             <div style="display: flex; align-items: center;">
+                                <span style="font-size: 10px; font-weight: 800; text-transform: uppercase; letter-spacing: 0.05em; color: ${p_fg}; background-color: ${p_bg}; padding: 2px 8px; border-radius: 4px;">${p_label}</span>
+                                ${score_badge}
+                             </div>
+                             <div style="display: flex;">${tags_html}</div>
+                        </div>
+                        <h3 style="margin: 0 0 16px 0; color: #0f172a; font-size: 1.15rem; font-weight: 700; line-height: 1.3;">${title}</h3>
+
+                        <div style="background-color: #f8fafc; padding: 18px; border-radius: 8px; margin-bottom: 24px; border-left: 4px solid ${card_color}; shadow: inset 0 2px 4px 0 rgba(0,0,0,0.02);">
+                             <p style="margin: 0; color: #1e293b; font-size: 0.95rem; font-weight: 600; line-height: 1.6;">${bridge}</p>
+                        </div>
+
+                        <div style="color: #475569; font-size: 0.9rem; line-height: 1.7; margin-bottom: 24px;">
+                            ${summary_html}
+                        </div>
+
+                        <div style="display: flex; align-items: center; justify-content: space-between; padding-top: 16px; border-top: 1px solid #f1f5f9;">
+                            <a href="${source_url}" style="font-size: 0.8rem; font-weight: 800; color: ${card_color}; text-decoration: none; text-transform: uppercase; letter-spacing: 0.05em; display: flex; align-items: center;">
+                                Engineering Docs
+                                <span style="margin-left: 6px; font-size: 1.1rem;">&rarr;</span>
+                            </a>
+                            <span style="font-size: 11px; color: #94a3b8; font-weight: 600;">PUBLISHED: ${published}</span>
+                        </div>
+                    </div>
+                </div>
+                ''')
+
+INFOGRAPHIC = CompiledTemplate('''
+        <div style="margin-bottom: 40px; border-radius: 12px; overflow: hidden; border: 1px solid #e2e8f0; background-color: #f8fafc; box-shadow: 0 4px 6px -1px rgba(0,0,0,0.1);">
+            <div style="padding: 14px 24px; border-bottom: 1px solid #e2e8f0; background-color: #ffffff; display: flex; align-items: center; justify-content: space-between;">
+                <div style="display: flex; align-items: center;">
+                    <span style="font-size: 18px; margin-right: 10px;">📊</span>
+                    <span style="font-size: 0.75rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.1em; color: #475569;">Field Intelligence Visualization</span>
+                </div>
+                <span style="font-size: 10px; font-weight: 700; color: #94a3b8;">v2.5 Hybrid Engine</span>
+            </div>
+            <img src="cid:${infographic_cid}" alt="Strategic Synthesis" style="width: 100%; display: block; max-height: 600px; object-fit: contain;">
+        </div>
+        ''')
+
+TLDR = CompiledTemplate('''
+        <div style="background: linear-gradient(135deg, #fefce8 0%, #fef3c7 100%); border: 1px solid #fde68a; padding: 28px; border-radius: 12px; margin-bottom: 40px; box-shadow: 0 4px 6px -1px rgba(0,0,0,0.05);">
+            <div style="display: flex; align-items: center; margin-bottom: 16px;">
+                <div style="background-color: #fcd34d; width: 40px; height: 40px; border-radius: 10px; display: flex; align-items: center; justify-content: center; margin-right: 16px;">
+                    <span style="font-size: 20px;">🎯</span>
+                </div>
+                <h2 style="margin: 0; color: #92400e; font-size: 1.1rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.05em;">Executive Synthesis</h2>
+            </div>
+            <p style="margin: 0; color: #78350f; font-weight: 500; line-height: 1.7; font-size: 1.05rem; font-style: italic;">${tldr}</p>
+        </div>
+        ''')
+
+GAPS = CompiledTemplate('''
+        <div style="background: linear-gradient(135deg, #fdf2f2 0%, #fee2e2 100%); border: 1px solid #fecaca; padding: 28px; border-radius: 12px; margin-bottom: 40px; box-shadow: 0 4px 6px -1px rgba(0,0,0,0.05);">
+            <div style="display: flex; align-items: center; margin-bottom: 16px;">
+                <div style="background-color: #fca5a5; width: 40px; height: 40px; border-radius: 10px; display: flex; align-items: center; justify-content: center; margin-right: 16px;">
+                    <span style="font-size: 20px;">🛡️</span>
+                </div>
+                <h2 style="margin: 0; color: #991b1b; font-size: 1.1rem; font-weight: 800; text-transform: uppercase; letter-spacing: 0.05em;">Strategic Battlecard: Gaps & Advantages</h2>
+            </div>
+            <div style="margin: 0; color: #7f1d1d; font-weight: 600; line-height: 1.7; font-size: 0.95rem;">
+                ${gaps_html}
+            </div>
+        </div>
+        ''')
+
+DOCUMENT = CompiledTemplate("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>AI TPC Field Pulse</title>
+            <style>
+                @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@400;500;600;700;800&display=swap');
+                body { font-family: 'Outfit', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 0; background-color: #f1f5f9; color: #334155; }
+            </style>
+        </head>
+        <body>
+            <div style="max-width: 800px; margin: 0 auto; background-color: #f8fafc;">
+                <header style="background: linear-gradient(135deg, #1e1b4b 0%, #312e81 100%); padding: 48px 32px; text-align: left; border-radius: 0 0 24px 24px; box-shadow: 0 10px 15px -3px rgba(0,0,0,0.1);">
+                    <div style="display: flex; align-items: center; margin-bottom: 16px;">
+                        <span style="background-color: #6366f1; color: white; padding: 4px 12px; border-radius: 6px; font-weight: 800; font-size: 12px; letter-spacing: 0.1em;">FIELD PROMOTION</span>
+                        <span style="color: #94a3b8; font-size: 12px; font-weight: 600; margin-left: auto;">${date_range}</span>
+                    </div>
+                    <h1 style="color: #ffffff; font-size: 2.5rem; font-weight: 800; margin: 0; letter-spacing: -0.02em;">AI TPC Pulse</h1>
+                    <p style="color: #c7d2fe; font-size: 1.1rem; margin: 12px 0 0 0; font-weight: 500; opacity: 0.9;">Technical Roadmap Intel for Field Architects</p>
+                </header>
+
+                <main style="padding: 40px 24px;">
+                    ${tldr_sec}
+                    ${radar_html}
+                    ${infographic_sec}
+                    ${gaps_sec}
+
+                    <div style="font-size: 12px; font-weight: 800; text-transform: uppercase; letter-spacing: 0.2em; color: #94a3b8; margin-bottom: 24px; display: flex; align-items: center;">
+                        <span style="flex-grow: 1; height: 1px; background-color: #e2e8f0; margin-right: 16px;"></span>
+                        Technical Roadmap Deep-Dive
+                        <span style="flex-grow: 1; height: 1px; background-color: #e2e8f0; margin-left: 16px;"></span>
+                    </div>
+
+                    ${sections}
+                </main>
+
+                <footer style="background-color: #ffffff; padding: 40px 32px; border-top: 1px solid #e2e8f0; text-align: center;">
+                    <div style="margin-bottom: 24px;">
+                        <span style="font-size: 24px;">🚀</span>
+                    </div>
+                    <p style="margin: 0; color: #64748b; font-size: 0.9rem; font-weight: 600;">Synthesized by AI TPC Agent v0.1.2</p>
+                    <p style="margin: 4px 0 24px 0; color: #94a3b8; font-size: 0.8rem; font-weight: 500;">Powered by **Gemini 2.5 Pro & Flash** Hybrid Engine</p>
+
+                    <div style="background-color: #fff1f2; color: #e11d48; padding: 12px 24px; border-radius: 8px; display: inline-block; font-size: 11px; font-weight: 800; text-transform: uppercase; letter-spacing: 0.1em; border: 1px solid #fecaca;">
+                        Google Cloud Confidential • Internal Use Only
+                    </div>
+                </footer>
+            </div>
+        </body>
+        </html>
+        """)
+
+
+@lru_cache(maxsize=4096)
+def md_to_html(text: str) -> str:
+    """
+    Simple markdown to HTML converter for basic pulse elements.
+    Handles bolding (**text**) and bullets (- or *).
+    """
+    text = _BOLD.sub(r'<strong style="color: #0f172a;">\1</strong>', text)
+    lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if line.startswith('- ') or line.startswith('* '):
+            lines.append(BULLET_LINE.render(text=line[2:]))
+        elif line:
+            lines.append(TEXT_LINE.render(text=line))
+    return '\n'.join(lines)
+
+
+@lru_cache(maxsize=1024)
+def card_color_for(source: str) -> str:
+    source_lower = source.lower()
+    for key, val in COLOR_MAP.items():
+        if key.lower() in source_lower:
+            return val
+    return DEFAULT_CARD_COLOR
+
+
+def _priority(impact_score: int, tags: List[str]):
+    if impact_score >= 90:
+        return '#fff1f2', '#e11d48', 'Mission Critical'
+    if impact_score >= 70:
+        return '#fffbeb', '#d97706', 'High Impact'
+    if any(x in str(tags) for x in ['Security', 'Governance']):
+        return '#fff1f2', '#e11d48', 'Security Critical'
+    return '#f1f5f9', '#64748b', 'Standard'
+
+
+class HTMLReportRenderer:
+    """
+    Renders the premium HTML pulse from precompiled templates in linear time.
+    Per-item cards are cached by content hash, so the same item rendered for many
+    recipients or channels is built once.
+    """
+
+    def __init__(self, max_cached_fragments: int = 8192):
+        self.max_cached_fragments = max_cached_fragments
+        self._fragments: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.fragment_hits = 0
+        self.fragment_misses = 0
+
+    def render(self, knowledge: List[Dict[str, Any]], tldr: str = None, date_range: str = None,
+               infographic_cid: str = None, gaps: str = None) -> str:
+        # Group and rank by impact
+        grouped_knowledge: Dict[str, List[Dict[str, Any]]] = {}
+        for item in knowledge:
+            source = item.get('source', 'General Update').replace('-', ' ').title()
+            grouped_knowledge.setdefault(source, []).append(item)
+
+        # Sort sections by the highest impact score within them
+        sorted_sources = sorted(
+            grouped_knowledge.keys(),
+            key=lambda s: max(item.get('impact_score', 0) for item in grouped_knowledge[s]),
+            reverse=True
+        )
+
+        # Table of Contents / Radar Section: anchors are assigned locally, items are not mutated
+        anchors: Dict[int, str] = {}
+        radar_links = []
+        for s in sorted_sources:
+            for item in grouped_knowledge[s]:
+                if len(radar_links) == 6:
+                    break
+                impact_score = item.get('impact_score', 0)
+                if impact_score >= 70:
+                    item_id = f"pulse-{len(radar_links)}"
+                    anchors[id(item)] = item_id
+                    radar_links.append(RADAR_LINK.render(
+                        item_id=item_id,
+                        score_color='#e11d48' if impact_score >= 90 else '#d97706',
+                        impact_score=impact_score,
+                        title=item['title']
+                    ))
+        radar_html = RADAR.render(radar_links=''.join(radar_links)) if radar_links else ''
+
+        sections = []
+        for source in sorted_sources:
+            card_color = card_color_for(source)
+            sections.append(SOURCE_HEADER.render(card_color=card_color, source=source))
+            for item in grouped_knowledge[source]:
+                sections.append(self.render_item(item, card_color, anchors.get(id(item), '')))
+
+        return DOCUMENT.render(
+            date_range=date_range,
+            tldr_sec=TLDR.render(tldr=tldr) if tldr else '',
+            radar_html=radar_html,
+            infographic_sec=INFOGRAPHIC.render(infographic_cid=infographic_cid) if infographic_cid else '',
+            gaps_sec=GAPS.render(gaps_html=md_to_html(gaps)) if gaps else '',
+            sections=''.join(sections)
+        )
+
+    def render_item(self, item: Dict[str, Any], card_color: str, item_id: str = '') -> str:
+        """Renders (or reuses) the card fragment for one item."""
+        fields = {
+            'item_id': item_id,
+            'card_color': card_color,
+            'title': item['title'],
+            'bridge': item.get('bridge', 'Strategizing field alignment...'),
+            'summary': item.get('summary', 'Technical analysis in progress.'),
+            'tags': item.get('tags', []),
+            'impact_score': item.get('impact_score', 0),
+            'source_url': item.get('source_url', '#'),
+            'published': item.get('date', '')[:10],
+        }
+        key = hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        with self._lock:
+            cached = self._fragments.get(key)
+            if cached is not None:
+                self._fragments.move_to_end(key)
+                self.fragment_hits += 1
+                return cached
+            self.fragment_misses += 1
+
+        p_bg, p_fg, p_label = _priority(fields['impact_score'], fields['tags'])
+        fragment = ITEM_CARD.render(
+            item_id=item_id,
+            p_fg=p_fg,
+            p_bg=p_bg,
+            p_label=p_label,
+            score_badge=SCORE_BADGE.render(impact_score=fields['impact_score']),
+            tags_html=''.join(TAG.render(tag=t) for t in fields['tags']),
+            title=fields['title'],
+            card_color=card_color,
+            bridge=fields['bridge'],
+            summary_html=md_to_html(fields['summary']),
+            source_url=fields['source_url'],
+            published=fields['published']
+        )
+        with self._lock:
+            self._fragments[key] = fragment
+            while len(self._fragments) > self.max_cached_fragments:
+                self._fragments.popitem(last=False)
+        return fragment
+
+
+# Shared across bridges so repeated renders of the same items hit the fragment cache
+default_renderer = HTMLReportRenderer()
@@ -0,0 +1,82 @@
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List
+from .state import state_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS impact_scores (
+    id TEXT NOT NULL,
+    rubric TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    scored_at TEXT NOT NULL,
+    title TEXT,
+    source TEXT,
+    category TEXT,
+    PRIMARY KEY (id, rubric)
+);
+CREATE INDEX IF NOT EXISTS idx_impact_scored_at ON impact_scores(scored_at);
+"""
+
+# Item fields kept with each score as training data for the local impact model
+ITEM_COLUMNS = ('title', 'source', 'category')
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+class ImpactScoreCache:
+    """
+    Local SQLite store of impact scores keyed by stable pulse ID (archive.pulse_key) and a
+    rubric fingerprint, so items scored on an earlier run are not re-sent to the model.
+    Changing the ranking prompt or model changes the fingerprint and starts a fresh set.
+    """
+
+    def __init__(self, path: str = None, max_age_days: int = 90):
+        self.path = path or state_path('impact_scores.db')
+        self.max_age_days = max_age_days
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(SCHEMA)
+            existing = {row[1] for row in conn.execute('PRAGMA table_info(impact_scores)')}
+            for column in ITEM_COLUMNS:
+                if column not in existing:
+                    conn.execute(f'ALTER TABLE impact_scores ADD COLUMN {column} TEXT')
+            if max_age_days:
+                cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
+                conn.execute('DELETE FROM impact_scores WHERE scored_at < ?', (cutoff,))
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def get_many(self, keys: Iterable[str], rubric: str) -> Dict[str, int]:
+        keys = list(dict.fromkeys(keys))
+        scores: Dict[str, int] = {}
+        with closing(self._connect()) as conn:
+            for i in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[i:i + _LOOKUP_CHUNK]
+                rows = conn.execute(f"SELECT id, score FROM impact_scores WHERE rubric = ? AND id IN ({', '.join('?' for _ in chunk)})",
+                                    [rubric] + chunk).fetchall()
+                scores.update(rows)
+        return scores
+
+    def put_many(self, scores: Dict[str, int], rubric: str, items: Dict[str, Dict[str, Any]] = None) -> int:
+        """Stores scores; `items` (same keys) supplies the title/source/category kept for training."""
+        if not scores:
+            return 0
+        now = datetime.now(timezone.utc).isoformat()
+        items = items or {}
+        rows = [(key, rubric, int(score), now) + tuple(items.get(key, {}).get(c) for c in ITEM_COLUMNS)
+                for key, score in scores.items()]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(f"INSERT OR REPLACE INTO impact_scores (id, rubric, score, scored_at, {', '.join(ITEM_COLUMNS)}) "
+                             f"VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def training_rows(self, rubric: str) -> List[Dict[str, Any]]:
+        """Model-assigned scores under `rubric` that still have their item fields, oldest first."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"SELECT id, score, {', '.join(ITEM_COLUMNS)} FROM impact_scores "
+                                f"WHERE rubric = ? AND title IS NOT NULL ORDER BY scored_at, id", (rubric,)).fetchall()
+        return [dict(zip(('id', 'score') + ITEM_COLUMNS, row)) for row in rows]
@@ -0,0 +1,160 @@
+import os
+import re
+import json
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .state import state_path
+
+N_FEATURES = 2 ** 16
+# Predictions outside [LOW_CUT, HIGH_CUT] (widened by the holdout error) are trusted locally;
+# the uncertain middle band still goes to the model ranker
+LOW_CUT = 40
+HIGH_CUT = 85
+MIN_TRAINING_SAMPLES = 50
+# Rubric tiers used to report agreement with the model-assigned scores
+TIER_EDGES = (40, 70, 90)
+
+_TOKEN = re.compile(r'[a-z0-9][a-z0-9.+-]*')
+
+
+def features(item: Dict[str, Any]) -> List[int]:
+    """Hashed feature indices: title unigrams and bigrams, source and category."""
+    words = _TOKEN.findall((item.get('title') or '').lower())
+    tokens = words + [f'{a} {b}' for a, b in zip(words, words[1:])]
+    tokens.append(f"src:{item.get('source') or ''}")
+    tokens.append(f"cat:{item.get('category') or ''}")
+    return [zlib.crc32(t.encode('utf-8')) % N_FEATURES for t in tokens]
+
+
+def _design(items: Sequence[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sparse rows as (row index, column index, value); each row is L2-normalised."""
+    rows, cols, vals = [], [], []
+    for i, item in enumerate(items):
+        idx = features(item)
+        rows.extend([i] * len(idx))
+        cols.extend(idx)
+        vals.extend([1.0 / np.sqrt(len(idx))] * len(idx))
+    return np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64), np.asarray(vals, dtype=np.float64)
+
+
+def tier(score: float) -> int:
+    return int(np.searchsorted(TIER_EDGES, score, side='right'))
+
+
+class ImpactModel:
+    """
+    Hashing-vectorizer ridge regression over item titles, trained on model-assigned impact
+    scores from the ImpactScoreCache. Scores ~100 items per millisecond (feature hashing dominates), so confident
+    low/high items can skip the model ranker and, without a client, everything is still ranked.
+    """
+
+    def __init__(self, weights: np.ndarray, bias: float, rubric: str, metrics: Dict[str, Any] = None):
+        self.weights = weights
+        self.bias = bias
+        self.rubric = rubric
+        self.metrics = metrics or {}
+        margin = self.metrics.get('holdout_mae', 0.0)
+        self.band = (LOW_CUT - margin, HIGH_CUT + margin)
+
+    def predict(self, items: Sequence[Dict[str, Any]]) -> np.ndarray:
+        if not items:
+            return np.zeros(0)
+        rows, cols, vals = _design(items)
+        raw = np.bincount(rows, weights=self.weights[cols] * vals, minlength=len(items)) + self.bias
+        return np.clip(raw, 0, 100)
+
+    def confident(self, predictions: np.ndarray) -> np.ndarray:
+        """Mask of predictions outside the uncertain middle band."""
+        low, high = self.band
+        return (predictions < low) | (predictions > high)
+
+    @classmethod
+    def fit(cls, items: Sequence[Dict[str, Any]], scores: Sequence[float], rubric: str,
+            l2: float = 1e-3, iterations: int = 300) -> 'ImpactModel':
+        """Full-batch Adam on the sparse ridge objective; fast for tens of thousands of items."""
+        y = np.asarray(scores, dtype=np.float64)
+        rows, cols, vals = _design(items)
+        n = len(y)
+        bias = float(y.mean())
+        w = np.zeros(N_FEATURES)
+        m = np.zeros(N_FEATURES)
+        v = np.zeros(N_FEATURES)
+        lr, beta1, beta2, eps = 2.0, 0.9, 0.999, 1e-8
+        for t in range(1, iterations + 1):
+            residual = np.bincount(rows, weights=w[cols] * vals, minlength=n) + bias - y
+            grad = np.bincount(cols, weights=residual[rows] * vals, minlength=N_FEATURES) / n + l2 * w
+            bias -= lr * residual.mean() * 0.1
+            m = beta1 * m + (1 - beta1) * grad
+            v = beta2 * v + (1 - beta2) * grad * grad
+            w -= lr * (m / (1 - beta1 ** t)) / (np.sqrt(v / (1 - beta2 ** t)) + eps)
+        return cls(w, bias, rubric)
+
+    def save(self, path: str = None) -> str:
+        path = path or state_path('impact_model.npz')
+        nonzero = np.flatnonzero(self.weights)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, index=nonzero, weights=self.weights[nonzero], bias=self.bias,
+                                meta=json.dumps({'rubric': self.rubric, 'metrics': self.metrics}))
+        return path
+
+    @classmethod
+    def load(cls, rubric: str, path: str = None) -> Optional['ImpactModel']:
+        """The saved model, or None when missing or trained under a different rubric."""
+        path = path or state_path('impact_model.npz')
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            if meta.get('rubric') != rubric:
+                return None
+            weights = np.zeros(N_FEATURES)
+            weights[data['index']] = data['weights']
+            return cls(weights, float(data['bias']), rubric, meta.get('metrics'))
+
+
+def agreement_report(predictions: np.ndarray, actual: np.ndarray, confident: np.ndarray) -> Dict[str, Any]:
+    """How closely local predictions track model-assigned scores, overall and where the local model decides."""
+    if not len(actual):
+        return {}
+    errors = np.abs(predictions - actual)
+    tiers_match = np.array([tier(p) == tier(a) for p, a in zip(predictions, actual)])
+    local = confident.astype(bool)
+    report = {
+        'samples': int(len(actual)),
+        'mae': round(float(errors.mean()), 2),
+        'tier_agreement': round(float(tiers_match.mean()), 3),
+        'local_share': round(float(local.mean()), 3),
+        'local_tier_agreement': round(float(tiers_match[local].mean()), 3) if local.any() else None,
+        'local_mae': round(float(errors[local].mean()), 2) if local.any() else None,
+    }
+    if len(actual) > 1 and np.std(predictions) > 0 and np.std(actual) > 0:
+        ranks = lambda x: np.argsort(np.argsort(x))
+        report['spearman'] = round(float(np.corrcoef(ranks(predictions), ranks(actual))[0, 1]), 3)
+    return report
+
+
+def train_from_cache(cache, rubric: str, holdout: float = 0.2, min_samples: int = MIN_TRAINING_SAMPLES) -> ImpactModel:
+    """
+    Trains on the cached model-assigned scores with a deterministic holdout split (by item ID),
+    records holdout agreement in model.metrics, then refits on all rows. Raises ValueError
+    when there is not enough history yet.
+    """
+    rows = cache.training_rows(rubric)
+    if len(rows) < min_samples:
+        raise ValueError(f'Need at least {min_samples} model-scored items to train, have {len(rows)}.')
+    is_test = np.array([zlib.crc32(r['id'].encode('utf-8')) % 1000 < holdout * 1000 for r in rows])
+    scores = np.array([r['score'] for r in rows], dtype=np.float64)
+    train = [r for r, t in zip(rows, is_test) if not t]
+    test = [r for r, t in zip(rows, is_test) if t]
+
+    metrics: Dict[str, Any] = {'trained_at': datetime.now(timezone.utc).isoformat(), 'samples': len(rows)}
+    if test and train:
+        probe = ImpactModel.fit(train, scores[~is_test], rubric)
+        predictions = probe.predict(test)
+        metrics['holdout_mae'] = float(np.abs(predictions - scores[is_test]).mean())
+        probe = ImpactModel(probe.weights, probe.bias, rubric, metrics)
+        metrics['holdout'] = agreement_report(predictions, scores[is_test], probe.confident(predictions))
+    model = ImpactModel.fit(rows, scores, rubric)
+    return ImpactModel(model.weights, model.bias, rubric, metrics)
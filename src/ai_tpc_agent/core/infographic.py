@@ -0,0 +1,83 @@
+import os
+import hashlib
+import tempfile
+from typing import Any, Callable, List, Optional
+from .state import state_path
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+IMAGE_MODEL = 'imagen-3.0-generate-001'
+
+
+def infographic_key(tldr: str, titles: List[str], model: str = IMAGE_MODEL) -> str:
+    """Content hash of everything that shapes the generated image."""
+    payload = '\n'.join([model, tldr or ''] + list(titles))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+class InfographicCache:
+    """
+    On-disk cache of generated infographics keyed by a hash of the prompt inputs,
+    so re-runs over the same pulse reuse the image instead of calling the model again.
+    """
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or state_path('infographics')
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.png')
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.path_for(key)
+        return path if os.path.exists(path) and os.path.getsize(path) > 0 else None
+
+    def store(self, key: str, save: Callable[[str], Any]) -> str:
+        """
+        Calls save(tmp) on a uniquely named file beside the entry and moves it into place, so
+        concurrent runs never share a temp file and a failed save leaves nothing behind.
+        """
+        path = self.path_for(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f'{key}.', suffix='.tmp.png')
+        os.close(fd)
+        try:
+            save(tmp)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return path
+
+
+def optimize_for_email(path: str, max_width: int = 1200, quality: int = 80) -> str:
+    """
+    Returns a downscaled, recompressed JPEG variant of `path` for inline embedding.
+    Variants are written next to the original and reused while it is unchanged.
+    Falls back to the original when Pillow is not installed or the variant is not smaller.
+    """
+    if Image is None or not max_width:
+        return path
+    stat = os.stat(path)
+    root, _ = os.path.splitext(path)
+    variant = f'{root}.w{max_width}q{quality}.{int(stat.st_mtime)}.jpg'
+    if os.path.exists(variant):
+        return variant
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(variant) or '.', prefix=os.path.basename(variant) + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        with Image.open(path) as img:
+            img = img.convert('RGB')
+            if img.width > max_width:
+                img = img.resize((max_width, round(img.height * max_width / img.width)), Image.LANCZOS)
+            img.save(tmp, 'JPEG', quality=quality, optimize=True, progressive=True)
+        os.replace(tmp, variant)
+    except (OSError, ValueError):
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return path
+    if os.path.getsize(variant) >= stat.st_size:
+        os.remove(variant)
+        return path
+    return variant
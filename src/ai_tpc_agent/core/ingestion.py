@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+from vertexai.preview import rag
+from rich.console import Console
+from .state import state_path
+from .tracing import traced, tracer
+console = Console()
+
+# Vertex RAG Engine accepts at most 25 Drive/GCS paths per import request.
+MAX_IMPORT_BATCH = 25
+
+
+class IngestionJournal:
+    """
+    Local JSON journal of per-URI ingestion status.
+    Completed URIs are skipped on reruns so a partially failed job can be resumed.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or state_path('ingestion_journal.json')
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.entries = json.load(f).get('uris', {})
+            except (OSError, ValueError):
+                console.print(f'[yellow]Warning: Ingestion journal {self.path} is unreadable, starting fresh.[/yellow]')
+
+    def status(self, uri: str) -> Optional[str]:
+        return self.entries.get(uri, {}).get('status')
+
+    def pending(self, uris: List[str]) -> List[str]:
+        """Returns the de-duplicated URIs that have not completed yet, preserving order."""
+        seen = set()
+        pending = []
+        for uri in uris:
+            if uri in seen or self.status(uri) == 'completed':
+                continue
+            seen.add(uri)
+            pending.append(uri)
+        return pending
+
+    def record(self, uris: List[str], status: str, **details):
+        with self._lock:
+            now = datetime.now(timezone.utc).isoformat()
+            for uri in uris:
+                entry = {'status': status, 'updated': now}
+                entry.update(details)
+                self.entries[uri] = entry
+            self._save()
+
+    def _save(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'uris': self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class IngestionJobManager:
+    """
+    Splits URIs into size-bounded batches and imports them into the RAG corpus
+    with bounded concurrency, tracking every URI in an IngestionJournal.
+    """
+
+    def __init__(self, corpus_name: str, batch_size: int = MAX_IMPORT_BATCH, max_concurrency: int = 4,
+                 poll_interval: float = 5.0, journal: IngestionJournal = None,
+                 chunk_size: int = 1024, chunk_overlap: int = 200):
+        self.corpus_name = corpus_name
+        self.batch_size = max(1, min(batch_size, MAX_IMPORT_BATCH))
+        self.max_concurrency = max(1, max_concurrency)
+        self.poll_interval = poll_interval
+        self.journal = journal or IngestionJournal()
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def plan_batches(self, uris: List[str]) -> List[List[str]]:
+        pending = self.journal.pending(uris)
+        return [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+
+    def run(self, uris: List[str]) -> Dict[str, Any]:
+        """
+        Imports all pending URIs and returns a summary with per-status counts and throughput.
+        """
+        batches = self.plan_batches(uris)
+        skipped = len(set(uris)) - sum(len(b) for b in batches)
+        summary = {'batches': len(batches), 'completed': 0, 'failed': 0, 'skipped': skipped,
+                   'documents': 0, 'elapsed_seconds': 0.0, 'docs_per_minute': 0.0}
+        if skipped:
+            console.print(f'[dim]⏭️  Skipping {skipped} URIs already completed in {self.journal.path}[/dim]')
+        if not batches:
+            return summary
+
+        total = sum(len(b) for b in batches)
+        console.print(f'📥 Importing {total} URIs in {len(batches)} batches (concurrency {self.max_concurrency})...')
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            futures = {}
+            for index, batch in enumerate(batches):
+                self.journal.record(batch, 'running', batch=index)
+                futures[pool.submit(tracer.bind(self._import_batch), batch)] = (index, batch)
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=self.poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, batch = futures[future]
+                    try:
+                        documents, failed = future.result()
+                    except Exception as e:
+                        self.journal.record(batch, 'failed', batch=index, error=str(e))
+                        summary['failed'] += len(batch)
+                        console.print(f'[red]❌ Batch {index} failed: {e}[/red]')
+                        continue
+                    if failed:
+                        # The import response only reports counts, so the whole batch is retried next run.
+                        self.journal.record(batch, 'failed', batch=index, error=f'{failed} files failed to import')
+                        summary['failed'] += len(batch)
+                    else:
+                        self.journal.record(batch, 'completed', batch=index, documents=documents)
+                        summary['completed'] += len(batch)
+                    summary['documents'] += documents
+                summary['elapsed_seconds'] = time.monotonic() - start
+                summary['docs_per_minute'] = _per_minute(summary['documents'], summary['elapsed_seconds'])
+                finished = summary['completed'] + summary['failed']
+                console.print(f"[dim]⏳ {finished}/{total} URIs processed ({summary['docs_per_minute']:.1f} docs/min)[/dim]")
+
+        console.print(f"✅ Ingestion finished: {summary['completed']} completed, {summary['failed']} failed, "
+                      f"{summary['documents']} documents at {summary['docs_per_minute']:.1f} docs/min.")
+        return summary
+
+    @traced('ingestion.import_batch')
+    def _import_batch(self, batch: List[str]):
+        """Runs one import_files call, which blocks until the import operation completes."""
+        response = rag.import_files(
+            corpus_name=self.corpus_name,
+            paths=batch,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap
+        )
+        imported = _count(response, 'imported_rag_files_count') + _count(response, 'skipped_rag_files_count')
+        failed = _count(response, 'failed_rag_files_count')
+        # Drive folders expand into many files; fall back to the URI count when the response has no counts.
+        return (imported or len(batch)), failed
+
+
+def _count(response: Any, field: str) -> int:
+    value = getattr(response, field, 0)
+    return value if isinstance(value, int) else 0
+
+
+def _per_minute(count: int, elapsed_seconds: float) -> float:
+    return count * 60.0 / elapsed_seconds if elapsed_seconds > 0 else 0.0
@@ -0,0 +1,179 @@
+import time
+import threading
+from typing import Any, Dict, List, Optional
+
+# List prices in USD per 1M tokens (input, output); unknown models are costed at zero
+MODEL_PRICING = {
+    'gemini-2.5-pro': (1.25, 10.00),
+    'gemini-2.5-flash': (0.30, 2.50),
+    'gemini-2.0-flash': (0.10, 0.40),
+    'gemini-2.0-flash-exp': (0.10, 0.40),
+}
+# Input tokens served from a context cache are billed at this fraction of the input price
+CACHED_INPUT_RATE = 0.25
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for responses without usage metadata."""
+    return max(1, len(text or '') // 4)
+
+
+def usage_tokens(response: Any, prompt: str = '') -> Dict[str, Any]:
+    """Input/output token counts from a response's usage metadata, estimated from text when absent."""
+    usage = getattr(response, 'usage_metadata', None)
+    prompt_tokens = getattr(usage, 'prompt_token_count', None)
+    output_tokens = getattr(usage, 'candidates_token_count', None)
+    cached_tokens = getattr(usage, 'cached_content_token_count', None)
+    if isinstance(prompt_tokens, int) and isinstance(output_tokens, int):
+        return {'input_tokens': prompt_tokens, 'output_tokens': output_tokens,
+                'cached_tokens': cached_tokens if isinstance(cached_tokens, int) else 0, 'estimated': False}
+    text = getattr(response, 'text', '')
+    return {'input_tokens': estimate_tokens(prompt), 'output_tokens': estimate_tokens(text if isinstance(text, str) else ''),
+            'cached_tokens': 0, 'estimated': True}
+
+
+def call_cost(model: str, input_tokens: int, output_tokens: int, cached_tokens: int = 0) -> float:
+    input_price, output_price = MODEL_PRICING.get(model, (0.0, 0.0))
+    cached_tokens = min(cached_tokens, input_tokens)
+    billed_input = input_tokens - cached_tokens + cached_tokens * CACHED_INPUT_RATE
+    return (billed_input * input_price + output_tokens * output_price) / 1_000_000
+
+
+class TokenLedger:
+    """
+    Per-run record of every model call: call site, model, tokens, latency and cost.
+    Optionally enforces a token and/or wall-clock budget; callers check exhausted()
+    before optional model work and fall back to the keyword path once it trips.
+    """
+
+    def __init__(self, token_budget: Optional[int] = None, time_budget_seconds: Optional[float] = None):
+        self.token_budget = token_budget or None
+        self.time_budget_seconds = time_budget_seconds or None
+        self._lock = threading.Lock()
+        self.start_run()
+
+    def start_run(self):
+        """Clears the ledger and restarts the wall clock for a new pulse."""
+        with self._lock:
+            self.records: List[Dict[str, Any]] = []
+            self.degraded: List[str] = []
+            self.started = time.monotonic()
+
+    def generate(self, client, site: str, model: str, contents: Any, **kwargs):
+        """Calls client.models.generate_content and records the call under `site`."""
+        start = time.perf_counter()
+        try:
+            response = client.models.generate_content(model=model, contents=contents, **kwargs)
+        except Exception as e:
+            self.record(site, model, time.perf_counter() - start, ok=False, error=type(e).__name__)
+            raise
+        self.record(site, model, time.perf_counter() - start, **usage_tokens(response, contents if isinstance(contents, str) else ''))
+        return response
+
+    def record(self, site: str, model: str, latency_seconds: float, input_tokens: int = 0, output_tokens: int = 0,
+               cached_tokens: int = 0, estimated: bool = False, ok: bool = True, error: str = None):
+        entry = {'site': site, 'model': model, 'latency_seconds': latency_seconds, 'input_tokens': input_tokens,
+                 'output_tokens': output_tokens, 'cached_tokens': cached_tokens, 'estimated': estimated, 'ok': ok,
+                 'cost_usd': call_cost(model, input_tokens, output_tokens, cached_tokens)}
+        if error:
+            entry['error'] = error
+        with self._lock:
+            self.records.append(entry)
+
+    def mark_degraded(self, label: str):
+        with self._lock:
+            self.degraded.append(label)
+
+    @property
+    def total_tokens(self) -> int:
+        with self._lock:
+            return sum(r['input_tokens'] + r['output_tokens'] for r in self.records)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started
+
+    def exhausted(self) -> bool:
+        """True once the token or wall-clock budget for this run is spent."""
+        if self.token_budget and self.total_tokens >= self.token_budget:
+            return True
+        return bool(self.time_budget_seconds and self.elapsed_seconds >= self.time_budget_seconds)
+
+    def remaining_fraction(self) -> Optional[float]:
+        """Share of the tighter budget still unspent (0..1), or None when the run is unbudgeted."""
+        shares = []
+        if self.token_budget:
+            shares.append(1 - self.total_tokens / self.token_budget)
+        if self.time_budget_seconds:
+            shares.append(1 - self.elapsed_seconds / self.time_budget_seconds)
+        return max(0.0, min(shares)) if shares else None
+
+    def report(self) -> Dict[str, Any]:
+        """Per-pulse totals plus a per call site/model breakdown, most tokens first."""
+        with self._lock:
+            records = list(self.records)
+            degraded = list(self.degraded)
+        sites: Dict[tuple, Dict[str, Any]] = {}
+        for r in records:
+            s = sites.setdefault((r['site'], r['model']), {'site': r['site'], 'model': r['model'], 'calls': 0, 'failures': 0,
+                                                          'input_tokens': 0, 'output_tokens': 0, 'cached_tokens': 0,
+                                                          'latency_seconds': 0.0, 'max_latency_seconds': 0.0, 'cost_usd': 0.0})
+            s['calls'] += 1
+            s['failures'] += not r['ok']
+            for key in ('input_tokens', 'output_tokens', 'cached_tokens', 'latency_seconds', 'cost_usd'):
+                s[key] += r[key]
+            s['max_latency_seconds'] = max(s['max_latency_seconds'], r['latency_seconds'])
+        input_tokens = sum(r['input_tokens'] for r in records)
+        output_tokens = sum(r['output_tokens'] for r in records)
+        return {
+            'calls': len(records),
+            'failures': sum(not r['ok'] for r in records),
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens,
+            'cached_tokens': sum(r['cached_tokens'] for r in records),
+            'estimated': any(r['estimated'] for r in records),
+            'model_latency_seconds': round(sum(r['latency_seconds'] for r in records), 4),
+            'wall_seconds': round(self.elapsed_seconds, 4),
+            'cost_usd': round(sum(r['cost_usd'] for r in records), 6),
+            'budget': {'tokens': self.token_budget, 'seconds': self.time_budget_seconds,
+                       'exhausted': self.exhausted(), 'degraded': degraded},
+            'by_site': sorted(sites.values(), key=lambda s: s['input_tokens'] + s['output_tokens'], reverse=True),
+        }
+
+
+def render_ledger(console, report: Dict[str, Any]):
+    """Prints the per-pulse budget report."""
+    from rich.table import Table
+    budget = report['budget']
+    limits = ', '.join(filter(None, [f"{budget['tokens']:,} tokens" if budget['tokens'] else '',
+                                     f"{budget['seconds']:.0f}s" if budget['seconds'] else ''])) or 'none'
+    title = (f"Pulse Budget: {report['total_tokens']:,} tokens{' (estimated)' if report['estimated'] else ''}, "
+             f"${report['cost_usd']:.4f}, {report['wall_seconds']:.1f}s (limit: {limits})")
+    table = Table(title=title)
+    table.add_column('Call site', style='cyan')
+    table.add_column('Model', style='magenta')
+    table.add_column('Calls', justify='right')
+    table.add_column('Tokens in', justify='right')
+    table.add_column('Cached', justify='right')
+    table.add_column('Tokens out', justify='right')
+    table.add_column('Latency s', justify='right')
+    table.add_column('Max ms', justify='right')
+    table.add_column('Cost $', justify='right')
+    for s in report['by_site']:
+        table.add_row(s['site'] + (f" [red]({s['failures']} failed)[/red]" if s['failures'] else ''), s['model'], str(s['calls']),
+                      f"{s['input_tokens']:,}", f"{s['cached_tokens']:,}" if s['cached_tokens'] else '-', f"{s['output_tokens']:,}", f"{s['latency_seconds']:.2f}",
+                      f"{s['max_latency_seconds'] * 1000:.0f}", f"{s['cost_usd']:.4f}")
+    console.print(table)
+    cache = report.get('context_cache')
+    if cache and cache['active']:
+        console.print(f"[green]Context cache ({cache['model']}): {cache['cached_calls']} calls reused the shared prompt, "
+                      f"{cache['tokens_saved']:,} tokens billed at the cached rate, {cache['refreshes']} TTL refresh(es).[/green]")
+    elif cache and cache['disabled_reason']:
+        console.print(f"[dim]Context cache unavailable, prompt sent inline: {cache['disabled_reason']}[/dim]")
+    routing = report.get('routing')
+    if routing and (routing['economy'] or routing['hedged'] or routing['deadline_exceeded']):
+        console.print(f"[dim]Routing: {routing['economy']} call(s) on economy models, {routing['hedged']} hedged "
+                      f"({routing['hedge_wins']} won by the hedge), {routing['deadline_exceeded']} past deadline.[/dim]")
+    if budget['degraded']:
+        console.print(f"[yellow]Budget exhausted: {len(budget['degraded'])} step(s) fell back to keyword talk tracks.[/yellow]")
@@ -1,48 +1,176 @@
 from tenacity import retry, wait_exponential, stop_after_attempt
 from typing import Literal
+import re
 import requests
 import json
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from datetime import datetime
+from .pypi_cache import PyPIMetadataCache
+from .release_analytics import release_cadence, maturity_score, format_scorecard
+from .tracing import traced, tracer
+from .ledger import TokenLedger
+from .model_router import ModelRouter
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+INFO_FIELDS = ('version', 'summary', 'description', 'author')
+
+
+def read_pypi_document(response: requests.Response) -> Dict[str, Any]:
+    """
+    Pulls only `info` fields and compact (version, upload_time, yanked) entries from a streamed
+    PyPI JSON response. With ijson installed the document is parsed incrementally and
+    per-file release entries are never materialized; otherwise falls back to response.json().
+    """
+    if ijson is None:
+        return compact_pypi_document(response.json())
+    response.raw.decode_content = True
+    info: Dict[str, Any] = {'project_urls': {}}
+    releases: Dict[str, List[Any]] = {}
+    version, url_key = None, None
+    for prefix, event, value in ijson.parse(response.raw):
+        if prefix == 'releases':
+            if event == 'map_key':
+                version = value
+                releases[version] = [None, None]
+            elif event == 'end_map':
+                break  # everything after `releases` (urls, vulnerabilities) is unused
+        elif prefix.startswith('releases.') and prefix.endswith('.item.upload_time') and event == 'string':
+            if releases[version][0] is None or value < releases[version][0]:
+                releases[version][0] = value
+        elif prefix.startswith('releases.') and prefix.endswith('.item.yanked') and event == 'boolean':
+            # A release counts as yanked only when every file in it is
+            releases[version][1] = value if releases[version][1] is None else releases[version][1] and value
+        elif prefix.startswith('info.'):
+            field = prefix[5:]
+            if field in INFO_FIELDS and event in ('string', 'number', 'null'):
+                info[field] = value
+            elif field == 'project_urls' and event == 'map_key':
+                url_key = value
+            elif field.startswith('project_urls.') and event == 'string':
+                info['project_urls'][url_key] = value
+    return {'info': info, 'releases': _sorted_releases(releases)}
+
+
+def compact_pypi_document(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduces a fully parsed PyPI JSON document to the same shape as read_pypi_document."""
+    info = data.get('info') or {}
+    releases = {
+        version: [min((f.get('upload_time') for f in files if f.get('upload_time')), default=None),
+                  bool(files) and all(f.get('yanked', False) for f in files)]
+        for version, files in (data.get('releases') or {}).items()
+    }
+    return {
+        'info': dict({field: info.get(field) for field in INFO_FIELDS}, project_urls=info.get('project_urls') or {}),
+        'releases': _sorted_releases(releases),
+    }
+
+
+def _sorted_releases(releases: Dict[str, List[Any]]) -> List[List[Any]]:
+    # Chronological by first upload; versions without files keep their document order at the end
+    dated = sorted(([v, t, bool(y)] for v, (t, y) in releases.items() if t), key=lambda entry: entry[1])
+    return dated + [[v, None, False] for v, (t, _) in releases.items() if not t]
 
 class MaturityAuditor:
-    def __init__(self, gemini_client=None):
+    def __init__(self, gemini_client=None, metadata_cache: PyPIMetadataCache = None, ledger: TokenLedger = None,
+                 router: ModelRouter = None):
         self.gemini_client = gemini_client
+        self.metadata_cache = metadata_cache
+        self.ledger = ledger or TokenLedger()
+        self.router = router or ModelRouter(self.ledger)
 
-    def audit_pypi_package(self, package_name: str) -> Dict[str, Any]:
+    def _cache(self) -> PyPIMetadataCache:
+        if self.metadata_cache is None:
+            self.metadata_cache = PyPIMetadataCache()
+        return self.metadata_cache
+
+    @traced('maturity.fetch_metadata')
+    def fetch_package_metadata(self, package_name: str) -> Dict[str, Any]:
         """
-        Deeply inspects a PyPI package to extract its full capability set and maturity level.
+        Returns the maturity-relevant PyPI metadata for a package via the on-disk cache.
         """
-        url = f"https://pypi.org/pypi/{package_name}/json"
         try:
-            response = requests.get(url, timeout=10)
-            if response.status_code != 200:
-                return {"error": f"Package {package_name} not found on PyPI"}
-            
-            data = response.json()
-            info = data.get("info", {})
-            releases = data.get("releases", {})
-            
-            # Extract high-level wisdom
-            maturity_data = {
-                "name": package_name,
-                "version": info.get("version"),
-                "summary": info.get("summary"),
-                "description": info.get("description", "")[:5000],  # Keep first 5k chars of README
-                "author": info.get("author"),
-                "project_urls": info.get("project_urls", {}),
-                "release_count": len(releases),
-                "last_release": list(releases.keys())[-1] if releases else "N/A",
-                "source": "pypi"
-            }
-            
-            # Use Gemini to synthesize "Maturity Wisdom" if available
-            if self.gemini_client:
-                maturity_data["wisdom"] = self._synthesize_maturity_wisdom(maturity_data)
-            
-            return maturity_data
+            maturity_data = self._cache().get(package_name, lambda response: self._extract_metadata(package_name, read_pypi_document(response)))
         except Exception as e:
             return {"error": str(e)}
+        if maturity_data is None:
+            return {"error": f"Package {package_name} not found on PyPI"}
+        return dict(maturity_data)
+
+    @staticmethod
+    def _extract_metadata(package_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        info = data.get("info", {})
+        releases = data.get("releases", [])
+        dated = [release[0] for release in releases if release[1]]
+
+        # Extract high-level wisdom
+        return {
+            "name": package_name,
+            "version": info.get("version"),
+            "summary": info.get("summary"),
+            "description": (info.get("description") or "")[:5000],  # Keep first 5k chars of README
+            "author": info.get("author"),
+            "project_urls": info.get("project_urls") or {},
+            "release_count": len(releases),
+            "last_release": dated[-1] if dated else (info.get("version") or "N/A"),
+            "releases": releases,
+            "source": "pypi"
+        }
+
+    @staticmethod
+    def score_package(maturity_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Adds the deterministic release-cadence analytics and maturity score to the metadata.
+        """
+        cadence = release_cadence(maturity_data.get("releases", []))
+        score = maturity_score(cadence)
+        maturity_data.update(
+            cadence=cadence,
+            maturity_score=score["score"],
+            maturity_tier=score["tier"],
+            score_components=score["components"],
+            scorecard=format_scorecard(cadence, score),
+        )
+        return maturity_data
+
+    def audit_pypi_package(self, package_name: str, enrich: bool = True) -> Dict[str, Any]:
+        """
+        Deeply inspects a PyPI package to extract its full capability set and maturity level.
+        """
+        maturity_data = self.fetch_package_metadata(package_name)
+        if "error" in maturity_data:
+            return maturity_data
+        self.score_package(maturity_data)
+
+        # Use Gemini to enrich the computed score with "Maturity Wisdom" if available
+        if self.gemini_client and enrich:
+            maturity_data["wisdom"] = self._synthesize_maturity_wisdom(maturity_data)
+
+        return maturity_data
+
+    def audit_packages(self, package_names: List[str], max_workers: int = 8, wisdom_batch_size: int = 5, enrich: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Audits many packages: metadata is fetched concurrently through the cache and scored
+        locally, then wisdom is synthesized with one model call per batch of packages.
+        """
+        names = list(dict.fromkeys(package_names))
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names) or 1))) as pool:
+            results = dict(zip(names, pool.map(tracer.bind(self.fetch_package_metadata), names)))
+        for data in results.values():
+            if "error" not in data:
+                self.score_package(data)
+
+        if self.gemini_client and enrich:
+            audited = [data for data in results.values() if "error" not in data]
+            batches = [audited[i:i + wisdom_batch_size] for i in range(0, len(audited), wisdom_batch_size)]
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches) or 1))) as pool:
+                for batch, wisdom in zip(batches, pool.map(tracer.bind(self._synthesize_wisdom_batch), batches)):
+                    for data in batch:
+                        data["wisdom"] = wisdom.get(data["name"]) or self._synthesize_maturity_wisdom(data)
+        return results
 
     def _synthesize_maturity_wisdom(self, data: Dict[str, Any]) -> str:
         """
@@ -53,28 +181,75 @@ class MaturityAuditor:
         You are a Principal AI Architect performing a Technical Maturity Audit on an SDK.
         Your goal is to provide "Field Wisdom" for TPCs.
         </system_instructions>
-        
+
         <context>
         Package: {data['name']}
         Summary: {data['summary']}
         Version: {data['version']}
         Release Count: {data['release_count']}
+        Computed Release Cadence:
+        {data.get('scorecard', 'n/a')}
         Description Snippet: {data['description'][:2000]}
         </context>
-        
+
         <task>
         Summarize the 'Maturity & Capabilities' of this package in 3 sections:
         1. 💎 KEY CAPABILITIES: What does it actually allow architects to build?
-        2. 📈 MATURITY SCORE: Is it production-ready? (Early Alpha, Stable, Enterprise Grade)
+        2. 📈 MATURITY SCORE: Is it production-ready? Ground this in the computed score above (Early Alpha, Stable, Enterprise Grade)
         3. 🎯 SALES PLAY: How should the field position this to customers?
         </task>
-        
+
         <format>
         Return a clean, bulleted synthesis with emojis.
         </format>
         """
         try:
-            resp = self.gemini_client.models.generate_content(model='gemini-2.0-flash', contents=prompt)
+            resp = self.router.generate(self.gemini_client, 'maturity_wisdom', prompt)
             return resp.text.strip()
         except Exception:
-            return "Unable to synthesize wisdom at this time."
+            return data.get('scorecard') or "Unable to synthesize wisdom at this time."
+
+    @traced('maturity.wisdom_batch')
+    def _synthesize_wisdom_batch(self, batch: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Synthesizes wisdom for several packages in one model call.
+        Returns {package_name: wisdom}; packages missing from the reply are left out.
+        """
+        if len(batch) == 1:
+            return {batch[0]['name']: self._synthesize_maturity_wisdom(batch[0])}
+        packages = '\n\n'.join(
+            f"### {d['name']}\nSummary: {d['summary']}\nVersion: {d['version']}\nRelease Count: {d['release_count']}\n"
+            f"Computed Maturity: {d.get('maturity_score', 'n/a')}/100 ({d.get('maturity_tier', 'n/a')})\n"
+            f"Description Snippet: {d['description'][:1000]}"
+            for d in batch
+        )
+        prompt = f"""
+        <system_instructions>
+        You are a Principal AI Architect performing a Technical Maturity Audit on several SDKs.
+        Your goal is to provide "Field Wisdom" for TPCs.
+        </system_instructions>
+
+        <context>
+        {packages}
+        </context>
+
+        <task>
+        For EACH package, summarize the 'Maturity & Capabilities' in 3 sections:
+        1. 💎 KEY CAPABILITIES: What does it actually allow architects to build?
+        2. 📈 MATURITY SCORE: Is it production-ready? Ground this in the computed maturity (Early Alpha, Stable, Enterprise Grade)
+        3. 🎯 SALES PLAY: How should the field position this to customers?
+        </task>
+
+        <format>
+        Return ONLY a JSON object mapping each package name to its synthesis as a markdown string (clean bullets with emojis).
+        Example: {{"pkg-a": "💎 KEY CAPABILITIES: ...", "pkg-b": "..."}}
+        </format>
+        """
+        try:
+            resp = self.router.generate(self.gemini_client, 'maturity_wisdom_batch', prompt)
+            clean_json = resp.text.strip().replace('```json', '').replace('```', '')
+            clean_json = re.sub(r',\s*}', '}', clean_json)
+            parsed = json.loads(clean_json)
+            return {name: str(text).strip() for name, text in parsed.items() if text}
+        except Exception:
+            return {}
@@ -0,0 +1,204 @@
+import json
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future, FIRST_COMPLETED, wait, TimeoutError as FutureTimeout
+from typing import Any, Dict, Optional
+import numpy as np
+from .state import state_path
+from .ledger import TokenLedger, estimate_tokens
+from .tracing import tracer
+
+# Per prompt kind (ledger call site): preferred model, cheaper 'economy' model used for hedging and
+# for downgrades, per-call deadline (s), whether slow calls are hedged, and the input size above
+# which the economy model is used directly.
+ROUTES: Dict[str, Dict[str, Any]] = {
+    'tldr': {'model': 'gemini-2.5-pro', 'economy': 'gemini-2.5-flash', 'deadline': 60, 'hedge': True, 'max_input_tokens': 200_000},
+    'strategic_gaps': {'model': 'gemini-2.5-pro', 'economy': 'gemini-2.5-flash', 'deadline': 90, 'hedge': True, 'max_input_tokens': 200_000},
+    # Impact scores and digest partials are cached under the model that produced them; callers pin it
+    'rank_by_impact': {'model': 'gemini-2.0-flash', 'deadline': 30},
+    'talk_track': {'model': 'gemini-2.5-flash', 'economy': 'gemini-2.0-flash', 'deadline': 20},
+    'expand_summary': {'model': 'gemini-2.5-flash', 'economy': 'gemini-2.0-flash', 'deadline': 20},
+    'tags': {'model': 'gemini-2.5-flash', 'economy': 'gemini-2.0-flash', 'deadline': 15},
+    'refine_summary': {'model': 'gemini-2.5-flash', 'economy': 'gemini-2.0-flash', 'deadline': 20},
+    'digest_partial': {'model': 'gemini-2.5-flash', 'deadline': 30},
+    'console_refine': {'model': 'gemini-2.0-flash-exp', 'deadline': 15},
+    'maturity_wisdom': {'model': 'gemini-2.0-flash', 'deadline': 45},
+    'maturity_wisdom_batch': {'model': 'gemini-2.0-flash', 'deadline': 90},
+}
+DEFAULT_ROUTE = {'model': 'gemini-2.5-flash', 'deadline': 30}
+# Below this share of the token/time budget left, routes switch to their economy model
+ECONOMY_BELOW = 0.25
+# Hedge after this latency percentile of the preferred model, once enough calls were observed
+HEDGE_PERCENTILE = 90
+MIN_SAMPLES = 20
+
+
+class ModelDeadlineExceeded(TimeoutError):
+    pass
+
+
+class LatencyStats:
+    """
+    Recent successful-call latencies per model (bounded), persisted in the state dir so a new
+    run starts with the previous runs' distributions.
+    """
+
+    def __init__(self, max_samples: int = 256):
+        self.max_samples = max_samples
+        self._samples: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(state_path('model_latency.json'), 'r') as f:
+                for model, values in json.load(f).items():
+                    self._samples.setdefault(model, deque(maxlen=self.max_samples)).extend(values)
+        except (OSError, ValueError):
+            pass
+
+    def observe(self, model: str, seconds: float):
+        with self._lock:
+            self._ensure_loaded()
+            self._samples.setdefault(model, deque(maxlen=self.max_samples)).append(seconds)
+
+    def percentile(self, model: str, q: float) -> Optional[float]:
+        """q-th percentile latency for the model, or None with fewer than MIN_SAMPLES observations."""
+        with self._lock:
+            self._ensure_loaded()
+            samples = list(self._samples.get(model, ()))
+        return float(np.percentile(samples, q)) if len(samples) >= MIN_SAMPLES else None
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            self._ensure_loaded()
+            snapshot = {m: list(s) for m, s in self._samples.items() if s}
+        return {m: {'samples': len(s), 'p50': round(float(np.percentile(s, 50)), 3),
+                    'p90': round(float(np.percentile(s, 90)), 3), 'max': round(max(s), 3)} for m, s in snapshot.items()}
+
+    def save(self):
+        with self._lock:
+            snapshot = {m: [round(v, 4) for v in s] for m, s in self._samples.items()}
+        with open(state_path('model_latency.json'), 'w') as f:
+            json.dump(snapshot, f)
+
+
+latency = LatencyStats()
+
+
+def _submit(fn, *args, **kwargs) -> Future:
+    """Runs fn on a daemon thread: a call abandoned at its deadline never blocks interpreter exit."""
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=tracer.bind(run), name='model-call', daemon=True).start()
+    return future
+
+
+class ModelRouter:
+    """
+    Chooses the model for each call from its prompt kind (ROUTES), input size and the remaining
+    run budget; enforces a per-call deadline; and, for hedged routes, races the economy model
+    once the preferred model has been outstanding longer than its recent p90 latency.
+    All calls still go through the ledger, so tokens and cost are recorded per model.
+    """
+
+    def __init__(self, ledger: TokenLedger, routes: Dict[str, Dict[str, Any]] = None, hedging: bool = True,
+                 deadline_scale: float = 1.0):
+        self.ledger = ledger
+        self.routes = routes or ROUTES
+        self.hedging = hedging
+        self.deadline_scale = deadline_scale
+        self._lock = threading.Lock()
+        self.start_run()
+
+    def start_run(self):
+        with self._lock:
+            self.stats: Dict[str, int] = {'calls': 0, 'economy': 0, 'hedged': 0, 'hedge_wins': 0, 'deadline_exceeded': 0}
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def route(self, site: str, contents: Any, model: str = None) -> Dict[str, Any]:
+        """The route for one call: {'model', 'economy', 'deadline', 'hedge_after', 'reason'}."""
+        spec = dict(DEFAULT_ROUTE, **self.routes.get(site, {}))
+        if model:
+            # Pinned by the caller (e.g. a context cache is bound to one model)
+            return {'model': model, 'economy': None, 'deadline': spec['deadline'] * self.deadline_scale,
+                    'hedge_after': None, 'reason': 'pinned'}
+        chosen, reason = spec['model'], 'preferred'
+        economy = spec.get('economy')
+        remaining = self.ledger.remaining_fraction()
+        if economy and remaining is not None and remaining < ECONOMY_BELOW:
+            chosen, reason = economy, 'budget'
+        elif economy and spec.get('max_input_tokens') and estimate_tokens(contents if isinstance(contents, str) else '') > spec['max_input_tokens']:
+            chosen, reason = economy, 'input_size'
+        deadline = spec['deadline'] * self.deadline_scale
+        hedge_after = None
+        if self.hedging and spec.get('hedge') and economy and chosen != economy:
+            p = latency.percentile(chosen, HEDGE_PERCENTILE)
+            hedge_after = min(p if p is not None else deadline / 3, deadline * 0.9)
+        return {'model': chosen, 'economy': economy if chosen != economy else None, 'deadline': deadline,
+                'hedge_after': hedge_after, 'reason': reason}
+
+    def _timed_generate(self, client, site: str, model: str, contents: Any, **kwargs):
+        start = time.perf_counter()
+        response = self.ledger.generate(client, site, model, contents, **kwargs)
+        latency.observe(model, time.perf_counter() - start)
+        return response
+
+    def generate(self, client, site: str, contents: Any, model: str = None, **kwargs):
+        """Routed generate_content; raises ModelDeadlineExceeded when no answer arrives in time."""
+        plan = self.route(site, contents, model)
+        self._count('calls')
+        if plan['reason'] in ('budget', 'input_size'):
+            self._count('economy')
+        started = time.monotonic()
+        primary = _submit(self._timed_generate, client, site, plan['model'], contents, **kwargs)
+        if not plan['hedge_after']:
+            try:
+                return primary.result(timeout=plan['deadline'])
+            except FutureTimeout:
+                self._count('deadline_exceeded')
+                raise ModelDeadlineExceeded(f"{site}: {plan['model']} gave no answer within {plan['deadline']:.0f}s")
+
+        try:
+            return primary.result(timeout=plan['hedge_after'])
+        except FutureTimeout:
+            pass
+        self._count('hedged')
+        hedge = _submit(self._timed_generate, client, f'{site}:hedge', plan['economy'], contents, **kwargs)
+        pending, error = {primary, hedge}, None
+        while pending:
+            remaining = plan['deadline'] - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._count('hedge_wins')
+                    return future.result()
+                error = future.exception()
+        if error is not None and not pending:
+            raise error
+        self._count('deadline_exceeded')
+        raise ModelDeadlineExceeded(f"{site}: neither {plan['model']} nor {plan['economy']} answered within {plan['deadline']:.0f}s")
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats['latency'] = latency.summary()
+        return stats
@@ -0,0 +1,155 @@
+import sqlite3
+from collections import OrderedDict
+from contextlib import closing
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Set
+from .state import state_path
+from .tracing import tracer
+from .archive import pulse_key
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stream_progress (
+    run_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    done_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, key)
+);
+"""
+
+
+class StreamCheckpoint:
+    """
+    Items already enriched and persisted by a streaming run, keyed by run ID. A rerun with the
+    same ID skips them, so an interrupted backfill resumes at the first unfinished batch.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or state_path('pipeline_checkpoints.db')
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def done(self, run_id: str, keys: List[str]) -> Set[str]:
+        """The subset of keys already completed in this run."""
+        found: Set[str] = set()
+        with closing(self._connect()) as conn:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = conn.execute(f"SELECT key FROM stream_progress WHERE run_id = ? AND key IN ({', '.join('?' for _ in chunk)})",
+                                    [run_id] + chunk).fetchall()
+                found.update(r[0] for r in rows)
+        return found
+
+    def mark(self, run_id: str, keys: List[str]):
+        now = datetime.now(timezone.utc).isoformat()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany('INSERT OR REPLACE INTO stream_progress VALUES (?, ?, ?)', [(run_id, k, now) for k in keys])
+
+    def count(self, run_id: str) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute('SELECT COUNT(*) FROM stream_progress WHERE run_id = ?', (run_id,)).fetchone()[0]
+
+    def reset(self, run_id: str):
+        with closing(self._connect()) as conn, conn:
+            conn.execute('DELETE FROM stream_progress WHERE run_id = ?', (run_id,))
+
+
+def within_window(items: Iterable[Dict[str, Any]], cutoff: datetime) -> Iterator[Dict[str, Any]]:
+    from .agent import parse_date
+    return (item for item in items if parse_date(item.get('date', '')) >= cutoff)
+
+
+def dedupe(items: Iterable[Dict[str, Any]], max_recent: int = 10000) -> Iterator[Dict[str, Any]]:
+    """Drops repeats of recently seen items (bounded memory; older repeats are caught by the checkpoint)."""
+    recent: 'OrderedDict[str, None]' = OrderedDict()
+    for item in items:
+        key = pulse_key(item)
+        if key in recent:
+            continue
+        recent[key] = None
+        if len(recent) > max_recent:
+            recent.popitem(last=False)
+        yield item
+
+
+def batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class StreamingPipeline:
+    """
+    Constant-memory pulse pipeline: items stream from the fetchers through the window filter
+    and dedupe into fixed-size batches, and each batch is scored, enriched, persisted (vector
+    store and archive) and checkpointed before the next is read. Only one batch is held at a time.
+    """
+
+    def __init__(self, agent, run_id: str, batch_size: int = 25, checkpoint: StreamCheckpoint = None,
+                 upload_workers: int = 1):
+        self.agent = agent
+        self.run_id = run_id
+        self.batch_size = max(1, batch_size)
+        self.checkpoint = checkpoint or StreamCheckpoint()
+        self.upload_workers = upload_workers
+        self.stats = {'batches': 0, 'items': 0, 'skipped': 0, 'persisted': 0}
+
+    def process(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Scores, enriches, persists and checkpoints one batch; returns the items not done before."""
+        keys = [pulse_key(item) for item in batch]
+        done = self.checkpoint.done(self.run_id, keys)
+        todo = [item for item, key in zip(batch, keys) if key not in done]
+        self.stats['skipped'] += len(batch) - len(todo)
+        if not todo:
+            return []
+        agent = self.agent
+        with tracer.span('pipeline.batch', items=len(todo)):
+            if agent.client or agent.impact_model:
+                with tracer.span('agent.rank_by_impact', items=len(todo)):
+                    agent.score_impact(todo)
+            agent.enrich_items(todo)
+            if agent.vector_store.enabled:
+                agent.vector_store.upsert_pulses(todo, max_workers=self.upload_workers)
+                self.stats['persisted'] += len(todo)
+            agent._archive_pulses(todo)
+            # Only checkpointed once persisted: an interruption before this point redoes the batch
+            self.checkpoint.mark(self.run_id, [pulse_key(item) for item in todo])
+        self.stats['batches'] += 1
+        self.stats['items'] += len(todo)
+        return todo
+
+    def begin(self):
+        """Starts the run's ledger, routing stats and talk-track cache."""
+        agent = self.agent
+        agent.ledger.start_run()
+        agent.router.start_run()
+        if agent.client:
+            agent._talk_track_cache(refresh=True).start_run()
+
+    def finish(self) -> Dict[str, Any]:
+        """Releases the talk-track cache; returns run totals and the ledger."""
+        agent = self.agent
+        if agent.context_cache:
+            agent.context_cache.release()
+        return dict(self.stats, run_id=self.run_id, completed=self.checkpoint.count(self.run_id),
+                    ledger=agent.ledger.report())
+
+    def run(self, items: Iterable[Dict[str, Any]], on_batch: Callable[[List[Dict[str, Any]]], None] = None) -> Dict[str, Any]:
+        """Drains `items`, calling on_batch with each processed batch; returns run totals and the ledger."""
+        self.begin()
+        try:
+            for batch in batched(dedupe(items), self.batch_size):
+                processed = self.process(batch)
+                if processed and on_batch:
+                    on_batch(processed)
+        finally:
+            summary = self.finish()
+        return summary
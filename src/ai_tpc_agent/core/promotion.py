@@ -0,0 +1,45 @@
+from typing import Any, Dict, List
+from rich.panel import Panel
+from rich.markdown import Markdown
+
+
+def is_roadmap(item: Dict[str, Any]) -> bool:
+    return item.get('category') == 'roadmap' or 'release' in item.get('source', '')
+
+
+def business_summary(item: Dict[str, Any]) -> str:
+    """The stored business-audience summary, or the (truncated) technical summary for older snapshots."""
+    return item.get('business_summary') or (item.get('summary') or '')[:500]
+
+
+def render_promotion(console, snapshot: Dict[str, Any], days: int = 1, heading: str = None):
+    """
+    Prints the field promotion report for a synthesized pulse or a stored snapshot
+    ({'items', 'tldr'}). Pure rendering: everything shown was computed during synthesis.
+    """
+    from .agent import parse_date
+    items: List[Dict[str, Any]] = list(snapshot.get('items', []))
+    tldr = snapshot.get('tldr', '')
+    console.print(Panel.fit(f'🚀 [bold green]AI TPC AGENT: FIELD PROMOTION REPORT ({heading or f"Last {days} Days"})[/bold green]', border_style='green'))
+    if tldr:
+        console.print(Panel(tldr, title='🎯 Executive TLDR', border_style='yellow'))
+    if not items:
+        console.print(f'[yellow]No insights found ({heading}).[/yellow]' if heading else f'[yellow]No new insights found in the last {days} days.[/yellow]')
+        return
+    items.sort(key=lambda x: parse_date(x.get('date', '')), reverse=True)
+    console.print('\n🌉 [bold cyan]ROADMAP BRIDGE: FIELD TALK TRACKS[/bold cyan]')
+    for item in filter(is_roadmap, items):
+        panel_content = f"**Feature:** {item['title']}\n**Field Impact:** {item.get('bridge', '')}\n**Action:** [Open Documentation]({item.get('source_url', '#')})"
+        console.print(Panel(Markdown(panel_content), title=f"[{item.get('source', 'unknown').upper()}]", border_style='cyan'))
+    console.print('\n💡 [bold magenta]AI KNOWLEDGE & MARKET TRENDS[/bold magenta]')
+    for item in items:
+        if item.get('category') != 'roadmap':
+            render_trend_item(console, item)
+
+
+def render_trend_item(console, item: Dict[str, Any]):
+    title = item.get('title', 'Unknown Title')
+    source = item.get('description', item.get('source', 'Unknown Source'))
+    url = item.get('source_url', '#')
+    promotion_msg = f'### {title}\n*Source: {source}*\n\n**Actionable Insight:**\n{business_summary(item)}\n\n[🔗 Read Full Update]({url})\n---\n'
+    console.print(Markdown(promotion_msg))
@@ -0,0 +1,82 @@
+import os
+import re
+import json
+import time
+import threading
+import requests
+from typing import Any, Callable, Dict, Optional
+from .state import state_path
+from .tracing import tracer
+
+PYPI_JSON_URL = 'https://pypi.org/pypi/{name}/json'
+
+
+class PyPIMetadataCache:
+    """
+    ETag-aware on-disk cache for PyPI package metadata.
+    Only the extracted fields are stored (not the full JSON document). Entries younger
+    than `max_age_seconds` are served without a request; older ones are revalidated
+    with If-None-Match, and a 304 reuses the stored extraction.
+    """
+
+    def __init__(self, directory: str = None, max_age_seconds: float = 3600, session: requests.Session = None):
+        self.directory = directory or state_path('pypi')
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_age_seconds = max_age_seconds
+        self.session = session or requests.Session()
+        self.stats = {'fresh': 0, 'revalidated': 0, 'fetched': 0, 'stale': 0}
+        self._lock = threading.Lock()
+
+    def _path(self, package_name: str) -> str:
+        safe = re.sub(r'[^a-z0-9._-]', '_', package_name.lower())
+        return os.path.join(self.directory, f'{safe}.json')
+
+    def _count(self, outcome: str):
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def get(self, package_name: str, extract: Callable[[requests.Response], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Returns extract(response) for the package, from cache when possible.
+        Returns None when the package does not exist on PyPI.
+        """
+        path = self._path(package_name)
+        entry = None
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+        if entry and time.time() - entry.get('fetched_at', 0) < self.max_age_seconds:
+            self._count('fresh')
+            return entry['data']
+
+        headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else {}
+        try:
+            response = self.session.get(PYPI_JSON_URL.format(name=package_name), headers=headers, timeout=10, stream=True)
+        except requests.RequestException:
+            if entry:
+                self._count('stale')
+                return entry['data']
+            raise
+        with response:
+            if response.status_code == 304 and entry:
+                self._count('revalidated')
+                data = entry['data']
+            elif response.status_code == 200:
+                self._count('fetched')
+                data = extract(response)
+                tracer.add('bytes', int(response.headers.get('Content-Length') or 0))
+            elif response.status_code == 404:
+                return None
+            else:
+                response.raise_for_status()
+                return None
+            etag = response.headers.get('ETag', entry.get('etag') if entry else None)
+
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'etag': etag, 'fetched_at': time.time(), 'data': data}, f)
+        os.replace(tmp_path, path)
+        return data
@@ -0,0 +1,108 @@
+import re
+import numpy as np
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+# PEP 440 pre/dev segment: it must follow a release digit, and the one-letter
+# spellings need a number so build tags like '-cuda' or '-arm64' don't count
+PRERELEASE_RE = re.compile(
+    r'\d[-_.]?(?:(?:a|b|c|rc)\d+|(?:alpha|beta|rc|pre|preview|dev)(?:[-_.]?\d+)?(?![a-z]))', re.IGNORECASE)
+SECONDS_PER_DAY = 86400.0
+DAYS_PER_MONTH = 30.4375
+
+# Weights of the deterministic maturity score; they sum to 100
+SCORE_WEIGHTS = {'longevity': 25, 'stable_releases': 20, 'recency': 20, 'regularity': 15, 'stability': 10, 'hygiene': 10}
+TIERS = ((75, 'Enterprise Grade'), (50, 'Stable'), (0, 'Early Alpha'))
+
+
+def is_prerelease(version: str) -> bool:
+    return bool(PRERELEASE_RE.search(version.split('+')[0]))
+
+
+def release_cadence(releases: Sequence[Sequence[Any]], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Computes release-cadence statistics from (version, upload_time[, yanked]) entries,
+    as produced by read_pypi_document. All timing math runs as one vectorized pass.
+    """
+    now = now or datetime.now(timezone.utc)
+    versions = [r[0] for r in releases if len(r) > 1 and r[1]]
+    times = np.array([r[1][:19] for r in releases if len(r) > 1 and r[1]], dtype='datetime64[s]')
+    yanked = np.array([bool(r[2]) if len(r) > 2 else False for r in releases if len(r) > 1 and r[1]], dtype=bool)
+    prerelease = np.array([is_prerelease(v) for v in versions], dtype=bool)
+
+    order = np.argsort(times, kind='stable')
+    times, yanked, prerelease = times[order], yanked[order], prerelease[order]
+    now_s = np.datetime64(now.astimezone(timezone.utc).replace(tzinfo=None), 's')
+    n = len(times)
+    stats: Dict[str, Any] = {
+        'release_count': len(releases),
+        'dated_release_count': n,
+        'stable_release_count': int(n - prerelease.sum()),
+        'prerelease_ratio': float(prerelease.mean()) if n else 0.0,
+        'yanked_ratio': float(yanked.mean()) if n else 0.0,
+    }
+    if n == 0:
+        return dict(stats, age_days=0.0, days_since_last=None, releases_per_month=0.0,
+                    releases_last_year=0, interval_days={}, trend_slope=0.0)
+
+    # Days from now for every release (non-negative even with clock skew)
+    ages = np.maximum((now_s - times).astype('float64') / SECONDS_PER_DAY, 0.0)
+    intervals = np.diff(times).astype('float64') / SECONDS_PER_DAY
+    age_days = float(ages[0])
+    stats.update(
+        age_days=age_days,
+        days_since_last=float(ages[-1]),
+        releases_per_month=float(n / max(age_days / DAYS_PER_MONTH, 1.0)),
+        releases_last_year=int((ages <= 365).sum()),
+        interval_days=dict(zip(('p25', 'p50', 'p75', 'p90'), np.percentile(intervals, [25, 50, 75, 90]).round(2).tolist())) if n > 1 else {},
+        trend_slope=_monthly_trend(ages),
+    )
+    return stats
+
+
+def _monthly_trend(ages: np.ndarray, months: int = 12) -> float:
+    """Least-squares slope of releases per month over the trailing window (positive = accelerating)."""
+    counts, _ = np.histogram(ages, bins=months, range=(0, months * DAYS_PER_MONTH))
+    counts = counts[::-1]  # oldest month first
+    if counts.sum() < 2:
+        return 0.0
+    return round(float(np.polyfit(np.arange(months), counts, 1)[0]), 4)
+
+
+def maturity_score(cadence: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deterministic 0-100 maturity score derived from release cadence.
+    Returns {score, tier, components}.
+    """
+    w = SCORE_WEIGHTS
+    p50 = cadence.get('interval_days', {}).get('p50')
+    since_last = cadence.get('days_since_last')
+    components = {
+        # Two years of history earns full marks
+        'longevity': w['longevity'] * min(cadence.get('age_days', 0) / 730.0, 1.0),
+        'stable_releases': w['stable_releases'] * min(cadence.get('stable_release_count', 0) / 20.0, 1.0),
+        # Full marks when shipped within a quarter, nothing after a year of silence
+        'recency': 0.0 if since_last is None else w['recency'] * float(np.clip((365 - since_last) / 275.0, 0, 1)),
+        # Monthly cadence is ideal; weekly or twice-yearly score about half
+        'regularity': 0.0 if not p50 else w['regularity'] * float(np.clip(1 - abs(np.log10(max(p50, 0.01) / 30.0)) / 1.5, 0, 1)),
+        'stability': w['stability'] * (1 - cadence.get('prerelease_ratio', 0.0)),
+        'hygiene': w['hygiene'] * (1 - min(cadence.get('yanked_ratio', 0.0) * 5, 1.0)),
+    }
+    components = {k: round(v, 2) for k, v in components.items()}
+    score = round(sum(components.values()))
+    tier = next(label for floor, label in TIERS if score >= floor)
+    return {'score': score, 'tier': tier, 'components': components}
+
+
+def format_scorecard(cadence: Dict[str, Any], score: Dict[str, Any]) -> str:
+    """Short markdown scorecard used in reports and as context for model enrichment."""
+    intervals = cadence.get('interval_days') or {}
+    since_last = cadence.get('days_since_last')
+    return '\n'.join([
+        f"📈 MATURITY SCORE: {score['score']}/100 ({score['tier']})",
+        f"- Releases: {cadence['release_count']} ({cadence['stable_release_count']} stable, {cadence['releases_last_year']} in the last year)"
+        if 'releases_last_year' in cadence else f"- Releases: {cadence['release_count']}",
+        f"- Cadence: {cadence.get('releases_per_month', 0):.1f}/month, median gap {intervals['p50']:.0f} days" if intervals else '- Cadence: n/a',
+        f"- Last release: {since_last:.0f} days ago" if since_last is not None else '- Last release: n/a',
+        f"- Pre-release ratio: {cadence['prerelease_ratio']:.0%}, yanked: {cadence['yanked_ratio']:.0%}",
+    ])
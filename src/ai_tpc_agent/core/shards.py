@@ -0,0 +1,94 @@
+import os
+import json
+import gzip
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+ARTIFACT_VERSION = 1
+# Fields of a window item that the merge step needs (digest and TL;DR); keeps artifacts compact
+WINDOW_FIELDS = ('id', 'title', 'source', 'category', 'date', 'summary')
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """'i/N' (1-based, as in a CI matrix) to (index, count)."""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}': expected i/N, e.g. 2/4")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}': i must be between 1 and N")
+    return index, count
+
+
+def select_shard(sources: Dict[str, Dict[str, Any]], index: int, count: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Sources owned by shard index/count: names sorted and dealt round-robin, so every shard of the
+    same watchlist gets a disjoint, balanced set regardless of which runner evaluates it.
+    """
+    names = sorted(sources)
+    return {name: sources[name] for name in names[index - 1::count]}
+
+
+def compact_window(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{k: item[k] if k != 'summary' else (item[k] or '')[:200] for k in WINDOW_FIELDS if k in item} for item in items]
+
+
+def write_artifact(path: str, shard: Tuple[int, int], days: int, synthesized: Dict[str, Any]) -> str:
+    """Gzipped JSON of a shard's enriched items, compact window and ledger."""
+    payload = {
+        'version': ARTIFACT_VERSION,
+        'shard': list(shard),
+        'days': days,
+        'created': datetime.now(timezone.utc).isoformat(),
+        'items': synthesized.get('items', []),
+        'window': synthesized.get('window', []),
+        'ledger': synthesized.get('ledger', {}),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f'{path}.tmp'
+    with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+        json.dump(payload, f, separators=(',', ':'))
+    os.replace(tmp, path)
+    return path
+
+
+def read_artifacts(paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Loads shard artifacts and checks they come from one split: same N, no index twice.
+    Missing shards only produce a warning entry ('missing'), so a failed runner does not block delivery.
+    """
+    shards = []
+    for path in paths:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            artifact = json.load(f)
+        if artifact.get('version') != ARTIFACT_VERSION:
+            raise ValueError(f"{path}: unsupported shard artifact version {artifact.get('version')}")
+        shards.append(artifact)
+    counts = {s['shard'][1] for s in shards}
+    if len(counts) > 1:
+        raise ValueError(f'Shard artifacts come from different splits: N = {sorted(counts)}')
+    indexes = [s['shard'][0] for s in shards]
+    if len(set(indexes)) != len(indexes):
+        raise ValueError(f'Duplicate shard artifacts: {sorted(indexes)}')
+    if shards:
+        missing = sorted(set(range(1, counts.pop() + 1)) - set(indexes))
+        for s in shards:
+            s['missing'] = missing
+    return shards
+
+
+def _scan_shard(job: Tuple[int, int, int, str, str]) -> str:
+    """Process-pool entry point: one shard's browse + synthesis written to its artifact."""
+    index, count, days, out_dir, project = job
+    from .agent import TPCAgent
+    agent = TPCAgent(project_id=project)
+    synthesized = agent.synthesize_shard(agent.browse_knowledge(days=days, shard=(index, count)))
+    return write_artifact(os.path.join(out_dir, f'shard-{index}-of-{count}.json.gz'), (index, count), days, synthesized)
+
+
+def run_local_shards(count: int, days: int, out_dir: str, project: str, workers: int = None) -> List[str]:
+    """Runs every shard of a count-way split in a local process pool; returns the artifact paths."""
+    jobs = [(i, count, days, out_dir, project) for i in range(1, count + 1)]
+    with ProcessPoolExecutor(max_workers=workers or count) as pool:
+        return list(pool.map(_scan_shard, jobs))
@@ -0,0 +1,130 @@
+import time
+import queue
+import smtplib
+import threading
+from typing import List, Dict, Optional
+from .rate_limiter import RateLimiter
+from .tracing import tracer, record_retry
+
+
+class SMTPDeliveryPool:
+    """
+    Delivers one pre-serialized message to many recipients over a small pool of
+    authenticated SMTP connections. Each connection does a single STARTTLS/login
+    handshake and is reused for every recipient it handles; sends are rate limited
+    across the pool and retried per recipient with exponential backoff.
+    """
+
+    def __init__(self, host: str, port: int, username: str, password: Optional[str] = None,
+                 pool_size: int = 2, rate_per_second: float = 5.0, max_attempts: int = 3,
+                 backoff_seconds: float = 1.0, use_starttls: bool = True, timeout: float = 15):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.pool_size = max(1, pool_size)
+        self.rate_limiter = RateLimiter(rate_per_second, burst=self.pool_size)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.use_starttls = use_starttls
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._stats_lock = threading.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_starttls:
+                server.starttls()
+            if self.password:
+                server.login(self.username, self.password)
+        except (smtplib.SMTPException, OSError):
+            _close(server)
+            raise
+        with self._stats_lock:
+            self.connections_opened += 1
+        return server
+
+    def deliver(self, envelope_from: str, message: bytes, recipients: List[str]) -> Dict[str, str]:
+        """
+        Sends `message` (headers without To, CRLF line endings) to each recipient, prefixing a
+        per-recipient To header. Returns {recipient: 'sent' | 'failed: <reason>'}.
+        """
+        work: "queue.Queue[str]" = queue.Queue()
+        for recipient in recipients:
+            work.put(recipient)
+        results: Dict[str, str] = {}
+        # Set on a login failure: every further connection would fail the same way (and risk a lockout)
+        auth_failed: Dict[str, str] = {}
+        workers = [threading.Thread(target=tracer.bind(self._worker), args=(envelope_from, message, work, results, auth_failed), daemon=True)
+                   for _ in range(min(self.pool_size, len(recipients)))]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        for recipient in recipients:
+            if recipient not in results:
+                results[recipient] = f"failed: not attempted ({auth_failed.get('error', 'pool stopped')})"
+        return results
+
+    def _worker(self, envelope_from: str, message: bytes, work: "queue.Queue[str]", results: Dict[str, str],
+                auth_failed: Dict[str, str]):
+        with tracer.span('smtp.connection'):
+            self._drain(envelope_from, message, work, results, auth_failed)
+
+    def _drain(self, envelope_from: str, message: bytes, work: "queue.Queue[str]", results: Dict[str, str],
+               auth_failed: Dict[str, str]):
+        server = None
+        try:
+            while not auth_failed:
+                try:
+                    recipient = work.get_nowait()
+                except queue.Empty:
+                    return
+                results[recipient] = 'failed: not attempted'
+                for attempt in range(1, self.max_attempts + 1):
+                    try:
+                        if server is None:
+                            server = self._connect()
+                        self.rate_limiter.acquire()
+                        server.sendmail(envelope_from, [recipient], f'To: {recipient}\r\n'.encode('utf-8') + message)
+                        tracer.add('messages')
+                        results[recipient] = 'sent'
+                        break
+                    except smtplib.SMTPRecipientsRefused as e:
+                        # Permanent for this address; the connection is still usable
+                        results[recipient] = f'failed: {e.recipients.get(recipient, e)}'
+                        break
+                    except smtplib.SMTPAuthenticationError as e:
+                        results[recipient] = f'failed: {e.smtp_code} {e.smtp_error!r}'
+                        auth_failed.setdefault('error', f'authentication failed: {e.smtp_code}')
+                        return
+                    except smtplib.SMTPResponseException as e:
+                        results[recipient] = f'failed: {e.smtp_code} {e.smtp_error!r}'
+                        if e.smtp_code >= 500:
+                            break
+                        server = _close(server)
+                        if attempt < self.max_attempts:
+                            record_retry()
+                            time.sleep(self.backoff_seconds * (2 ** (attempt - 1)))
+                    except (smtplib.SMTPException, OSError) as e:
+                        results[recipient] = f'failed: {e}'
+                        server = _close(server)
+                        if attempt < self.max_attempts:
+                            record_retry()
+                            time.sleep(self.backoff_seconds * (2 ** (attempt - 1)))
+        finally:
+            if server is not None:
+                try:
+                    server.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+
+
+def _close(server: Optional[smtplib.SMTP]) -> None:
+    if server is not None:
+        try:
+            server.close()
+        except OSError:
+            pass
+    return None
@@ -0,0 +1,14 @@
+import os
+
+DEFAULT_STATE_DIR = '.tpc_state'
+
+
+def state_path(*parts: str) -> str:
+    """
+    Resolves a path inside the local agent state directory (journals, caches, archives).
+    The directory defaults to ./.tpc_state and can be moved with TPC_STATE_DIR.
+    """
+    base = os.environ.get('TPC_STATE_DIR', DEFAULT_STATE_DIR)
+    path = os.path.join(base, *parts)
+    os.makedirs(os.path.dirname(path) if parts else path, exist_ok=True)
+    return path
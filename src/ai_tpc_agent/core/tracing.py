@@ -0,0 +1,271 @@
+import os
+import json
+import time
+import threading
+import functools
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from .metrics import MODEL_CALLS, MODEL_CALL_SECONDS, MODEL_TOKENS
+
+# Numeric span attributes summed per stage in the profile table
+COUNTERS = ('retries', 'bytes', 'input_tokens', 'output_tokens')
+
+
+class Span:
+    """A timed unit of work. Numeric attributes are accumulated with add()."""
+
+    __slots__ = ('name', 'start', 'duration', 'thread', 'depth', 'attrs')
+
+    def __init__(self, name: str, depth: int, attrs: Dict[str, Any]):
+        self.name = name
+        self.depth = depth
+        self.attrs = attrs
+        self.thread = threading.get_ident()
+        self.start = time.perf_counter()
+        self.duration = 0.0
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def add(self, key: str, value: float = 1):
+        self.attrs[key] = self.attrs.get(key, 0) + value
+
+
+class _NullSpan:
+    def set(self, **attrs):
+        pass
+
+    def add(self, key: str, value: float = 1):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Lightweight span recorder for pulse runs. Disabled by default, in which case
+    span() costs one attribute check; enable() starts collecting wall time per
+    stage and call together with retries, bytes fetched and model tokens.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def enable(self):
+        self.reset()
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self.spans = []
+        self._origin = time.perf_counter()
+
+    def _stack(self) -> List[Span]:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Span]:
+        if not self.enabled:
+            yield NULL_SPAN
+            return
+        stack = self._stack()
+        span = Span(name, stack[-1].depth + 1 if stack else 0, attrs)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=type(e).__name__)
+            raise
+        finally:
+            span.duration = time.perf_counter() - span.start
+            stack.pop()
+            with self._lock:
+                self.spans.append(span)
+
+    def current(self):
+        """Innermost open span on this thread (a no-op span when tracing is off)."""
+        stack = self._stack() if self.enabled else None
+        return stack[-1] if stack else NULL_SPAN
+
+    def bind(self, fn: Callable) -> Callable:
+        """
+        Wraps fn to run under the caller's innermost span, so spans a worker thread opens
+        nest beneath the stage that submitted the work instead of becoming top-level stages.
+        """
+        parent = self.current()
+        if parent is NULL_SPAN:
+            return fn
+
+        @functools.wraps(fn)
+        def run(*args, **kwargs):
+            stack = self._stack()
+            stack.append(parent)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                stack.pop()
+        return run
+
+    def add(self, key: str, value: float = 1):
+        """Adds to a counter on the innermost open span."""
+        self.current().add(key, value)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-stage aggregates in order of first occurrence."""
+        stages: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        for span in spans:
+            stage = stages.setdefault(span.name, dict({'stage': span.name, 'depth': span.depth, 'calls': 0, 'total_seconds': 0.0,
+                                                        'max_seconds': 0.0, 'errors': 0}, **{c: 0 for c in COUNTERS}))
+            stage['calls'] += 1
+            stage['total_seconds'] += span.duration
+            stage['max_seconds'] = max(stage['max_seconds'], span.duration)
+            stage['errors'] += 'error' in span.attrs
+            for counter in COUNTERS:
+                stage[counter] += span.attrs.get(counter, 0)
+        return list(stages.values())
+
+    def export_json(self, path: str):
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        payload = {
+            'summary': self.summary(),
+            'spans': [{'name': s.name, 'start_seconds': s.start - self._origin, 'duration_seconds': s.duration,
+                       'thread': s.thread, 'depth': s.depth, 'attrs': s.attrs} for s in spans],
+        }
+        _write_json(path, payload)
+
+    def export_chrome_trace(self, path: str):
+        """Writes the Trace Event Format understood by chrome://tracing and Perfetto."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        events = [{'name': s.name, 'cat': s.name.split('.')[0], 'ph': 'X', 'pid': os.getpid(), 'tid': s.thread,
+                   'ts': round((s.start - self._origin) * 1e6, 1), 'dur': round(s.duration * 1e6, 1),
+                   'args': {k: v for k, v in s.attrs.items() if isinstance(v, (str, int, float, bool))}} for s in spans]
+        _write_json(path, {'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+
+def _write_json(path: str, payload: Dict[str, Any]):
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, default=str)
+
+
+tracer = Tracer()
+
+
+def traced(name: str) -> Callable:
+    """Decorator recording every call of the function as a span named `name`."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_retry(retry_state=None):
+    """tenacity before_sleep hook; also usable directly from hand-rolled retry loops."""
+    tracer.add('retries')
+
+
+def record_usage(span, response, model: str = None):
+    """Copies token counts from a Gemini response's usage metadata onto the span and token counters."""
+    usage = getattr(response, 'usage_metadata', None)
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, 'prompt_token_count', None)
+    output_tokens = getattr(usage, 'candidates_token_count', None)
+    if isinstance(prompt_tokens, int):
+        span.add('input_tokens', prompt_tokens)
+        MODEL_TOKENS.inc(prompt_tokens, model=model, direction='input')
+    if isinstance(output_tokens, int):
+        span.add('output_tokens', output_tokens)
+        MODEL_TOKENS.inc(output_tokens, model=model, direction='output')
+
+
+class _TracedModels:
+    def __init__(self, models):
+        self._models = models
+
+    def __getattr__(self, name):
+        return getattr(self._models, name)
+
+    def generate_content(self, *args, **kwargs):
+        return self._call('generate_content', *args, **kwargs)
+
+    def generate_image(self, *args, **kwargs):
+        return self._call('generate_image', *args, **kwargs)
+
+    def _call(self, method: str, *args, **kwargs):
+        model = kwargs.get('model')
+        start = time.perf_counter()
+        outcome = 'error'
+        try:
+            with tracer.span(f'model.{method}', model=model) as span:
+                response = getattr(self._models, method)(*args, **kwargs)
+                record_usage(span, response, model)
+                outcome = 'ok'
+                return response
+        finally:
+            MODEL_CALLS.inc(model=model, outcome=outcome)
+            MODEL_CALL_SECONDS.observe(time.perf_counter() - start, model=model)
+
+
+class TracedClient:
+    """Wraps a genai.Client so every model call is recorded as a span and in the call/latency/token metrics."""
+
+    def __init__(self, client):
+        self._client = client
+        self.models = _TracedModels(client.models)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def render_profile(console, wall_seconds: Optional[float] = None):
+    """Prints the per-stage profile table."""
+    from rich.table import Table
+    rows = tracer.summary()
+    if not rows:
+        console.print('[dim]No spans recorded.[/dim]')
+        return
+    wall = wall_seconds or max(r['total_seconds'] for r in rows if r['depth'] == 0)
+    table = Table(title=f'Pulse Profile ({wall:.2f}s wall)')
+    table.add_column('Stage', style='cyan')
+    table.add_column('Calls', justify='right')
+    table.add_column('Total s', justify='right')
+    table.add_column('Mean ms', justify='right')
+    table.add_column('Max ms', justify='right')
+    table.add_column('% wall', justify='right')
+    table.add_column('Retries', justify='right')
+    table.add_column('Bytes', justify='right')
+    table.add_column('Tokens in/out', justify='right')
+    for r in rows:
+        table.add_row(
+            '  ' * r['depth'] + r['stage'] + (f" [red]({r['errors']} err)[/red]" if r['errors'] else ''),
+            str(r['calls']),
+            f"{r['total_seconds']:.3f}",
+            f"{r['total_seconds'] / r['calls'] * 1000:.1f}",
+            f"{r['max_seconds'] * 1000:.1f}",
+            f"{r['total_seconds'] / wall * 100:.1f}" if wall else '-',
+            str(r['retries'] or '-'),
+            f"{r['bytes']:,}" if r['bytes'] else '-',
+            f"{r['input_tokens']:,}/{r['output_tokens']:,}" if r['input_tokens'] or r['output_tokens'] else '-',
+        )
+    console.print(table)
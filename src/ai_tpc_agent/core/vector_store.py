@@ -1,17 +1,23 @@
 from typing import Literal
 import os
-from typing import List, Dict, Any, Optional
+import tempfile
+from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime
 import json
 import vertexai
 from vertexai.preview import rag
 from vertexai.preview.rag import RagCorpus, RagFile
+from .ingestion import IngestionJobManager, IngestionJournal, MAX_IMPORT_BATCH
+import time
+from .tracing import traced, tracer
+from .metrics import VECTOR_QUERY_SECONDS
 
 class TPCVectorStore:
     def __init__(self, project_id: str = "project-maui", location: str = "us-east1"):
         self.project_id = os.environ.get("GOOGLE_CLOUD_PROJECT", project_id)
         self.location = os.environ.get("GOOGLE_CLOUD_REGION", location)
         self.enabled = False
+        self._write_listeners: List[Callable[[], None]] = []
         
         try:
             vertexai.init(project=self.project_id, location=self.location)
@@ -40,18 +46,37 @@ class TPCVectorStore:
             description="Historical TPC Pulse updates for RAG retrieval"
         )
 
-    def upsert_pulses(self, pulses: List[Dict[str, Any]]):
+    def on_write(self, listener: Callable[[], None]):
+        """Registers a callback fired after pulses or documents are written to the corpus."""
+        self._write_listeners.append(listener)
+
+    def _notify_write(self):
+        for listener in self._write_listeners:
+            listener()
+
+    @traced('vector_store.upsert')
+    def upsert_pulses(self, pulses: List[Dict[str, Any]], max_workers: int = 1):
         """
         Stores pulses into the Vertex AI RAG Engine.
+        One file per pulse; bulk loads (backfills) upload up to max_workers files at a time.
         """
         if not pulses:
             return
 
-        for pulse in pulses:
-            pulse_id = pulse.get('id') or f"{pulse.get('source')}_{pulse.get('title')}_{pulse.get('date', datetime.now().isoformat())}"
-            filename = "".join([c if c.isalnum() or c in "._-" else "_" for c in pulse_id]) + ".txt"
-            
-            doc_text = f"""Title: {pulse['title']}
+        if max_workers > 1 and len(pulses) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pulses))) as pool:
+                list(pool.map(tracer.bind(self._upload_pulse), pulses))
+        else:
+            for pulse in pulses:
+                self._upload_pulse(pulse)
+        self._notify_write()
+
+    def _upload_pulse(self, pulse: Dict[str, Any]):
+        pulse_id = pulse.get('id') or f"{pulse.get('source')}_{pulse.get('title')}_{pulse.get('date', datetime.now().isoformat())}"
+        filename = "".join([c if c.isalnum() or c in "._-" else "_" for c in pulse_id]) + ".txt"
+
+        doc_text = f"""Title: {pulse['title']}
 Source: {pulse['source']}
 Category: {pulse.get('category', 'general')}
 Date: {pulse.get('date', '')}
@@ -62,33 +87,39 @@ Summary: {pulse.get('summary', '')}
 
 Bridge: {pulse.get('bridge', '')}
 """
-            
-            temp_path = f"/tmp/{filename}"
-            with open(temp_path, "w") as f:
-                f.write(doc_text)
-            
-            try:
-                # Upload to RAG Engine
-                rag.upload_file(
-                    corpus_name=self.corpus.name,
-                    path=temp_path,
-                    display_name=filename
-                )
-            except Exception as e:
-                print(f"Warning: Could not upload {filename}: {e}")
-            finally:
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
 
+        # Unique per upload: parallel uploads (and concurrent shard processes) may share a pulse ID
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write(doc_text)
+            temp_path = f.name
+
+        try:
+            # Upload to RAG Engine
+            rag.upload_file(
+                corpus_name=self.corpus.name,
+                path=temp_path,
+                display_name=filename
+            )
+        except Exception as e:
+            print(f"Warning: Could not upload {filename}: {e}")
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @traced('vector_store.query')
     def query(self, text: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """
         Queries the Vertex AI RAG Engine for relevant pulses.
         """
-        response = rag.retrieval_query(
-            text=text,
-            rag_corpora=[self.corpus.name],
-            similarity_top_k=n_results
-        )
+        start = time.perf_counter()
+        try:
+            response = rag.retrieval_query(
+                text=text,
+                rag_corpora=[self.corpus.name],
+                similarity_top_k=n_results
+            )
+        finally:
+            VECTOR_QUERY_SECONDS.observe(time.perf_counter() - start)
         
         pulses = []
         if response.contexts and response.contexts.contexts:
@@ -108,26 +139,26 @@ Bridge: {pulse.get('bridge', '')}
         """Lists files in the corpus."""
         return rag.list_files(corpus_name=self.corpus.name)
 
-    def ingest_uris(self, uris: List[str]):
+    @traced('vector_store.ingest')
+    def ingest_uris(self, uris: List[str], batch_size: int = MAX_IMPORT_BATCH, max_concurrency: int = 4, journal_path: str = None) -> Dict[str, Any]:
         """
         Ingests documents from Google Drive or GCS into the RAG corpus.
         Specifically supports Slides, Docs, and Sheets via Google Drive URLs.
+        URIs are imported in bounded batches and journaled so reruns skip completed sources.
         """
         if not uris:
             return
         
         print(f"📥 Starting ingestion for {len(uris)} URIs into {self.corpus_display_name}...")
-        try:
-            # Vertex RAG Engine's import_files handles Drive URLs automatically
-            # if they start with https://drive.google.com/
-            response = rag.import_files(
-                corpus_name=self.corpus.name,
-                paths=uris,
-                chunk_size=1024,
-                chunk_overlap=200
-            )
-            print(f"✅ Ingestion task started. Import ID: {response.name}")
-            return response
-        except Exception as e:
-            print(f"❌ Ingestion failed: {e}")
-            raise e
+        # Vertex RAG Engine's import_files handles Drive URLs automatically
+        # if they start with https://drive.google.com/
+        manager = IngestionJobManager(
+            corpus_name=self.corpus.name,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            journal=IngestionJournal(journal_path)
+        )
+        summary = manager.run(uris)
+        if summary['documents']:
+            self._notify_write()
+        return summary
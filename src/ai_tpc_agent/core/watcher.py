@@ -5,6 +5,7 @@ import re
 from typing import Dict, List, Optional
 from datetime import datetime, timezone
 import os
+from .tracing import tracer, record_retry
 
 def clean_version(v_str: str) -> str:
     match = re.search('(\\d+\\.\\d+(?:\\.\\d+)?(?:[a-zA-Z]+\\d+)?)', v_str)
@@ -23,7 +24,7 @@ def parse_html_date(date_str: str) -> Optional[datetime]:
             continue
     return None
 
-@retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3))
+@retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3), before_sleep=record_retry)
 def fetch_recent_updates(url: str, max_items: int = 5) -> List[Dict[str, str]]:
     """
     Fetches the most recent updates from an Atom, RSS, or HTML page.
@@ -39,13 +40,44 @@ def fetch_recent_updates(url: str, max_items: int = 5) -> List[Dict[str, str]]:
     # Fallback to HTML if RSS fails or if it's an HTML page
     return _fetch_from_html(url, max_items)
 
-def _fetch_from_feed(url: str, max_items: int = 5) -> List[Dict[str, str]]:
+# GitHub release feeds serve 10 entries per page and take ?page=N; other feeds are one document
+GITHUB_RELEASES_FEED = re.compile(r'^https://github\.com/[^/]+/[^/]+/releases\.atom$')
+# Cap on entries read from a single (unpaged) feed or HTML page during a history backfill
+HISTORY_PAGE_LIMIT = 500
+
+
+def is_paged_feed(url: str) -> bool:
+    return bool(GITHUB_RELEASES_FEED.match(url))
+
+
+@retry(wait=wait_exponential(multiplier=1, min=2, max=10), stop=stop_after_attempt(3), before_sleep=record_retry)
+def fetch_history_page(url: str, page: int = 1) -> List[Dict[str, str]]:
+    """
+    One page of a source's full history, oldest entries on the highest page. Network errors raise
+    (so a backfill can retry the page); an empty list means the history is exhausted.
+    """
+    if is_paged_feed(url):
+        return _fetch_from_feed(f'{url}?page={page}', max_items=None, strict=True)
+    if page > 1:
+        return []
+    # Unpaged sources: same feed-then-HTML fallback as fetch_recent_updates, but errors propagate
+    if any(url.lower().endswith(ext) for ext in ['.xml', '.atom', '.rss']):
+        try:
+            items = _fetch_from_feed(url, HISTORY_PAGE_LIMIT, strict=True)
+            if items:
+                return items
+        except ET.ParseError:
+            pass
+    return _fetch_from_html(url, HISTORY_PAGE_LIMIT, strict=True)
+
+def _fetch_from_feed(url: str, max_items: Optional[int] = 5, strict: bool = False) -> List[Dict[str, str]]:
     updates = []
     try:
         req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
         with urllib.request.urlopen(req, timeout=10) as response:
-            tree = ET.parse(response)
-            root = tree.getroot()
+            data = response.read()
+            tracer.add('bytes', len(data))
+            root = ET.fromstring(data)
             ns_match = re.match(r'\{(.*)\}', root.tag)
             ns = {'ns': ns_match.group(1)} if ns_match else {}
             
@@ -101,15 +133,18 @@ def _fetch_from_feed(url: str, max_items: int = 5) -> List[Dict[str, str]]:
                     })
                 return updates
     except Exception:
-        pass
+        if strict:
+            raise
     return []
 
-def _fetch_from_html(url: str, max_items: int = 5) -> List[Dict[str, str]]:
+def _fetch_from_html(url: str, max_items: int = 5, strict: bool = False) -> List[Dict[str, str]]:
     updates = []
     try:
         req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
         with urllib.request.urlopen(req, timeout=15) as response:
-            content = response.read().decode('utf-8')
+            raw = response.read()
+            tracer.add('bytes', len(raw))
+            content = raw.decode('utf-8')
             
             # Identify date headers or meta dates
             date_pattern = r'([A-Z][a-z]+\s+\d{1,2},\s+\d{4})'
@@ -163,6 +198,8 @@ def _fetch_from_html(url: str, max_items: int = 5) -> List[Dict[str, str]]:
                 if len(updates) >= max_items: break
         return updates
     except Exception:
+        if strict:
+            raise
         return []
 
 def fetch_latest_from_atom(url: str) -> Optional[Dict[str, str]]:
@@ -6,60 +6,193 @@ from .core.agent import TPCAgent
 from .core.chat_bridge import GoogleChatBridge
 from .core.email_bridge import EmailBridge
 from .core.github_bridge import GitHubBridge
+from .core.tracing import tracer, render_profile
 app = typer.Typer(help='AI TPC Agent: Browsing and Promoting AI Knowledge')
 
+@app.callback()
+def main(ctx: typer.Context,
+         profile: bool = typer.Option(False, "--profile", envvar="TPC_PROFILE", help="Time every pipeline stage and print a profile table"),
+         profile_output: Optional[str] = typer.Option(None, "--profile-output", help="Also write the profile to this file (implies --profile)"),
+         profile_format: str = typer.Option("json", "--profile-format", help="json (summary + spans) or chrome (chrome://tracing / Perfetto)")):
+    """AI TPC Agent: Browsing and Promoting AI Knowledge"""
+    if not (profile or profile_output):
+        return
+    if profile_format not in ('json', 'chrome'):
+        typer.echo('Error: --profile-format must be json or chrome.')
+        raise typer.Exit(code=1)
+    tracer.enable()
+    root = tracer.span(f'cli.{ctx.invoked_subcommand}')
+    root_span = root.__enter__()
+
+    def finish():
+        root.__exit__(None, None, None)
+        tracer.disable()
+        from rich.console import Console
+        render_profile(Console(), wall_seconds=root_span.duration)
+        if profile_output:
+            export = tracer.export_chrome_trace if profile_format == 'chrome' else tracer.export_json
+            export(profile_output)
+            typer.echo(f'📊 Profile written to {profile_output}')
+    ctx.call_on_close(finish)
+
+def _load_or_synthesize(agent: TPCAgent, days: int, pulse: Optional[str] = None, business_summary: bool = False):
+    """
+    A merged pulse written by `merge --out`, or a fresh scan and synthesis of the last `days` days.
+    business_summary: the caller renders the promotion report (report), so compute its trend summaries.
+    """
+    if pulse:
+        import json
+        with open(pulse, 'r') as f:
+            return json.load(f)
+    return agent.synthesize_reports(agent.browse_knowledge(days=days), business_summary=business_summary)
+
 @app.command()
 def report(days: int=typer.Option(1, '--days', '-d', help='Number of days to look back'), 
            project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
-           infographic: bool = typer.Option(False, "--infographic", help="Generate a visual pulse infographic")):
+           infographic: bool = typer.Option(False, "--infographic", help="Generate a visual pulse infographic"),
+           pulse: Optional[str] = typer.Option(None, "--pulse", help="Use a merged pulse file (tpc-agent merge --out) instead of scanning"),
+           token_budget: int = typer.Option(0, "--token-budget", envvar="TPC_TOKEN_BUDGET", help="Max model tokens per pulse; remaining items fall back to keyword talk tracks"),
+           time_budget: float = typer.Option(0, "--time-budget", envvar="TPC_TIME_BUDGET_SECONDS", help="Max seconds of synthesis per pulse before falling back to keyword talk tracks"),
+           stream: bool = typer.Option(False, "--stream", help="Process the window in checkpointed batches with bounded memory (no top-20 cut or TL;DR)"),
+           batch_size: int = typer.Option(25, "--batch-size", help="Items per streamed batch"),
+           max_pages: int = typer.Option(50, "--max-pages", help="With --stream: page limit per paged feed (GitHub releases: 10 per page)"),
+           run_id: Optional[str] = typer.Option(None, "--run-id", help="Checkpoint name for --stream; rerun with the same ID to resume (default: per day and window)")):
     """Generate the AI Field Promotion Report locally."""
-    agent = TPCAgent(project_id=project)
-    knowledge = agent.browse_knowledge()
-    from .core.agent import parse_date
-    from datetime import datetime, timedelta, timezone
-    now = datetime.now(timezone.utc)
-    cutoff = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
-    filtered = [item for item in knowledge if parse_date(item.get('date', '')) >= cutoff]
-    synthesized = agent.synthesize_reports(filtered)
-    
+    agent = TPCAgent(project_id=project, token_budget=token_budget, time_budget_seconds=time_budget)
+    if stream:
+        from datetime import date
+        from rich.console import Console
+        from .core.promotion import render_promotion
+        from .core.ledger import render_ledger
+        console = Console()
+        batches = [0]
+
+        def show(batch):
+            batches[0] += 1
+            render_promotion(console, {'items': batch}, heading=f'Batch {batches[0]}')
+
+        summary = agent.stream_reports(days, run_id or f'report-{days}d-{date.today().isoformat()}', batch_size=batch_size, on_batch=show,
+                                       max_pages=max_pages)
+        typer.echo(f"✅ Streamed {summary['items']} updates in {summary['batches']} batches "
+                   f"({summary['skipped']} already done in run '{summary['run_id']}').")
+        if summary['ledger']['calls']:
+            render_ledger(console, summary['ledger'])
+        return
+    synthesized = _load_or_synthesize(agent, days, pulse, business_summary=True)
+
     if infographic:
         agent.generate_infographic(synthesized)
         
     agent.promote_learnings(synthesized, days=days)
+    if synthesized.get('ledger', {}).get('calls'):
+        from rich.console import Console
+        from .core.ledger import render_ledger
+        render_ledger(Console(), synthesized['ledger'])
+
+@app.command()
+def scan(shard: str = typer.Option(..., "--shard", help="This worker's part of the watchlist as i/N (1-based)"),
+         out: Optional[str] = typer.Option(None, "--out", help="Artifact path (default: shards/shard-i-of-N.json.gz)"),
+         days: int = typer.Option(1, '--days', '-d', help='Number of days to look back'),
+         project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
+         token_budget: int = typer.Option(0, "--token-budget", envvar="TPC_TOKEN_BUDGET", help="Max model tokens for this shard"),
+         time_budget: float = typer.Option(0, "--time-budget", envvar="TPC_TIME_BUDGET_SECONDS", help="Max seconds of synthesis for this shard")):
+    """Scan and enrich one shard of the watchlist into a compact artifact for `merge`."""
+    from .core.shards import parse_shard, write_artifact
+    try:
+        index, count = parse_shard(shard)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint='--shard')
+    agent = TPCAgent(project_id=project, token_budget=token_budget, time_budget_seconds=time_budget)
+    synthesized = agent.synthesize_shard(agent.browse_knowledge(days=days, shard=(index, count)))
+    path = write_artifact(out or os.path.join('shards', f'shard-{index}-of-{count}.json.gz'), (index, count), days, synthesized)
+    typer.echo(f"🧩 Shard {index}/{count}: {len(synthesized['items'])} enriched of {len(synthesized['window'])} updates -> {path}")
+
+@app.command()
+def merge(artifacts: Optional[List[str]] = typer.Argument(None, help="Shard artifacts written by `scan`"),
+          local: int = typer.Option(0, "--local", help="Run an N-way split in a local process pool first, instead of reading artifacts"),
+          out_dir: str = typer.Option("shards", "--out-dir", help="Where --local writes its shard artifacts"),
+          out: Optional[str] = typer.Option(None, "--out", help="Write the merged pulse here for chat/email/github --pulse"),
+          days: int = typer.Option(1, '--days', '-d', help='Number of days to look back (with --local)'),
+          project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
+          token_budget: int = typer.Option(0, "--token-budget", envvar="TPC_TOKEN_BUDGET", help="Max model tokens for the merge (TL;DR and battlecard)"),
+          time_budget: float = typer.Option(0, "--time-budget", envvar="TPC_TIME_BUDGET_SECONDS", help="Max seconds for the merge")):
+    """Combine shard artifacts, rank globally and render the report once."""
+    from .core.shards import read_artifacts, run_local_shards
+    if local:
+        artifacts = run_local_shards(local, days, out_dir, project)
+    if not artifacts:
+        typer.echo('Error: Provide shard artifacts or --local N.')
+        raise typer.Exit(code=1)
+    try:
+        shards = read_artifacts(artifacts)
+    except (ValueError, OSError) as e:
+        # OSError: missing or corrupt files, e.g. an unexpanded shards/*.json.gz when every shard failed
+        typer.echo(f'Error: {e}')
+        raise typer.Exit(code=1)
+    if shards and shards[0]['missing']:
+        typer.echo(f"⚠️  Missing shard(s) {shards[0]['missing']} of {shards[0]['shard'][1]}; their sources are not in this pulse.")
+    agent = TPCAgent(project_id=project, token_budget=token_budget, time_budget_seconds=time_budget)
+    synthesized = agent.merge_shards(shards, business_summary=True)
+    if out:
+        import json
+        with open(out, 'w') as f:
+            json.dump(synthesized, f, default=str)
+        typer.echo(f'📦 Merged pulse written to {out}')
+    agent.promote_learnings(synthesized, days=max(s.get('days', days) for s in shards) if shards else days)
+    if synthesized.get('ledger', {}).get('calls'):
+        from rich.console import Console
+        from .core.ledger import render_ledger
+        render_ledger(Console(), synthesized['ledger'])
 
 @app.command()
-def chat(webhook_url: str=typer.Option(None, '--webhook-url', envvar='GCHAT_WEBHOOK_URL', help='Google Chat Webhook URL'), days: int=typer.Option(1, '--days', '-d', help='Number of days to look back'), project: str = typer.Option("project-maui", "--project", help="GCP Project ID")):
+def chat(webhook_url: Optional[List[str]]=typer.Option(None, '--webhook-url', envvar='GCHAT_WEBHOOK_URL', help='Google Chat Webhook URL (repeatable; comma-separated lists accepted)'),
+         webhooks_file: Optional[str]=typer.Option(None, '--webhooks-file', help='File with one webhook URL per line'),
+         days: int=typer.Option(1, '--days', '-d', help='Number of days to look back'), project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
+         concurrency: int = typer.Option(8, "--concurrency", help="Spaces delivered in parallel"),
+         rate: float = typer.Option(1.0, "--rate", help="Maximum messages per second per space"),
+         pulse: Optional[str] = typer.Option(None, "--pulse", help="Use a merged pulse file (tpc-agent merge --out) instead of scanning"),
+         token_budget: int = typer.Option(0, "--token-budget", envvar="TPC_TOKEN_BUDGET", help="Max model tokens per pulse; remaining items fall back to keyword talk tracks"),
+         time_budget: float = typer.Option(0, "--time-budget", envvar="TPC_TIME_BUDGET_SECONDS", help="Max seconds of synthesis per pulse before falling back to keyword talk tracks")):
     """Scan and post the report to Google Chat."""
-    if not webhook_url:
+    webhooks = list(webhook_url or [])
+    if webhooks_file:
+        with open(webhooks_file, 'r') as f:
+            webhooks.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    if not webhooks:
         typer.echo('Error: Webhook URL must be provided via --webhook-url or GCHAT_WEBHOOK_URL env var.')
         raise typer.Exit(code=1)
-    agent = TPCAgent(project_id=project)
-    knowledge = agent.browse_knowledge()
-    from .core.agent import parse_date
-    from datetime import datetime, timedelta, timezone
-    now = datetime.now(timezone.utc)
-    cutoff = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
-    filtered = [item for item in knowledge if parse_date(item.get('date', '')) >= cutoff]
-    synthesized = agent.synthesize_reports(filtered)
-    bridge = GoogleChatBridge(webhook_url)
+    agent = TPCAgent(project_id=project, token_budget=token_budget, time_budget_seconds=time_budget)
+    synthesized = _load_or_synthesize(agent, days, pulse)
+    bridge = GoogleChatBridge(','.join(webhooks), max_workers=concurrency, rate_per_space=rate)
     bridge.post_report(synthesized.get('items', []))
 
 @app.command()
-def email(recipient: str=typer.Argument(..., help='Recipient email address'), 
+def email(recipients: Optional[List[str]]=typer.Argument(None, help='Recipient email address(es); comma-separated lists are accepted'), 
+          recipients_file: Optional[str]=typer.Option(None, '--recipients-file', help='File with one recipient address per line'),
           sender: str=typer.Option(None, '--sender', envvar='TPC_SENDER_EMAIL', help='Sender email address'), 
           password: str=typer.Option(None, '--password', envvar='TPC_SENDER_PASSWORD', help='Sender email password/token'), 
           days: int=typer.Option(1, '--days', '-d', help='Number of days to look back'), 
           project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
-          infographic: bool = typer.Option(False, "--infographic", help="Generate and embed a visual pulse infographic")):
+          infographic: bool = typer.Option(False, "--infographic", help="Generate and embed a visual pulse infographic"),
+          pool_size: int = typer.Option(2, "--pool-size", help="Concurrent authenticated SMTP connections"),
+          rate: float = typer.Option(5.0, "--rate", help="Maximum messages per second across the pool"),
+          infographic_width: int = typer.Option(1200, "--infographic-width", help="Downscale the embedded infographic to this width (0 keeps the original)"),
+          pulse: Optional[str] = typer.Option(None, "--pulse", help="Use a merged pulse file (tpc-agent merge --out) instead of scanning"),
+          token_budget: int = typer.Option(0, "--token-budget", envvar="TPC_TOKEN_BUDGET", help="Max model tokens per pulse; remaining items fall back to keyword talk tracks"),
+          time_budget: float = typer.Option(0, "--time-budget", envvar="TPC_TIME_BUDGET_SECONDS", help="Max seconds of synthesis per pulse before falling back to keyword talk tracks")):
     """Scan and send the report via Email."""
-    agent = TPCAgent(project_id=project)
-    knowledge = agent.browse_knowledge()
-    from .core.agent import parse_date
+    recipients = list(recipients or [])
+    if recipients_file:
+        with open(recipients_file, 'r') as f:
+            recipients.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    if not recipients:
+        typer.echo('Error: Provide at least one recipient or --recipients-file.')
+        raise typer.Exit(code=1)
+    agent = TPCAgent(project_id=project, token_budget=token_budget, time_budget_seconds=time_budget)
     from datetime import datetime, timedelta, timezone
     now = datetime.now(timezone.utc)
     cutoff = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
-    filtered = [item for item in knowledge if parse_date(item.get('date', '')) >= cutoff]
-    synthesized = agent.synthesize_reports(filtered)
+    synthesized = _load_or_synthesize(agent, days, pulse)
     
     infographic_path = None
     if infographic:
@@ -68,24 +201,29 @@ def email(recipient: str=typer.Argument(..., help='Recipient email address'),
     start_date = cutoff.strftime('%Y-%m-%d')
     end_date = now.strftime('%Y-%m-%d')
     date_range = f'{start_date} to {end_date}'
-    bridge = EmailBridge(recipient, sender, password)
+    bridge = EmailBridge(','.join(recipients), sender, password, pool_size=pool_size, rate_per_second=rate, infographic_max_width=infographic_width or None)
     bridge.post_report(synthesized.get('items', []), tldr=synthesized.get('tldr'), date_range=date_range, infographic_path=infographic_path, gaps=synthesized.get('gaps'))
 
 @app.command()
-def github(days: int=typer.Option(1, '--days', '-d', help='Number of days to look back'), project: str = typer.Option("project-maui", "--project", help="GCP Project ID")):
+def github(days: int=typer.Option(1, '--days', '-d', help='Number of days to look back'), project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
+           mode: str = typer.Option("issue", "--mode", help="issue (new issue per run), rolling (one pulse issue) or daily (one issue per day); rolling/daily append comments"),
+           pulse: Optional[str] = typer.Option(None, "--pulse", help="Use a merged pulse file (tpc-agent merge --out) instead of scanning"),
+           token_budget: int = typer.Option(0, "--token-budget", envvar="TPC_TOKEN_BUDGET", help="Max model tokens per pulse; remaining items fall back to keyword talk tracks"),
+           time_budget: float = typer.Option(0, "--time-budget", envvar="TPC_TIME_BUDGET_SECONDS", help="Max seconds of synthesis per pulse before falling back to keyword talk tracks")):
     """Dispatch the AI Field Promotion Report as a GitHub Issue."""
-    agent = TPCAgent(project_id=project)
-    knowledge = agent.browse_knowledge()
-    from .core.agent import parse_date
+    # Validated before the agent is built, so a typo fails before any scan or model call
+    if mode not in ('issue', 'rolling', 'daily'):
+        typer.echo('Error: --mode must be one of issue, rolling, daily.')
+        raise typer.Exit(code=1)
+    agent = TPCAgent(project_id=project, token_budget=token_budget, time_budget_seconds=time_budget)
     from datetime import datetime, timedelta, timezone
     now = datetime.now(timezone.utc)
     cutoff = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
-    filtered = [item for item in knowledge if parse_date(item.get('date', '')) >= cutoff]
-    synthesized = agent.synthesize_reports(filtered)
+    synthesized = _load_or_synthesize(agent, days, pulse)
     start_date = cutoff.strftime('%Y-%m-%d')
     end_date = now.strftime('%Y-%m-%d')
     date_range = f'{start_date} to {end_date}'
-    bridge = GitHubBridge()
+    bridge = GitHubBridge(mode=mode)
     bridge.post_report(synthesized.get('items', []), tldr=synthesized.get('tldr'), date_range=date_range, gaps=synthesized.get('gaps'))
 
 @app.command()
@@ -111,6 +249,50 @@ def query(text: str = typer.Argument(..., help="Text to search for in the knowle
     
     console.print(table)
 
+@app.command()
+def history(since: Optional[str] = typer.Option(None, "--since", help="Start date (YYYY-MM-DD)"),
+            until: Optional[str] = typer.Option(None, "--until", help="End date, inclusive (YYYY-MM-DD)"),
+            source: Optional[List[str]] = typer.Option(None, "--source", "-s", help="Source name or prefix (repeatable)"),
+            category: Optional[List[str]] = typer.Option(None, "--category", "-c", help="Category (repeatable)"),
+            tag: Optional[List[str]] = typer.Option(None, "--tag", "-t", help="Tag (repeatable)"),
+            min_score: Optional[int] = typer.Option(None, "--min-score", help="Minimum impact score"),
+            by_impact: bool = typer.Option(False, "--by-impact", help="Order by impact score instead of date"),
+            facets: bool = typer.Option(False, "--facets", help="Show source/category/tag counts"),
+            limit: int = typer.Option(20, "--limit", help="Rows per page"),
+            page: int = typer.Option(1, "--page", help="Page number (1-based)"),
+            render: bool = typer.Option(False, "--render", help="Re-render the matched pulses as the field promotion report")):
+    """Browse archived pulses by date range, source, category, tag and impact (local, offline)."""
+    from .core.archive import PulseArchive
+    # Reads the local archive directly: no agent, model or Vertex AI initialization
+    archive = PulseArchive()
+    filters = dict(since=since, until=until, sources=source, categories=category, tags=tag, min_score=min_score)
+    try:
+        result = archive.query(limit=limit, offset=(max(page, 1) - 1) * limit,
+                               order_by='impact_score' if by_impact else 'date', **filters)
+        if facets:
+            result['facets'] = archive.facets(**filters)
+    except ValueError as e:
+        raise typer.BadParameter(f'expected YYYY-MM-DD ({e})', param_hint='--since/--until')
+    from rich.console import Console
+    from rich.table import Table
+    console = Console()
+    if render:
+        from .core.promotion import render_promotion
+        render_promotion(console, result, heading=f"Archive {since or 'start'} to {until or 'today'}, page {page}")
+        return
+    table = Table(title=f"Pulse History: page {page} ({result['total']} matches)")
+    table.add_column("Date", style="dim")
+    table.add_column("Score", justify="right", style="cyan")
+    table.add_column("Source", style="magenta")
+    table.add_column("Title", style="green")
+    table.add_column("Tags")
+    for p in result['items']:
+        score = p.get('impact_score')
+        table.add_row(p['date'][:10], '-' if score is None else str(score), p['source'], p['title'], ', '.join(p.get('tags', [])))
+    console.print(table)
+    for facet, counts in result.get('facets', {}).items():
+        console.print(f"[bold]{facet}:[/bold] " + ', '.join(f"{k} ({v})" for k, v in counts.items()))
+
 @app.command()
 def serve(host: str = "0.0.0.0", port: int = 8000):
     """Launch the AI Agent FastAPI service."""
@@ -119,23 +301,120 @@ def serve(host: str = "0.0.0.0", port: int = 8000):
     uvicorn.run("ai_tpc_agent.core.api:app", host=host, port=port, reload=True)
 
 @app.command()
-def ingest(uris: List[str] = typer.Argument(..., help="List of Google Drive URLs or GCS URIs to ingest"), project: str = typer.Option("project-maui", "--project", help="GCP Project ID")):
+def ingest(uris: List[str] = typer.Argument(..., help="List of Google Drive URLs or GCS URIs to ingest"),
+           project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
+           batch_size: int = typer.Option(25, "--batch-size", help="URIs per import request (max 25)"),
+           concurrency: int = typer.Option(4, "--concurrency", help="Import requests running in parallel"),
+           journal: Optional[str] = typer.Option(None, "--journal", help="Ingestion journal path (completed URIs are skipped on rerun)")):
     """Ingest Workspace documents (Slides, Docs, Sheets) link by link or folder by folder."""
     agent = TPCAgent(project_id=project)
-    agent.ingest_documents(uris)
-    typer.echo(f"🚀 Ingestion request submitted for {len(uris)} sources. Documents are being processed by Vertex AI RAG Engine.")
+    summary = agent.ingest_documents(uris, batch_size=batch_size, max_concurrency=concurrency, journal_path=journal)
+    if not summary:
+        return
+    typer.echo(f"🚀 Ingested {summary['completed']} of {len(uris)} sources ({summary['skipped']} already done, {summary['failed']} failed) at {summary['docs_per_minute']:.1f} docs/min.")
+    if summary['failed']:
+        typer.echo("Re-run the same command to retry failed sources.")
+        raise typer.Exit(code=1)
 
 @app.command()
-def audit_maturity(package: str = typer.Argument(..., help="PyPI package name to audit"), project: str = typer.Option("project-maui", "--project", help="GCP Project ID")):
+def backfill(days: int = typer.Option(180, "--days", "-d", help="How far back to import"),
+             project: str = typer.Option("project-maui", "--project", help="GCP Project ID"),
+             source: Optional[List[str]] = typer.Option(None, "--source", "-s", help="Source name or prefix (repeatable; default: whole watchlist)"),
+             workers: int = typer.Option(4, "--workers", help="Sources paged in parallel"),
+             max_pages: int = typer.Option(50, "--max-pages", help="Page limit per paged feed (GitHub releases: 10 per page)"),
+             batch_size: int = typer.Option(25, "--batch-size", help="Items enriched and loaded per batch"),
+             upload_workers: int = typer.Option(8, "--upload-workers", help="Parallel uploads into the vector store"),
+             journal: Optional[str] = typer.Option(None, "--journal", help="Backfill journal path (completed sources are skipped on rerun)"),
+             token_budget: int = typer.Option(0, "--token-budget", envvar="TPC_TOKEN_BUDGET", help="Max model tokens; later items fall back to keyword talk tracks")):
+    """Import months of past releases and posts from every watchlist source into the knowledge base."""
+    agent = TPCAgent(project_id=project, token_budget=token_budget)
+    summary = agent.backfill(days, sources=source, journal_path=journal, workers=workers, max_pages=max_pages,
+                             batch_size=batch_size, upload_workers=upload_workers)
+    typer.echo(f"📚 Backfilled {summary['items']} updates from {summary['pages']} pages across "
+               f"{summary['sources'] - summary['skipped_sources']} sources ({summary['skipped_sources']} already complete, "
+               f"{summary['skipped']} items already loaded).")
+    if summary['failed']:
+        typer.echo(f"⚠️  {len(summary['failed'])} source(s) stopped early and resume on rerun: {', '.join(summary['failed'])}")
+    if summary['ledger']['calls']:
+        from rich.console import Console
+        from .core.ledger import render_ledger
+        render_ledger(Console(), summary['ledger'])
+
+@app.command()
+def audit_maturity(packages: Optional[List[str]] = typer.Argument(None, help="PyPI package name(s) to audit"),
+                   file: Optional[str] = typer.Option(None, "--file", "-f", help="File with one package name per line"),
+                   concurrency: int = typer.Option(8, "--concurrency", help="Parallel PyPI metadata fetches"),
+                   batch_size: int = typer.Option(5, "--batch-size", help="Packages per wisdom synthesis call"),
+                   no_wisdom: bool = typer.Option(False, "--no-wisdom", help="Skip model enrichment; report the computed cadence score only"),
+                   project: str = typer.Option("project-maui", "--project", help="GCP Project ID")):
     """Perform a deep audit of a package's history and maturity (Initial Deep Ingestion)."""
+    names = list(packages or [])
+    if file:
+        with open(file, 'r') as f:
+            names.extend(line.split('#')[0].strip() for line in f if line.split('#')[0].strip())
+    if not names:
+        typer.echo("Error: Provide at least one package or --file.")
+        raise typer.Exit(code=1)
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.markdown import Markdown
+    console = Console()
     agent = TPCAgent(project_id=project)
-    wisdom = agent.audit_maturity(package)
-    if "wisdom" in wisdom:
-        from rich.console import Console
-        from rich.panel import Panel
-        from rich.markdown import Markdown
-        console = Console()
-        console.print(Panel(Markdown(wisdom["wisdom"]), title=f"🧠 TPC WISDOM: {package}", border_style="magenta"))
+    if len(names) == 1:
+        package = names[0]
+        wisdom = agent.audit_maturity(package, enrich=not no_wisdom)
+        if "scorecard" in wisdom:
+            console.print(Panel(Markdown(wisdom["scorecard"]), title=f"📈 RELEASE CADENCE: {package}", border_style="cyan"))
+        if "wisdom" in wisdom:
+            console.print(Panel(Markdown(wisdom["wisdom"]), title=f"🧠 TPC WISDOM: {package}", border_style="magenta"))
+        return
+
+    results = agent.audit_maturity_bulk(names, max_workers=concurrency, wisdom_batch_size=batch_size, enrich=not no_wisdom)
+    from rich.table import Table
+    table = Table(title=f"Maturity Audit: {len(results)} packages")
+    table.add_column("Package", style="magenta")
+    table.add_column("Version", style="cyan")
+    table.add_column("Releases", justify="right")
+    table.add_column("Score", justify="right")
+    table.add_column("Tier")
+    table.add_column("Status", style="green")
+    for name, data in results.items():
+        status = data["error"] if "error" in data else ("audited" if "wisdom" in data else "scored")
+        table.add_row(name, str(data.get("version", "-")), str(data.get("release_count", "-")),
+                      str(data.get("maturity_score", "-")), data.get("maturity_tier", "-"), status)
+    console.print(table)
+
+@app.command()
+def train_scorer(holdout: float = typer.Option(0.2, "--holdout", help="Fraction of scored items held out for the agreement report"),
+                 min_samples: int = typer.Option(50, "--min-samples", help="Minimum model-scored items required to train")):
+    """Retrain the local impact scorer on cached model-assigned scores and report agreement (local, offline)."""
+    from .core.agent import RANK_RUBRIC
+    from .core.impact_cache import ImpactScoreCache
+    from .core.impact_model import train_from_cache
+    from rich.console import Console
+    from rich.table import Table
+    console = Console()
+    try:
+        model = train_from_cache(ImpactScoreCache(), RANK_RUBRIC, holdout=holdout, min_samples=min_samples)
+    except ValueError as e:
+        typer.echo(f"Error: {e}")
+        raise typer.Exit(code=1)
+    path = model.save()
+    console.print(f"[green]Trained on {model.metrics['samples']} scored items; saved to {path}.[/green]")
+    report = model.metrics.get('holdout')
+    if not report:
+        console.print("[yellow]Holdout split was empty; no agreement report.[/yellow]")
+        return
+    low, high = model.band
+    table = Table(title=f"Local vs. model scores ({report['samples']} held-out items)")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    table.add_row("Mean absolute error", f"{report['mae']:.1f}")
+    table.add_row("Spearman rank correlation", str(report.get('spearman', '-')))
+    table.add_row("Same rubric tier", f"{report['tier_agreement']:.1%}")
+    table.add_row(f"Decided locally (<{low:.0f} or >{high:.0f})", f"{report['local_share']:.1%}")
+    table.add_row("Same tier where decided locally", '-' if report['local_tier_agreement'] is None else f"{report['local_tier_agreement']:.1%}")
+    console.print(table)
 
 @app.command()
 def version():
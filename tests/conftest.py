@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_state_dir(tmp_path, monkeypatch):
+    # Journals, caches and archives must never land in the working tree during tests.
+    monkeypatch.setenv('TPC_STATE_DIR', str(tmp_path / 'state'))
+    return tmp_path / 'state'
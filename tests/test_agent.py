@@ -95,6 +95,9 @@ def test_synthesize_reports_with_client(mock_scrub, mock_summarize, mock_vector_
     mock_resp_summary = MagicMock()
     mock_resp_summary.text = "* Key Feature: A\n* Customer Value: B\n* Sales Play: C"
     
+    mock_resp_business = MagicMock()
+    mock_resp_business.text = "Lowers risk for regulated customers."
+
     mock_resp_tldr = MagicMock()
     mock_resp_tldr.text = "Executive Summary with 📊"
     
@@ -105,17 +108,34 @@ def test_synthesize_reports_with_client(mock_scrub, mock_summarize, mock_vector_
         mock_resp_ranking,
         mock_resp_tags,
         mock_resp_summary,
+        mock_resp_business,
         mock_resp_tldr
     ]
     
     knowledge = [{'title': 'Security Update', 'summary': 'A very long summary ' * 50, 'source': 'gemini'}]
-    result = agent.synthesize_reports(knowledge)
+    result = agent.synthesize_reports(knowledge, business_summary=True)
     
     assert result['items'][0]['bridge'] == "This matters because of X 🚀"
     assert result['items'][0]['tags'] == ["Security", "Governance"]
     assert "Key Feature" in result['items'][0]['summary']
+    assert result['items'][0]['business_summary'] == "Lowers risk for regulated customers."
     assert result['tldr'] == "Executive Summary with 📊"
 
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_business_summaries_only_when_rendered(mock_vector_store_class):
+    agent = TPCAgent()
+    agent.client = MagicMock()
+    agent.client.models.generate_content.return_value = MagicMock(text='Summary')
+    items = [{'title': f'Trend {i}', 'summary': 'Market news ' * 30, 'source': 'blog', 'category': 'trends'} for i in range(3)]
+
+    agent.enrich_items(items)
+    sites = [c.kwargs['contents'] for c in agent.client.models.generate_content.call_args_list]
+    assert not any('2 sentences focus on impact' in s for s in sites)
+    assert not any('business_summary' in i for i in items)
+
+    agent.add_business_summaries(items)
+    assert all(i['business_summary'] == 'Summary' for i in items)
+
 @patch('ai_tpc_agent.core.agent.TPCVectorStore')
 def test_audit_maturity_logic(mock_vector_store_class):
     agent = TPCAgent()
@@ -160,6 +180,7 @@ def test_rank_by_impact(mock_vector_store_class):
 def test_generate_infographic(mock_vector_store_class):
     agent = TPCAgent()
     mock_client = MagicMock()
+    mock_client.models.generate_image.return_value.save.side_effect = lambda path: open(path, 'wb').write(b'png')
     agent.client = mock_client
     
     synthesized = {
@@ -169,5 +190,15 @@ def test_generate_infographic(mock_vector_store_class):
     
     path = agent.generate_infographic(synthesized)
     
-    assert path == "daily_pulse_infographic.png"
-    assert mock_client.models.generate_image.called
\ No newline at end of file
+    assert path.endswith(".png")
+    assert path.startswith(agent.infographic_cache.directory)
+    assert mock_client.models.generate_image.called
+
+    # Same prompt inputs: the cached image is reused without another model call
+    mock_client.models.generate_image.return_value.save.side_effect = lambda p: open(p, 'wb').write(b'png')
+    path = agent.generate_infographic(synthesized)
+    mock_client.models.generate_image.reset_mock()
+    assert agent.generate_infographic(synthesized) == path
+    assert not mock_client.models.generate_image.called
+    synthesized['tldr'] = 'A different synthesis'
+    assert agent.generate_infographic(synthesized) != path
\ No newline at end of file
@@ -0,0 +1,66 @@
+from unittest.mock import patch
+from typer.testing import CliRunner
+from ai_tpc_agent.main import app
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.archive import PulseArchive, SCHEMA
+
+PULSES = [
+    {'title': 'Claude Opus 5', 'source': 'anthropic-news', 'category': 'partners', 'date': '2026-02-10T09:00:00Z', 'impact_score': 95, 'tags': ['Models']},
+    {'title': 'Claude SDK v0.2', 'source': 'anthropic-blog', 'category': 'partners', 'date': '2026-03-02T09:00:00Z', 'impact_score': 60, 'tags': ['SDK']},
+    {'title': 'Agent Builder GA', 'source': 'vertex-ai-releases', 'category': 'platform', 'date': '2026-01-15T09:00:00Z', 'impact_score': 92, 'tags': ['Governance', 'Models']},
+    {'title': 'Claude on Vertex', 'source': 'anthropic-news', 'category': 'partners', 'date': '2026-04-03T09:00:00Z', 'impact_score': 97, 'tags': []},
+]
+
+def test_range_and_facet_query(tmp_path):
+    archive = PulseArchive(str(tmp_path / 'archive.db'))
+    assert archive.add_pulses(PULSES) == 4
+
+    q1 = archive.query(since='2026-01-01', until='2026-03-31', sources=['anthropic'], min_score=90)
+    assert q1['total'] == 1
+    assert q1['items'][0]['title'] == 'Claude Opus 5'
+    assert q1['items'][0]['tags'] == ['Models']
+
+    by_tag = archive.query(tags=['models'], order_by='impact_score')
+    assert [p['title'] for p in by_tag['items']] == ['Claude Opus 5', 'Agent Builder GA']
+
+    facets = archive.facets(since='2026-01-01', until='2026-03-31')
+    assert facets['category'] == {'partners': 2, 'platform': 1}
+    assert facets['tag']['models'] == 2
+
+def test_pagination_and_upsert(tmp_path):
+    archive = PulseArchive(str(tmp_path / 'archive.db'))
+    archive.add_pulses(PULSES)
+    archive.add_pulses([dict(PULSES[0], impact_score=99, tags=['Launch'])])
+
+    page = archive.query(limit=2, offset=2)
+    assert page['total'] == 4
+    assert [p['title'] for p in page['items']] == ['Claude Opus 5', 'Agent Builder GA']
+    assert archive.query(tags=['models'])['total'] == 1
+    assert archive.query(tags=['launch'])['items'][0]['impact_score'] == 99
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_synthesize_reports_archives_items(mock_vector_store_class):
+    agent = TPCAgent()
+    agent.client = None
+    agent.synthesize_reports([{'title': 'Agent Builder Update', 'summary': 'x', 'source': 'google-cloud', 'category': 'roadmap', 'date': '2026-02-06T00:00:00Z'}])
+
+    history = agent.pulse_history(with_facets=True)
+    assert history['total'] == 1
+    assert history['facets']['source'] == {'google-cloud': 1}
+
+def test_business_summary_round_trip_and_legacy_migration(tmp_path):
+    import sqlite3
+    path = str(tmp_path / 'archive.db')
+    legacy = sqlite3.connect(path)
+    legacy.executescript(SCHEMA.replace(',\n    business_summary TEXT', ''))
+    legacy.close()
+
+    archive = PulseArchive(path)
+    archive.add_pulses([dict(PULSES[0], business_summary='Frontier model for regulated buyers.')])
+    assert archive.query()['items'][0]['business_summary'] == 'Frontier model for regulated buyers.'
+
+def test_history_cli_rejects_malformed_dates():
+    result = CliRunner().invoke(app, ['history', '--since', '2026-13-01'])
+    assert result.exit_code == 2
+    assert 'Invalid value for --since/--until' in result.output
+    assert CliRunner().invoke(app, ['history', '--since', '2026-02-01']).exit_code == 0
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+import urllib.error
+from unittest.mock import patch
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.backfill import HistoricalBackfill, BackfillJournal
+from ai_tpc_agent.core.watcher import is_paged_feed, fetch_history_page
+
+SINCE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+SOURCES = {
+    'adk': {'feed': 'https://github.com/google/adk-python/releases.atom', 'category': 'roadmap', 'description': 'ADK'},
+    'mcp': {'feed': 'https://github.com/modelcontextprotocol/python-sdk/releases.atom', 'category': 'roadmap', 'description': 'MCP'},
+}
+
+
+def _history(feed, pages, fail=None):
+    """Ten releases per page, one day apart, newest first, starting 2026-03-01."""
+    def fetch(url, page):
+        if fail and fail(url, page):
+            raise ConnectionError('rate limited')
+        if page > pages:
+            return []
+        start = datetime(2026, 3, 1, tzinfo=timezone.utc) - timedelta(days=10 * (page - 1))
+        return [{'title': f'{url.split("/")[4]} v{page}.{i}', 'date': (start - timedelta(days=i)).isoformat(),
+                 'summary': 'Release notes', 'source_url': url} for i in range(10)]
+    return fetch
+
+
+def test_watcher_pages_only_github_release_feeds():
+    assert is_paged_feed(SOURCES['adk']['feed'])
+    assert not is_paged_feed('https://pypi.org/rss/project/google-adk/releases.xml')
+    assert fetch_history_page('https://cloud.google.com/blog/rss', page=2) == []
+
+
+def test_unpaged_source_outage_is_journaled_as_failed(tmp_path):
+    agent = TPCAgent.__new__(TPCAgent)
+    sources = {'vertex-ai-releases': {'feed': 'https://cloud.google.com/feeds/vertex-ai-release-notes.xml',
+                                      'category': 'roadmap', 'description': 'Vertex AI'}}
+    # One attempt instead of tenacity's three with backoff
+    once = fetch_history_page.__wrapped__
+    with patch('ai_tpc_agent.core.watcher.urllib.request.urlopen', side_effect=urllib.error.URLError('down')), \
+            patch('ai_tpc_agent.core.backfill.fetch_history_page', side_effect=once), \
+            patch('ai_tpc_agent.core.backfill.StreamingPipeline'):
+        report = HistoricalBackfill(agent, SINCE, journal=BackfillJournal(str(tmp_path / 'journal.json'))).run(sources)
+    journal = BackfillJournal(str(tmp_path / 'journal.json'))
+    assert report['failed'] == ['vertex-ai-releases']
+    assert journal.status('vertex-ai-releases') == 'failed' and journal.next_page('vertex-ai-releases') == 1
+
+    with patch('ai_tpc_agent.core.backfill.fetch_history_page', return_value=[]), \
+            patch('ai_tpc_agent.core.backfill.StreamingPipeline'):
+        report = HistoricalBackfill(agent, SINCE, journal=BackfillJournal(str(tmp_path / 'journal.json'))).run(sources)
+    assert report['failed'] == ['vertex-ai-releases']
+
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_backfill_stops_at_cutoff_and_resumes_failed_sources(mock_vs, tmp_path):
+    mock_vs.return_value.enabled = True
+    agent = TPCAgent()
+    agent.client = None
+    agent.impact_model = None
+    journal_path = str(tmp_path / 'journal.json')
+
+    flaky = _history(None, pages=20, fail=lambda url, page: 'python-sdk' in url and page == 3)
+    with patch('ai_tpc_agent.core.backfill.fetch_history_page', side_effect=flaky):
+        first = HistoricalBackfill(agent, SINCE, journal=BackfillJournal(journal_path), workers=2, batch_size=7).run(SOURCES)
+
+    journal = BackfillJournal(journal_path)
+    # 2026-03-01 back to 2026-01-01 is 60 days: page 7 crosses the cutoff
+    assert journal.status('adk') == 'completed' and journal.entries['adk']['items'] == 60
+    assert journal.status('mcp') == 'failed' and journal.next_page('mcp') == 3
+    assert first['failed'] == ['mcp'] and first['items'] == 80
+    assert mock_vs.return_value.upsert_pulses.call_args.kwargs['max_workers'] == 8
+
+    fetched = []
+    def healthy(url, page):
+        fetched.append((url, page))
+        return _history(None, pages=20)(url, page)
+    with patch('ai_tpc_agent.core.backfill.fetch_history_page', side_effect=healthy):
+        second = HistoricalBackfill(agent, SINCE, journal=BackfillJournal(journal_path), workers=2).run(SOURCES)
+
+    assert second['skipped_sources'] == 1 and second['items'] == 40
+    assert min(page for _, page in fetched) == 3
+    assert BackfillJournal(journal_path).status('mcp') == 'completed'
+    assert agent.archive.query()['total'] == 120
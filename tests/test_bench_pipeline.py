@@ -0,0 +1,38 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+from bench_pipeline import run_scale, compare
+from fake_gemini import FakeGeminiClient, FakeModelError
+
+def test_fake_client_is_deterministic():
+    prompts = [f'prompt {i}' for i in range(50)]
+
+    def failures(client):
+        out = []
+        for p in prompts:
+            try:
+                client.models.generate_content(model='m', contents=p)
+                out.append(False)
+            except FakeModelError:
+                out.append(True)
+        return out
+
+    first, second = failures(FakeGeminiClient(failure_rate=0.3, seed=1)), failures(FakeGeminiClient(failure_rate=0.3, seed=1))
+    assert first == second and any(first) and not all(first)
+
+def test_pipeline_runs_offline_at_small_scale():
+    result = run_scale(20)
+
+    assert result['items_fetched'] == 20
+    assert result['items_synthesized'] == 20
+    assert result['model_calls'] > 0 and result['model_failures'] == 0
+    assert result['html_bytes'] > 0 and result['peak_memory_mb'] > 0
+    stages = {s['stage'] for s in result['stages']}
+    assert {'bench.pipeline', 'tools.fetch_feed', 'agent.rank_by_impact', 'agent.enrich_item', 'bench.render'} <= stages
+
+def test_compare_flags_regressions(capsys):
+    previous = {'scales': [{'items': 20, 'wall_seconds': 1.0, 'model_calls': 10, 'peak_memory_mb': 1}]}
+    current = {'scales': [{'items': 20, 'wall_seconds': 1.5, 'model_calls': 10, 'peak_memory_mb': 1}]}
+    assert compare(current, previous, 0.2) == [20]
+    assert compare(current, previous, 0.6) == []
@@ -0,0 +1,52 @@
+import os
+import sys
+import json
+import pytest
+from ai_tpc_agent.core.agent import TPCTools
+from ai_tpc_agent.core.bridge_rules import BridgeRule, BridgeRuleEngine, bridge_engine
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+from bench_bridge_rules import legacy_bridge, synthetic_items
+
+def test_rule_table_matches_original_chain():
+    items = synthetic_items(5000, seed=3) + [
+        {'title': 'Model Context', 'source': 'protocol-feed'},  # multi-word term spanning title and source
+        {'title': 'Release', 'source': 'adk-python'},           # title-only rule must ignore the source
+        {'title': 'A2UI and A2A', 'source': 'misc'},
+        {'title': '', 'source': ''},
+    ]
+    engine = bridge_engine()
+    assert engine.classify_many(items) == [legacy_bridge(i) for i in items]
+    assert [TPCTools().bridge_roadmap_to_field(i) for i in items[-4:]] == [legacy_bridge(i) for i in items[-4:]]
+
+def test_rules_load_from_config_file(tmp_path, monkeypatch):
+    path = tmp_path / 'bridges.json'
+    path.write_text(json.dumps({'default': 'fallback', 'rules': [
+        {'name': 'vertex', 'terms': ['Vertex'], 'fields': ['source'], 'bridge': 'VERTEX'},
+        {'name': 'launch', 'terms': ['launch', 'ga'], 'bridge': 'LAUNCH'},
+    ]}))
+    monkeypatch.setenv('TPC_BRIDGE_RULES', str(path))
+    tools = TPCTools()
+    assert tools.bridge_many([{'title': 'Vertex launch', 'source': 'blog'}, {'title': 'x', 'source': 'vertex-ai'},
+                              {'title': 'Docs fix', 'source': 'blog'}]) == ['LAUNCH', 'VERTEX', 'fallback']
+
+def test_watchlist_without_rule_table_falls_back_to_packaged_rules(tmp_path):
+    path = tmp_path / 'watchlist.json'
+    path.write_text(json.dumps({'ai_knowledge_hub': {}}))
+    assert bridge_engine(str(path)).classify({'title': 'Claude 4'}).startswith('PARTNER DEPTH')
+
+def test_invalid_rule_is_rejected():
+    with pytest.raises(ValueError):
+        BridgeRule('bad', ['x'], 'bridge', fields=['summary'])
+    with pytest.raises(ValueError):
+        BridgeRuleEngine.from_config({'default': 'd', 'rules': [{'name': 'empty', 'terms': [], 'bridge': 'b'}]})
+
+def test_edited_rule_file_is_picked_up(tmp_path, monkeypatch):
+    path = tmp_path / 'bridges.json'
+    path.write_text(json.dumps({'default': 'old', 'rules': []}))
+    monkeypatch.setenv('TPC_BRIDGE_RULES', str(path))
+    tools = TPCTools()
+    assert tools.bridge_roadmap_to_field({'title': 'x'}) == 'old'
+    path.write_text(json.dumps({'default': 'new', 'rules': []}))
+    os.utime(path, (0, os.path.getmtime(path) + 5))
+    assert tools.bridge_roadmap_to_field({'title': 'x'}) == 'new'
@@ -0,0 +1,82 @@
+import json
+import requests
+from unittest.mock import MagicMock, patch
+from ai_tpc_agent.core.chat_bridge import GoogleChatBridge, space_name, space_labels
+from ai_tpc_agent.core.rate_limiter import parse_retry_after
+
+def _items(n):
+    return [{'title': f'Update {i}', 'source': 'vertex-ai-releases' if i % 2 else 'google-cloud-ai-blog',
+             'category': 'roadmap' if i % 2 else 'trends', 'summary': 'details ' * 40, 'bridge': 'talk track',
+             'source_url': f'https://example.com/{i}'} for i in range(n)]
+
+def _ok():
+    resp = MagicMock()
+    resp.status_code = 200
+    return resp
+
+def test_build_messages_includes_every_item_within_limits():
+    bridge = GoogleChatBridge('https://chat.googleapis.com/v1/spaces/A/messages?key=k', max_message_bytes=6000, max_sections_per_message=10)
+    messages = bridge.build_messages(_items(45))
+
+    sections = [s for m in messages for c in m['cards'] for s in c['sections']]
+    assert len(sections) == 45
+    assert len(messages) > 1
+    assert all(len(json.dumps(m)) <= 6500 for m in messages)
+    assert 'replies in thread' in messages[0]['text']
+
+def test_space_name_hides_secrets():
+    assert space_name('https://chat.googleapis.com/v1/spaces/AAAA/messages?key=secret&token=t') == 'spaces/AAAA'
+
+@patch('ai_tpc_agent.core.chat_bridge.requests.post')
+def test_fan_out_threads_replies_per_space(mock_post):
+    mock_post.return_value = _ok()
+    urls = [f'https://chat.googleapis.com/v1/spaces/S{i}/messages?key=k' for i in range(5)]
+    bridge = GoogleChatBridge(urls, max_sections_per_message=5, rate_per_space=0)
+
+    results = bridge.post_report(_items(12))
+
+    assert set(results) == {f'spaces/S{i}' for i in range(5)}
+    assert all(r['status'] == 'delivered' and r['messages_sent'] == 3 for r in results.values())
+    assert all(r['latency_seconds'] >= 0 for r in results.values())
+    assert mock_post.call_count == 15
+    thread_keys = {c.kwargs['json']['thread']['threadKey'] for c in mock_post.call_args_list}
+    assert len(thread_keys) == 1
+    assert all('messageReplyOption=REPLY_MESSAGE_FALLBACK_TO_NEW_THREAD' in c.args[0] for c in mock_post.call_args_list)
+
+@patch('ai_tpc_agent.core.chat_bridge.requests.post')
+def test_webhooks_sharing_a_space_keep_separate_results(mock_post):
+    failed = MagicMock(status_code=403)
+    failed.raise_for_status.side_effect = requests.HTTPError('403', response=failed)
+    mock_post.side_effect = lambda url, **kwargs: failed if 'key=bad' in url else _ok()
+    urls = ['https://chat.googleapis.com/v1/spaces/A/messages?key=k', 'https://chat.googleapis.com/v1/spaces/A/messages?key=bad',
+            'https://hooks.example.com/a', 'https://hooks.example.com/b']
+    assert space_labels(urls) == ['spaces/A', 'spaces/A#2', 'hooks.example.com', 'hooks.example.com#2']
+
+    results = GoogleChatBridge(urls, rate_per_space=0, max_workers=1).post_report(_items(2))
+
+    assert len(results) == 4
+    assert results['spaces/A']['status'] == 'delivered' and results['spaces/A#2']['status'] == 'failed'
+
+@patch('ai_tpc_agent.core.chat_bridge.requests.post')
+def test_per_space_retry_on_rate_limit(mock_post):
+    throttled = MagicMock(status_code=429, headers={'Retry-After': '0'})
+    mock_post.side_effect = [throttled, _ok()]
+    bridge = GoogleChatBridge('https://chat.googleapis.com/v1/spaces/A/messages?key=k', rate_per_space=0, backoff_seconds=0)
+
+    results = bridge.post_report(_items(2))
+
+    assert results['spaces/A']['status'] == 'delivered'
+    assert results['spaces/A']['attempts'] == 2
+
+@patch('ai_tpc_agent.core.chat_bridge.time.sleep')
+@patch('ai_tpc_agent.core.chat_bridge.requests.post')
+def test_http_date_retry_after_is_honoured(mock_post, mock_sleep):
+    throttled = MagicMock(status_code=429, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    mock_post.side_effect = [throttled, _ok()]
+    bridge = GoogleChatBridge('https://chat.googleapis.com/v1/spaces/A/messages?key=k', rate_per_space=0, backoff_seconds=0.5)
+
+    results = bridge.post_report(_items(2))
+
+    assert results['spaces/A']['status'] == 'delivered'
+    mock_sleep.assert_called_once_with(0.0)  # date already passed
+    assert parse_retry_after('7') == 7.0 and parse_retry_after('soon') is None and parse_retry_after(None) is None
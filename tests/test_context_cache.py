@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from ai_tpc_agent.core.agent import TPCAgent, TPCTools, TALK_TRACK_INSTRUCTIONS, talk_track_instructions
+from ai_tpc_agent.core.bridge_rules import bridge_engine
+from ai_tpc_agent.core.context_cache import ContextCacheManager, DEFAULT_MIN_CACHE_TOKENS
+from ai_tpc_agent.core.ledger import TokenLedger, call_cost, estimate_tokens
+from ai_tpc_agent.core.model_router import ModelRouter
+
+def _client(cached_tokens=300):
+    client = MagicMock()
+    client.caches.create.return_value = SimpleNamespace(name='cachedContents/abc')
+    client.models.generate_content.return_value = SimpleNamespace(text='📈 Talk track', usage_metadata=SimpleNamespace(
+        prompt_token_count=350, candidates_token_count=20, cached_content_token_count=cached_tokens))
+    return client
+
+def test_prefix_registered_once_and_referenced():
+    client = _client()
+    cache = ContextCacheManager(client, 'gemini-2.5-flash', 'SYSTEM PREFIX')
+    ledger = TokenLedger()
+    for i in range(3):
+        cache.generate(ModelRouter(ledger), 'talk_track', f'<context>item {i}</context>')
+
+    client.caches.create.assert_called_once()
+    assert client.caches.create.call_args.kwargs['config']['system_instruction'] == 'SYSTEM PREFIX'
+    for call in client.models.generate_content.call_args_list:
+        assert call.kwargs['config'] == {'cached_content': 'cachedContents/abc'}
+        assert 'SYSTEM PREFIX' not in call.kwargs['contents']
+    stats = cache.stats()
+    assert stats['active'] and stats['cached_calls'] == 3 and stats['tokens_saved'] == 900
+    assert ledger.report()['cached_tokens'] == 900
+
+def test_refreshes_before_ttl_expires():
+    client = _client()
+    cache = ContextCacheManager(client, 'gemini-2.5-flash', 'SYSTEM PREFIX', ttl_seconds=600, refresh_margin_seconds=60)
+    cache.ensure()
+    cache._expires_at -= 560  # 40s left, inside the refresh margin
+    assert cache.ensure() == 'cachedContents/abc'
+    client.caches.update.assert_called_once_with(name='cachedContents/abc', config={'ttl': '600s'})
+    assert cache.stats()['refreshes'] == 1 and client.caches.create.call_count == 1
+
+def test_falls_back_to_inline_prefix_when_caching_unavailable():
+    client = _client(cached_tokens=None)
+    client.caches.create.side_effect = RuntimeError('Cached content is too small')
+    cache = ContextCacheManager(client, 'gemini-2.5-flash', 'SYSTEM PREFIX')
+    cache.generate(ModelRouter(TokenLedger()), 'talk_track', '<context>item</context>')
+    cache.generate(ModelRouter(TokenLedger()), 'talk_track', '<context>item</context>')
+
+    client.caches.create.assert_called_once()
+    call = client.models.generate_content.call_args
+    assert 'config' not in call.kwargs
+    assert call.kwargs['contents'].startswith('SYSTEM PREFIX')
+    stats = cache.stats()
+    assert not stats['active'] and stats['uncached_calls'] == 2 and 'too small' in stats['disabled_reason']
+
+def test_prefix_below_cache_minimum_is_not_registered():
+    client = _client(cached_tokens=None)
+    client.models.count_tokens.return_value = SimpleNamespace(total_tokens=170)
+    cache = ContextCacheManager(client, 'gemini-2.5-flash', 'SYSTEM PREFIX')
+    cache.generate(ModelRouter(TokenLedger()), 'talk_track', '<context>item</context>')
+    cache.start_run()
+    cache.generate(ModelRouter(TokenLedger()), 'talk_track', '<context>item</context>')
+
+    client.caches.create.assert_not_called()
+    client.models.count_tokens.assert_called_once()
+    assert client.models.generate_content.call_args.kwargs['contents'].startswith('SYSTEM PREFIX')
+    assert '1024-token cache minimum' in cache.stats()['disabled_reason']
+
+    client = _client()
+    client.models.count_tokens.return_value = SimpleNamespace(total_tokens=1500)
+    assert ContextCacheManager(client, 'gemini-2.5-flash', 'SYSTEM PREFIX').ensure() == 'cachedContents/abc'
+
+def test_evicted_cache_is_recreated():
+    client = _client()
+    client.models.generate_content.side_effect = [RuntimeError('CachedContent not found'), client.models.generate_content.return_value,
+                                                  client.models.generate_content.return_value]
+    cache = ContextCacheManager(client, 'gemini-2.5-flash', 'SYSTEM PREFIX')
+    cache.generate(ModelRouter(TokenLedger()), 'talk_track', 'a')
+    assert client.models.generate_content.call_args.kwargs['contents'].startswith('SYSTEM PREFIX')
+    cache.generate(ModelRouter(TokenLedger()), 'talk_track', 'b')
+    assert client.caches.create.call_count == 2
+    cache.release()
+    client.caches.delete.assert_called_once_with(name='cachedContents/abc')
+
+def test_cached_tokens_are_discounted():
+    assert call_cost('gemini-2.5-flash', 1000, 0, cached_tokens=1000) == call_cost('gemini-2.5-flash', 250, 0)
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_agent_reports_tokens_saved(mock_vs):
+    mock_vs.return_value.enabled = False
+    agent = TPCAgent(project_id='test')
+    agent.client = _client()
+    agent._rank_by_impact = lambda items: items
+    knowledge = [{'title': f'Update {i}', 'source': 'vertex-ai-releases', 'description': 'Vertex', 'summary': 'x' * 80,
+                  'category': 'platform', 'date': '2026-02-06T12:00:00Z'} for i in range(3)]
+
+    result = agent.synthesize_reports(knowledge)
+
+    prefix = agent.client.caches.create.call_args.kwargs['config']['system_instruction']
+    assert prefix == talk_track_instructions(agent.tools.watchlist_sources(), bridge_engine())
+    assert result['ledger']['context_cache']['cached_calls'] == 3
+    assert result['ledger']['context_cache']['tokens_saved'] == 900
+    agent.client.caches.delete.assert_called_once()
+
+def test_packaged_prefix_clears_the_cache_minimum():
+    prefix = talk_track_instructions(TPCTools().watchlist_sources(), bridge_engine())
+    assert prefix.startswith(TALK_TRACK_INSTRUCTIONS)
+    assert 'a2ui' in prefix and 'vertex-ai-releases' in prefix
+    # Rough estimate; the runtime gate checks the real count with models.count_tokens
+    assert estimate_tokens(prefix) >= DEFAULT_MIN_CACHE_TOKENS
@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.digest import HierarchicalDigest, PartialSummaryCache, group_by_day_and_source
+from ai_tpc_agent.core.ledger import TokenLedger
+
+SOURCES = ('vertex-ai-releases', 'anthropic-news', 'openai-agents-sdk')
+
+def _window(days, per_day=2):
+    return [{'title': f'{source} update {d}-{n}', 'source': source, 'summary': 'details', 'date': f'2026-03-{d:02d}T10:00:00Z'}
+            for d in range(1, days + 1) for source in SOURCES for n in range(per_day)]
+
+def _client():
+    client = MagicMock()
+    client.models.generate_content.side_effect = lambda model, contents, **kw: SimpleNamespace(text=f'- partial for {model}')
+    return client
+
+def test_groups_per_day_and_source():
+    groups = group_by_day_and_source(_window(3))
+    assert len(groups) == 9 and all(len(items) == 2 for items in groups.values())
+    assert next(iter(groups)) == ('2026-03-01', 'anthropic-news')
+
+def test_longer_window_reuses_daily_partials(tmp_path):
+    cache = PartialSummaryCache(str(tmp_path))
+    client = _client()
+    first = HierarchicalDigest(client, TokenLedger(), cache)
+    first.context(_window(10))
+    assert first.stats['summarized'] == 30
+
+    client.models.generate_content.reset_mock()
+    second = HierarchicalDigest(client, TokenLedger(), cache)
+    context = second.context(_window(12))
+    assert second.stats == {'groups': 36, 'cached': 30, 'summarized': 6, 'fallback': 0}
+    assert client.models.generate_content.call_count == 6
+    assert context.index('[2026-03-12]') < context.index('[2026-03-01]')
+
+def test_failed_partials_keep_titles_and_are_retried(tmp_path):
+    client = MagicMock()
+    client.models.generate_content.side_effect = RuntimeError('quota')
+    digest = HierarchicalDigest(client, TokenLedger(), PartialSummaryCache(str(tmp_path)))
+    context = digest.context(_window(1, per_day=1))
+    assert 'vertex-ai-releases update 1-0' in context and digest.stats['fallback'] == 3
+    assert list(tmp_path.iterdir()) == []
+
+def test_context_is_trimmed_to_budget(tmp_path):
+    digest = HierarchicalDigest(_client(), TokenLedger(), PartialSummaryCache(str(tmp_path)), max_context_chars=500)
+    context = digest.context(_window(30))
+    assert len(context) < 700 and 'older days omitted' in context
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_large_window_feeds_digest_to_tldr_and_battlecard(mock_vs):
+    mock_vs.return_value.enabled = False
+    agent = TPCAgent(project_id='test')
+    agent.client = _client()
+    agent._rank_by_impact = lambda items: items[:20]
+
+    result = agent.synthesize_reports(_window(10))
+
+    prompts = [c.kwargs['contents'] for c in agent.client.models.generate_content.call_args_list]
+    gaps_prompt = next(p for p in prompts if 'Strategic AI Analyst' in p)
+    assert '[2026-03-10] vertex-ai-releases (2 updates)' in gaps_prompt and 'battlecard' in gaps_prompt
+    tldr_prompt = next(p for p in prompts if 'Executive Synthesis' in p)
+    assert 'Daily digests of all 60 updates' in tldr_prompt
+    assert result['gaps'] and len(result['items']) == 20
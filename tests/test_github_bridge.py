@@ -0,0 +1,126 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlparse
+import pytest
+from typer.testing import CliRunner
+from ai_tpc_agent.main import app
+from ai_tpc_agent.core.github_bridge import GitHubBridge, split_markdown, GITHUB_BODY_LIMIT
+
+
+class _GitHubHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the issues/comments endpoints of the GitHub REST API."""
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload=None, headers=None):
+        api = self.server.api
+        api['remaining'] -= 0 if status == 304 else 1
+        body = json.dumps(payload).encode() if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('X-RateLimit-Remaining', str(api['remaining']))
+        self.send_header('X-RateLimit-Reset', '0')
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        api = self.server.api
+        api['requests'].append(('GET', self.path, self.headers.get('If-None-Match')))
+        etag = f'"v{len(api["issues"])}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self._send(304)
+        return self._send(200, list(api['issues'].values()), {'ETag': etag})
+
+    def do_POST(self):
+        api = self.server.api
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        api['requests'].append(('POST', self.path, payload))
+        if len(payload.get('body', '')) > 65536:
+            return self._send(422, {'message': 'body is too long'})
+        if api['secondary_limit_once']:
+            api['secondary_limit_once'] = False
+            return self._send(403, {'message': 'You have exceeded a secondary rate limit'}, {'Retry-After': '0'})
+        path = urlparse(self.path).path
+        if path.endswith('/comments'):
+            number = int(path.split('/')[-2])
+            api['comments'].setdefault(number, []).append(payload['body'])
+            return self._send(201, {'id': len(api['comments'][number])})
+        number = len(api['issues']) + 1
+        issue = {'number': number, 'title': payload['title'], 'html_url': f'http://stub/issues/{number}', 'body': payload['body']}
+        api['issues'][number] = issue
+        return self._send(201, issue)
+
+
+@pytest.fixture
+def github_stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _GitHubHandler)
+    server.api = {'issues': {}, 'comments': {}, 'requests': [], 'remaining': 5000, 'secondary_limit_once': False}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _bridge(server, mode):
+    return GitHubBridge(repo='org/repo', token='t', mode=mode, api_base=f'http://127.0.0.1:{server.server_address[1]}', min_write_interval=0)
+
+
+ITEMS = [{'title': 'Gemini 3.1 GA', 'source': 'vertex-ai-releases', 'summary': 'x', 'tags': ['Models']}]
+
+
+def test_split_markdown_respects_limit():
+    body = ''.join(f'#### Item {i}\n' + 'y' * 500 + '\n' for i in range(400))
+    chunks = split_markdown(body, limit=10000)
+    assert ''.join(chunks) == body
+    assert all(len(c) <= 10000 for c in chunks)
+    assert all(c.startswith('#### Item') for c in chunks)
+
+def test_rolling_issue_is_reused_with_conditional_lookup(github_stub):
+    first = _bridge(github_stub, 'rolling').post_report(ITEMS, tldr='One')
+    second = _bridge(github_stub, 'rolling').post_report(ITEMS, tldr='Two')
+
+    api = github_stub.api
+    assert first['number'] == second['number']
+    assert len(api['issues']) == 1
+    assert len(api['comments'][first['number']]) == 2
+    gets = [r for r in api['requests'] if r[0] == 'GET']
+    assert gets[1][2] is not None  # second lookup sent If-None-Match
+
+    third = _bridge(github_stub, 'rolling')
+    third.post_report(ITEMS, tldr='Three')
+    assert third.rate_limit_remaining is not None
+
+def test_oversized_report_is_chunked_into_comments(github_stub):
+    big = [{'title': f'Item {i}', 'source': 'src', 'summary': 'z' * 2000} for i in range(100)]
+    issue = _bridge(github_stub, 'issue').post_report(big)
+
+    api = github_stub.api
+    assert len(api['issues'][issue['number']]['body']) <= GITHUB_BODY_LIMIT
+    comments = api['comments'][issue['number']]
+    parts = len(comments) + 1
+    assert parts >= 3
+    assert comments[-1].endswith(f'*(part {parts}/{parts})*')
+
+def test_secondary_rate_limit_is_retried(github_stub):
+    github_stub.api['secondary_limit_once'] = True
+    issue = _bridge(github_stub, 'daily').post_report(ITEMS)
+    assert 'Daily Pulse' in github_stub.api['issues'][issue['number']]['title']
+
+def test_cli_rejects_unknown_mode_before_scanning():
+    with patch('ai_tpc_agent.main.TPCAgent') as agent:
+        result = CliRunner().invoke(app, ['github', '--mode', 'rolling_'])
+    assert result.exit_code == 1 and '--mode must be one of' in result.output
+    agent.assert_not_called()
+
+def test_http_date_retry_after_is_parsed():
+    bridge = GitHubBridge(repo='org/repo', token='t', mode='daily', min_write_interval=0)
+    response = MagicMock(headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+    assert bridge._retry_after(response) == 0.0
+    response.headers = {'Retry-After': 'soon'}
+    assert bridge._retry_after(response) == 60.0
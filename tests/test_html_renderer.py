@@ -0,0 +1,39 @@
+from ai_tpc_agent.core.html_renderer import CompiledTemplate, HTMLReportRenderer, card_color_for, md_to_html
+from ai_tpc_agent.core.email_bridge import EmailBridge
+
+ITEMS = [
+    {'title': 'Claude Opus Launch', 'source': 'anthropic-news', 'impact_score': 95, 'summary': '**Key Feature:** X\n- bullet', 'bridge': 'Talk track', 'tags': ['Models'], 'date': '2026-02-06T00:00:00Z'},
+    {'title': 'Vertex patch', 'source': 'vertex-ai-releases', 'impact_score': 20, 'tags': ['Security']},
+]
+
+def test_compiled_template():
+    tpl = CompiledTemplate('<a href="${url}">${title}</a>${url}')
+    assert tpl.render(url='#x', title='T') == '<a href="#x">T</a>#x'
+
+def test_md_to_html_and_colors():
+    html = md_to_html('**Bold** intro\n- first\n* second')
+    assert '<strong style="color: #0f172a;">Bold</strong>' in html
+    assert html.count('•') == 2
+    assert card_color_for('Anthropic News') == '#cc785c'
+    assert card_color_for('Unknown Source') == '#3b82f6'
+
+def test_render_report_sections():
+    html = HTMLReportRenderer().render(ITEMS, tldr='Synthesis', date_range='2026-02-01 to 2026-02-06', infographic_cid='img', gaps='- gap')
+    assert html.index('Anthropic News') < html.index('Vertex Ai Releases')
+    assert 'href="#pulse-0"' in html and 'id="pulse-0"' in html
+    assert 'Mission Critical' in html and 'Security Critical' in html
+    assert 'cid:img' in html
+    assert 'Strategic Battlecard' in html
+    assert 'anchor_id' not in ITEMS[0]
+
+def test_item_fragments_are_cached_across_renders():
+    renderer = HTMLReportRenderer()
+    first = renderer.render(ITEMS, tldr='A')
+    second = renderer.render(ITEMS, tldr='B')
+    assert renderer.fragment_misses == 2
+    assert renderer.fragment_hits == 2
+    assert first.replace('>A<', '>B<') == second
+
+def test_email_bridge_uses_renderer():
+    html = EmailBridge('to@example.com', 'from@example.com', 'pw')._format_html_report(ITEMS, tldr='Synthesis')
+    assert 'Claude Opus Launch' in html
@@ -0,0 +1,59 @@
+import re
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from ai_tpc_agent.core.agent import TPCAgent, RANK_RUBRIC
+from ai_tpc_agent.core.archive import pulse_key
+from ai_tpc_agent.core.impact_cache import ImpactScoreCache
+
+def _items(n, start=0):
+    return [{'title': f'Update {i}', 'source': 'vertex-ai-releases', 'date': f'2026-02-{1 + i % 28:02d}T00:00:00Z'} for i in range(start, start + n)]
+
+def _scoring_client(fail_marker=None):
+    """Scores each update by its number; returns prose for chunks containing fail_marker."""
+    def generate_content(model, contents, **kwargs):
+        if fail_marker and fail_marker in contents:
+            return SimpleNamespace(text='Sorry, I cannot score these.')
+        rows = re.findall(r'^\s*\[(\d+)\] Update (\d+)', contents, flags=re.MULTILINE)
+        return SimpleNamespace(text=json.dumps([{'index': int(i), 'score': int(n) % 100} for i, n in rows]))
+    client = MagicMock()
+    client.models.generate_content.side_effect = generate_content
+    return client
+
+def test_cache_roundtrip_is_scoped_by_rubric(tmp_path):
+    cache = ImpactScoreCache(str(tmp_path / 'scores.db'))
+    cache.put_many({'a': 90, 'b': 40}, 'rubric-1')
+    assert cache.get_many(['a', 'b', 'c'], 'rubric-1') == {'a': 90, 'b': 40}
+    assert cache.get_many(['a'], 'rubric-2') == {}
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_second_run_only_scores_new_items(mock_vs, monkeypatch):
+    monkeypatch.setenv('TPC_RANK_CHUNK_SIZE', '10')
+    agent = TPCAgent(project_id='test')
+    agent.client = _scoring_client()
+
+    agent._rank_by_impact(_items(25))
+    assert agent.client.models.generate_content.call_count == 3  # chunks of 10, 10, 5
+
+    agent.client.models.generate_content.reset_mock()
+    ranked = agent._rank_by_impact(_items(25) + _items(3, start=25))
+    prompts = [c.kwargs['contents'] for c in agent.client.models.generate_content.call_args_list]
+    assert len(prompts) == 1 and 'Update 27' in prompts[0] and 'Update 3 ' not in prompts[0]
+    # Cached and fresh scores merge into one global ranking
+    assert [item['impact_score'] for item in ranked[:3]] == [27, 26, 25]
+    assert len(ranked) == 20
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_failed_chunk_only_affects_its_items(mock_vs, monkeypatch):
+    monkeypatch.setenv('TPC_RANK_CHUNK_SIZE', '5')
+    agent = TPCAgent(project_id='test')
+    agent.client = _scoring_client(fail_marker='Update 7')
+    items = _items(10)
+
+    ranked = agent._rank_by_impact(items)
+
+    scores = {item['title']: item['impact_score'] for item in ranked}
+    assert scores['Update 4'] == 4 and scores['Update 7'] == 0
+    # Failed items are not cached, so the next run retries them
+    cached = agent.impact_cache.get_many([pulse_key(i) for i in items], RANK_RUBRIC)
+    assert len(cached) == 5 and pulse_key(items[7]) not in cached
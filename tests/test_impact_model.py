@@ -0,0 +1,74 @@
+import random
+from unittest.mock import MagicMock, patch
+import numpy as np
+import pytest
+from ai_tpc_agent.core.agent import TPCAgent, RANK_RUBRIC
+from ai_tpc_agent.core.archive import pulse_key
+from ai_tpc_agent.core.impact_cache import ImpactScoreCache
+from ai_tpc_agent.core.impact_model import ImpactModel, train_from_cache
+
+KINDS = [('GA launch of', 95), ('preview of', 75), ('minor update to', 55), ('patch notes for', 20), ('docs typo in', 10)]
+PRODUCTS = ['Gemini 2.5', 'Vertex AI', 'ADK', 'Claude SDK', 'Agent Builder', 'Genkit']
+
+def _history(n, seed=0):
+    rng = random.Random(seed)
+    items, scores = [], []
+    for i in range(n):
+        kind, score = rng.choice(KINDS)
+        items.append({'title': f'{kind} {rng.choice(PRODUCTS)} v{i}', 'source': 'vertex-ai-releases', 'category': 'platform',
+                      'date': '2026-02-06T00:00:00Z'})
+        scores.append(score)
+    return items, scores
+
+def _seed_cache(cache, n=400):
+    items, scores = _history(n)
+    cache.put_many({pulse_key(i): s for i, s in zip(items, scores)}, RANK_RUBRIC, items={pulse_key(i): i for i in items})
+
+def test_train_save_load_and_agreement(tmp_path):
+    cache = ImpactScoreCache(str(tmp_path / 'scores.db'))
+    _seed_cache(cache)
+    model = train_from_cache(cache, RANK_RUBRIC)
+
+    report = model.metrics['holdout']
+    assert report['tier_agreement'] > 0.9 and report['spearman'] > 0.9
+    path = model.save(str(tmp_path / 'model.npz'))
+    loaded = ImpactModel.load(RANK_RUBRIC, path)
+    probe = [{'title': 'GA launch of Genkit v9999', 'source': 'vertex-ai-releases', 'category': 'platform'},
+             {'title': 'docs typo in ADK v9999', 'source': 'vertex-ai-releases', 'category': 'platform'}]
+    assert np.allclose(loaded.predict(probe), model.predict(probe))
+    assert loaded.predict(probe)[0] > 85 > 40 > loaded.predict(probe)[1]
+    assert ImpactModel.load('other-rubric', path) is None
+
+def test_training_requires_history(tmp_path):
+    with pytest.raises(ValueError):
+        train_from_cache(ImpactScoreCache(str(tmp_path / 'scores.db')), RANK_RUBRIC)
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_only_uncertain_band_reaches_the_ranker(mock_vs):
+    agent = TPCAgent(project_id='test')
+    _seed_cache(agent.impact_cache)
+    agent.impact_model = train_from_cache(agent.impact_cache, RANK_RUBRIC)
+    agent.client = MagicMock()
+    agent.client.models.generate_content.return_value = MagicMock(text='[{"index": 0, "score": 70}]')
+    new = [{'title': f'{kind} Genkit v{9000 + n}', 'source': 'vertex-ai-releases', 'category': 'platform',
+            'date': '2026-03-01T00:00:00Z'} for n, (kind, _) in enumerate(KINDS)]
+
+    ranked = agent._rank_by_impact(new)
+
+    prompt = agent.client.models.generate_content.call_args.kwargs['contents']
+    assert 'preview of' in prompt or 'minor update to' in prompt
+    assert 'GA launch of' not in prompt and 'patch notes for' not in prompt
+    assert ranked[0]['title'].startswith('GA launch of')
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_local_model_ranks_without_a_client(mock_vs):
+    agent = TPCAgent(project_id='test')
+    _seed_cache(agent.impact_cache)
+    agent.impact_model = train_from_cache(agent.impact_cache, RANK_RUBRIC)
+    agent.client = None
+    items, _ = _history(30, seed=7)
+
+    result = agent.synthesize_reports(items)
+
+    scores = [item['impact_score'] for item in result['items']]
+    assert scores == sorted(scores, reverse=True) and scores[0] > 85
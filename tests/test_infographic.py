@@ -0,0 +1,69 @@
+import os
+import shutil
+import pytest
+from unittest.mock import MagicMock
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.infographic import InfographicCache, infographic_key, optimize_for_email
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'daily_pulse_infographic.png')
+
+def test_infographic_key_depends_on_inputs():
+    key = infographic_key('tldr', ['A', 'B'])
+    assert key == infographic_key('tldr', ['A', 'B'])
+    assert key != infographic_key('tldr', ['B', 'A'])
+    assert key != infographic_key('other', ['A', 'B'])
+
+def test_cache_lookup(tmp_path):
+    cache = InfographicCache(str(tmp_path))
+    assert cache.get('abc') is None
+    with open(cache.path_for('abc'), 'wb') as f:
+        f.write(b'png')
+    assert cache.get('abc') == cache.path_for('abc')
+
+def test_optimize_for_email_downscales_and_reuses(tmp_path):
+    pytest.importorskip('PIL')
+    src = str(tmp_path / 'pulse.png')
+    shutil.copy(SAMPLE, src)
+
+    variant = optimize_for_email(src, max_width=320, quality=75)
+
+    from PIL import Image
+    with Image.open(variant) as img:
+        assert img.width == 320
+    assert os.path.getsize(variant) < os.path.getsize(src)
+    assert optimize_for_email(src, max_width=320, quality=75) == variant
+    assert optimize_for_email(src, max_width=None) == src
+
+def test_interrupted_save_leaves_no_cache_entry(tmp_path):
+    agent = TPCAgent.__new__(TPCAgent)
+    agent.infographic_cache = InfographicCache(str(tmp_path))
+    agent.client = MagicMock()
+
+    def partial_save(path):
+        with open(path, 'wb') as f:
+            f.write(b'\x89PNG')
+        raise OSError('disk full')
+    agent.client.models.generate_image.return_value.save.side_effect = partial_save
+    pulse = {'tldr': 'tldr', 'items': [{'title': 'A'}]}
+
+    assert agent.generate_infographic(pulse) is None
+    assert agent.infographic_cache.get(infographic_key('tldr', ['A'])) is None
+    assert os.listdir(tmp_path) == []
+
+    agent.client.models.generate_image.return_value.save.side_effect = lambda path: open(path, 'wb').write(b'png')
+    path = agent.generate_infographic(pulse)
+    assert path == agent.infographic_cache.path_for(infographic_key('tldr', ['A'])) and os.path.getsize(path) == 3
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+def test_concurrent_stores_use_separate_temp_files(tmp_path):
+    cache = InfographicCache(str(tmp_path))
+    seen = []
+
+    def save(path):
+        seen.append(path)
+        if len(seen) == 1:
+            cache.store('k', save)
+        with open(path, 'wb') as f:
+            f.write(b'png')
+    assert cache.store('k', save) == cache.path_for('k')
+    assert len(set(seen)) == 2 and os.listdir(tmp_path) == ['k.png']
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock, patch
+from ai_tpc_agent.core.ingestion import IngestionJobManager, IngestionJournal
+
+
+def _response(imported=0, failed=0):
+    resp = MagicMock()
+    resp.imported_rag_files_count = imported
+    resp.skipped_rag_files_count = 0
+    resp.failed_rag_files_count = failed
+    return resp
+
+@patch('vertexai.preview.rag.import_files')
+def test_batches_are_size_bounded(mock_import):
+    mock_import.return_value = _response(imported=2)
+    manager = IngestionJobManager('corpora/c1', batch_size=2, max_concurrency=2, poll_interval=0.01)
+    uris = [f"https://drive.google.com/open?id={i}" for i in range(5)]
+
+    summary = manager.run(uris)
+
+    assert mock_import.call_count == 3
+    assert all(len(c.kwargs['paths']) <= 2 for c in mock_import.call_args_list)
+    assert summary['completed'] == 5
+    assert summary['documents'] == 6
+    assert summary['docs_per_minute'] > 0
+
+@patch('vertexai.preview.rag.import_files')
+def test_rerun_skips_completed_and_retries_failed(mock_import, tmp_path):
+    journal_path = str(tmp_path / 'journal.json')
+    mock_import.side_effect = [_response(imported=1), RuntimeError("quota exceeded")]
+    manager = IngestionJobManager('corpora/c1', batch_size=1, max_concurrency=1, poll_interval=0.01,
+                                  journal=IngestionJournal(journal_path))
+
+    first = manager.run(["gs://b/a.pdf", "gs://b/b.pdf"])
+    assert first['completed'] == 1
+    assert first['failed'] == 1
+
+    mock_import.reset_mock(side_effect=True)
+    mock_import.return_value = _response(imported=1)
+    resumed = IngestionJobManager('corpora/c1', batch_size=1, poll_interval=0.01,
+                                  journal=IngestionJournal(journal_path))
+    second = resumed.run(["gs://b/a.pdf", "gs://b/b.pdf"])
+
+    assert second['skipped'] == 1
+    assert mock_import.call_count == 1
+    assert mock_import.call_args.kwargs['paths'] == ["gs://b/b.pdf"]
+    assert resumed.journal.status("gs://b/b.pdf") == 'completed'
+
+@patch('vertexai.preview.rag.import_files')
+def test_partial_import_failure_marks_batch_failed(mock_import):
+    mock_import.return_value = _response(imported=3, failed=1)
+    manager = IngestionJobManager('corpora/c1', poll_interval=0.01)
+
+    summary = manager.run(["https://drive.google.com/drive/folders/abc"])
+
+    assert summary['failed'] == 1
+    assert manager.journal.status("https://drive.google.com/drive/folders/abc") == 'failed'
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import pytest
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.ledger import TokenLedger, usage_tokens, call_cost
+
+def _response(text='ok', prompt_tokens=100, output_tokens=20):
+    usage = SimpleNamespace(prompt_token_count=prompt_tokens, candidates_token_count=output_tokens, cached_content_token_count=None)
+    return SimpleNamespace(text=text, usage_metadata=usage)
+
+def test_usage_tokens_reads_metadata_or_estimates():
+    assert usage_tokens(_response())['input_tokens'] == 100
+    estimated = usage_tokens(SimpleNamespace(text='x' * 40), prompt='y' * 400)
+    assert estimated == {'input_tokens': 100, 'output_tokens': 10, 'cached_tokens': 0, 'estimated': True}
+
+def test_ledger_aggregates_per_site():
+    ledger = TokenLedger()
+    client = MagicMock()
+    client.models.generate_content.return_value = _response()
+    ledger.generate(client, 'tags', 'gemini-2.5-flash', 'prompt')
+    ledger.generate(client, 'tags', 'gemini-2.5-flash', 'prompt')
+    client.models.generate_content.side_effect = RuntimeError('quota')
+    with pytest.raises(RuntimeError):
+        ledger.generate(client, 'tldr', 'gemini-2.5-pro', 'prompt')
+
+    report = ledger.report()
+    assert report['calls'] == 3 and report['failures'] == 1
+    assert report['total_tokens'] == 240
+    assert report['by_site'][0]['site'] == 'tags' and report['by_site'][0]['calls'] == 2
+    assert report['cost_usd'] == pytest.approx(2 * call_cost('gemini-2.5-flash', 100, 20))
+
+def test_time_budget():
+    ledger = TokenLedger(time_budget_seconds=0.001)
+    ledger.started -= 1
+    assert ledger.exhausted()
+    assert not TokenLedger().exhausted()
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_token_budget_degrades_remaining_items(mock_vs):
+    mock_vs.return_value.enabled = False
+    agent = TPCAgent(project_id='test', token_budget=500)
+    agent.client = MagicMock()
+    agent.client.models.generate_content.return_value = _response('Governance', 100, 20)
+    agent._rank_by_impact = lambda items: items
+    knowledge = [{'title': f'Gemini update {i}', 'source': 'vertex-ai-releases', 'description': 'Vertex', 'summary': 'x' * 120,
+                  'category': 'platform', 'date': '2026-02-06T12:00:00Z'} for i in range(6)]
+
+    result = agent.synthesize_reports(knowledge)
+
+    ledger = result['ledger']
+    assert ledger['budget']['exhausted']
+    assert any(step.startswith('item:') for step in ledger['budget']['degraded'])
+    assert 'tldr' in ledger['budget']['degraded']
+    # Items after the budget ran out use the keyword talk track
+    assert result['items'][-1]['bridge'] == agent.tools.bridge_roadmap_to_field(result['items'][-1])
+    assert ledger['total_tokens'] < 500 + 3 * 120
@@ -0,0 +1,120 @@
+import io
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core import maturity
+from ai_tpc_agent.core.maturity import MaturityAuditor, compact_pypi_document, read_pypi_document
+from ai_tpc_agent.core.pypi_cache import PyPIMetadataCache
+
+PYPI_DOC = {
+    'info': {'version': '1.2.0', 'summary': 'An SDK', 'description': 'Readme', 'author': 'Jane', 'project_urls': {}},
+    'releases': {
+        '1.2.0': [{'filename': 'sdk-1.2.0.whl', 'upload_time': '2026-02-01T10:00:00'}],
+        '1.0.0': [{'filename': 'sdk-1.0.0.tar.gz', 'upload_time': '2025-11-02T09:00:00'},
+                  {'filename': 'sdk-1.0.0.whl', 'upload_time': '2025-11-01T09:00:00'}],
+        '0.9.5': [{'filename': 'sdk-0.9.5.whl', 'upload_time': '2025-10-01T09:00:00', 'yanked': True}],
+        '0.9.0': [],
+    },
+    'urls': [{'upload_time': '2026-02-01T10:00:00'}],
+}
+
+def _response(status, payload=None, etag=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.headers = {'ETag': etag} if etag else {}
+    resp.json.return_value = payload
+    resp.raw = io.BytesIO(json.dumps(payload).encode('utf-8'))
+    resp.__enter__.return_value = resp
+    return resp
+
+def test_cache_serves_fresh_entries_without_request(tmp_path):
+    session = MagicMock()
+    session.get.return_value = _response(200, PYPI_DOC, etag='"v1"')
+    auditor = MaturityAuditor(metadata_cache=PyPIMetadataCache(str(tmp_path), session=session))
+
+    first = auditor.fetch_package_metadata('sdk')
+    second = auditor.fetch_package_metadata('sdk')
+
+    assert first == second
+    assert first['version'] == '1.2.0' and first['release_count'] == 4
+    assert session.get.call_count == 1
+    assert auditor.metadata_cache.stats['fresh'] == 1
+
+def test_cache_revalidates_with_etag(tmp_path):
+    session = MagicMock()
+    session.get.return_value = _response(200, PYPI_DOC, etag='"v1"')
+    cache = PyPIMetadataCache(str(tmp_path), max_age_seconds=0, session=session)
+    auditor = MaturityAuditor(metadata_cache=cache)
+    auditor.fetch_package_metadata('sdk')
+
+    session.get.return_value = _response(304)
+    data = auditor.fetch_package_metadata('sdk')
+
+    assert data['version'] == '1.2.0'
+    assert session.get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+    assert cache.stats == {'fresh': 0, 'revalidated': 1, 'fetched': 1, 'stale': 0}
+
+def test_missing_package_reports_error(tmp_path):
+    session = MagicMock()
+    session.get.return_value = _response(404)
+    auditor = MaturityAuditor(metadata_cache=PyPIMetadataCache(str(tmp_path), session=session))
+    assert 'error' in auditor.fetch_package_metadata('nope')
+
+def test_audit_packages_batches_wisdom(tmp_path):
+    session = MagicMock()
+    session.get.side_effect = lambda *a, **k: _response(200, PYPI_DOC)
+    client = MagicMock()
+    client.models.generate_content.return_value.text = '{"a": "wisdom a", "b": "wisdom b", "c": "wisdom c"}'
+    auditor = MaturityAuditor(gemini_client=client, metadata_cache=PyPIMetadataCache(str(tmp_path), session=session))
+
+    results = auditor.audit_packages(['a', 'b', 'c'], max_workers=3, wisdom_batch_size=5)
+
+    assert [results[n]['wisdom'] for n in 'abc'] == ['wisdom a', 'wisdom b', 'wisdom c']
+    assert client.models.generate_content.call_count == 1
+    assert all(0 <= results[n]['maturity_score'] <= 100 for n in 'abc')
+
+def test_audit_without_enrichment_skips_model(tmp_path):
+    session = MagicMock()
+    session.get.return_value = _response(200, PYPI_DOC)
+    client = MagicMock()
+    auditor = MaturityAuditor(gemini_client=client, metadata_cache=PyPIMetadataCache(str(tmp_path), session=session))
+
+    data = auditor.audit_pypi_package('sdk', enrich=False)
+
+    assert 'wisdom' not in data
+    assert data['maturity_tier'] in ('Early Alpha', 'Stable', 'Enterprise Grade')
+    assert data['cadence']['yanked_ratio'] == 1 / 3
+    client.models.generate_content.assert_not_called()
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_bulk_audit_upserts_once(mock_vs):
+    mock_vs.return_value.enabled = True
+    agent = TPCAgent(project_id='test')
+    agent.tools.audit_packages_maturity = MagicMock(return_value={
+        'a': {'name': 'a', 'version': '1.0', 'wisdom': 'w'},
+        'b': {'name': 'b', 'version': '2.0', 'wisdom': 'w'},
+        'c': {'error': 'Package c not found on PyPI'},
+    })
+
+    agent.audit_maturity_bulk(['a', 'b', 'c'])
+
+    mock_vs.return_value.upsert_pulses.assert_called_once()
+    pulses = mock_vs.return_value.upsert_pulses.call_args.args[0]
+    assert [p['source'] for p in pulses] == ['pypi:a', 'pypi:b']
+
+@pytest.mark.parametrize('streaming', [True, False])
+def test_read_pypi_document_keeps_compact_releases(monkeypatch, streaming):
+    if streaming:
+        pytest.importorskip('ijson')
+    else:
+        monkeypatch.setattr(maturity, 'ijson', None)
+
+    doc = read_pypi_document(_response(200, PYPI_DOC))
+
+    assert doc == compact_pypi_document(PYPI_DOC)
+    assert doc['releases'] == [['0.9.5', '2025-10-01T09:00:00', True], ['1.0.0', '2025-11-01T09:00:00', False],
+                               ['1.2.0', '2026-02-01T10:00:00', False], ['0.9.0', None, False]]
+    assert doc['info']['version'] == '1.2.0'
+    # Last release is chronological, not whatever key PyPI happened to list last
+    assert MaturityAuditor._extract_metadata('sdk', doc)['last_release'] == '1.2.0'
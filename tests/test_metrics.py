@@ -0,0 +1,83 @@
+import importlib
+from unittest.mock import MagicMock, patch
+import pytest
+from ai_tpc_agent.core.metrics import MetricsRegistry
+from ai_tpc_agent.core.tracing import TracedClient
+
+def test_counter_and_gauge_render():
+    reg = MetricsRegistry()
+    calls = reg.counter('calls_total', 'Calls.', ('model',))
+    inflight = reg.gauge('in_flight', 'In flight.')
+    calls.inc(model='gemini-2.5-flash')
+    calls.inc(2, model='gemini-2.5-flash')
+    inflight.inc()
+    inflight.dec()
+
+    text = reg.render()
+    assert '# TYPE calls_total counter' in text
+    assert 'calls_total{model="gemini-2.5-flash"} 3' in text
+    assert 'in_flight 0' in text
+
+def test_histogram_buckets_are_cumulative():
+    reg = MetricsRegistry()
+    latency = reg.histogram('latency_seconds', 'Latency.', ('route',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5):
+        latency.observe(value, route='/query')
+
+    lines = reg.render().splitlines()
+    assert 'latency_seconds_bucket{route="/query",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/query",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/query",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/query"} 3' in lines
+    assert 'latency_seconds_sum{route="/query"} 5.55' in lines
+
+def test_label_values_are_escaped():
+    reg = MetricsRegistry()
+    reg.counter('c_total', 'C.', ('q',)).inc(q='say "hi"\n')
+    assert 'c_total{q="say \\"hi\\"\\n"} 1' in reg.render()
+
+def test_traced_client_counts_model_calls():
+    from ai_tpc_agent.core.metrics import MODEL_CALLS, MODEL_CALL_SECONDS
+    client = MagicMock()
+    client.models.generate_content.side_effect = [MagicMock(), RuntimeError('quota')]
+    traced = TracedClient(client)
+    before_ok = MODEL_CALLS.value(model='metrics-test', outcome='ok')
+
+    traced.models.generate_content(model='metrics-test', contents='x')
+    with pytest.raises(RuntimeError):
+        traced.models.generate_content(model='metrics-test', contents='x')
+
+    assert MODEL_CALLS.value(model='metrics-test', outcome='ok') == before_ok + 1
+    assert MODEL_CALLS.value(model='metrics-test', outcome='error') >= 1
+    assert MODEL_CALL_SECONDS.count(model='metrics-test') >= 2
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_metrics_endpoint(mock_vs):
+    from fastapi.testclient import TestClient
+    mock_vs.return_value.enabled = True
+    mock_vs.return_value.query.return_value = [{'id': 'a'}]
+    api = importlib.reload(importlib.import_module('ai_tpc_agent.core.api'))
+    client = TestClient(api.app)
+
+    client.get('/query', params={'q': 'gemini'})
+    client.get('/query', params={'q': 'Gemini '})
+    response = client.get('/metrics')
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    body = response.text
+    assert 'tpc_http_request_duration_seconds_count{method="GET",route="/query",status="200"}' in body
+    assert 'tpc_http_requests_in_flight{method="GET",route="/metrics"} 1' in body
+    assert 'tpc_query_cache_lookups_total{result="hit"} 1' in body
+    assert 'tpc_query_cache_hit_ratio 0.5' in body
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_pulses_rejects_malformed_dates(mock_vs):
+    from fastapi.testclient import TestClient
+    mock_vs.return_value.enabled = False
+    api = importlib.reload(importlib.import_module('ai_tpc_agent.core.api'))
+    client = TestClient(api.app)
+
+    assert client.get('/pulses', params={'since': '2026-13-40'}).status_code == 422
+    assert client.get('/pulses', params={'until': 'yesterday'}).status_code == 422
+    assert client.get('/pulses', params={'since': '2026-02-01'}).status_code == 200
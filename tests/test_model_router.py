@@ -0,0 +1,97 @@
+import time
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import pytest
+from ai_tpc_agent.core import model_router
+from ai_tpc_agent.core.ledger import TokenLedger
+from ai_tpc_agent.core.model_router import ModelRouter, ModelDeadlineExceeded, LatencyStats
+
+ROUTES = {
+    'slow': {'model': 'gemini-2.5-pro', 'economy': 'gemini-2.5-flash', 'deadline': 0.5, 'hedge': True,
+             'max_input_tokens': 100},
+    'plain': {'model': 'gemini-2.5-flash', 'economy': 'gemini-2.0-flash', 'deadline': 0.2},
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_latency(monkeypatch):
+    monkeypatch.setattr(model_router, 'latency', LatencyStats())
+
+
+def _client(delays):
+    """Client whose generate_content sleeps per model and echoes the model name."""
+    release = threading.Event()
+
+    def generate_content(model, contents, **kwargs):
+        release.wait(delays.get(model, 0))
+        return SimpleNamespace(text=model, usage_metadata=None)
+
+    client = MagicMock()
+    client.models.generate_content.side_effect = generate_content
+    client.release = release
+    return client
+
+
+def test_routes_to_preferred_model_and_records_latency():
+    router = ModelRouter(TokenLedger(), routes=ROUTES)
+    assert router.generate(_client({}), 'plain', 'hi').text == 'gemini-2.5-flash'
+    assert model_router.latency.summary()['gemini-2.5-flash']['samples'] == 1
+
+
+def test_deadline_raises_without_waiting_for_stalled_call():
+    router = ModelRouter(TokenLedger(), routes=ROUTES)
+    client = _client({'gemini-2.5-flash': 5})
+    start = time.monotonic()
+    with pytest.raises(ModelDeadlineExceeded):
+        router.generate(client, 'plain', 'hi')
+    assert time.monotonic() - start < 1
+    assert router.report()['deadline_exceeded'] == 1
+    client.release.set()
+
+
+def test_slow_call_is_hedged_to_economy_model():
+    router = ModelRouter(TokenLedger(), routes=ROUTES)
+    client = _client({'gemini-2.5-pro': 5})
+    assert router.generate(client, 'slow', 'hi').text == 'gemini-2.5-flash'
+    report = router.report()
+    assert report['hedged'] == 1 and report['hedge_wins'] == 1
+    client.release.set()
+
+
+def test_hedge_waits_for_recorded_percentile():
+    for _ in range(model_router.MIN_SAMPLES):
+        model_router.latency.observe('gemini-2.5-pro', 0.4)
+    router = ModelRouter(TokenLedger(), routes=ROUTES)
+    assert router.route('slow', 'hi')['hedge_after'] == pytest.approx(0.4)
+    assert ModelRouter(TokenLedger(), routes=ROUTES, hedging=False).route('slow', 'hi')['hedge_after'] is None
+
+
+def test_low_budget_and_large_input_use_economy_model():
+    ledger = TokenLedger(token_budget=1000)
+    router = ModelRouter(ledger, routes=ROUTES)
+    assert router.route('slow', 'hi')['model'] == 'gemini-2.5-pro'
+    assert router.route('slow', 'x' * 1000)['reason'] == 'input_size'
+    ledger.record('tldr', 'gemini-2.5-pro', 0.1, input_tokens=800)
+    plan = router.route('slow', 'hi')
+    assert plan['model'] == 'gemini-2.5-flash' and plan['reason'] == 'budget' and plan['hedge_after'] is None
+
+
+def test_pinned_model_is_never_rerouted_or_hedged():
+    ledger = TokenLedger(token_budget=10)
+    ledger.record('tldr', 'gemini-2.5-pro', 0.1, input_tokens=10)
+    router = ModelRouter(ledger, routes=ROUTES)
+    client = _client({})
+    router.generate(client, 'slow', 'hi', model='gemini-2.5-pro', config={'cached_content': 'cachedContents/1'})
+    call = client.models.generate_content.call_args
+    assert call.kwargs['model'] == 'gemini-2.5-pro'
+    assert call.kwargs['config'] == {'cached_content': 'cachedContents/1'}
+
+
+def test_latency_stats_persist(tmp_path):
+    stats = LatencyStats()
+    for v in range(30):
+        stats.observe('gemini-2.0-flash', v / 10)
+    stats.save()
+    reloaded = LatencyStats()
+    assert reloaded.percentile('gemini-2.0-flash', 50) == pytest.approx(stats.percentile('gemini-2.0-flash', 50))
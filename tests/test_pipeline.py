@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import pytest
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.pipeline import StreamingPipeline, StreamCheckpoint, batched, dedupe
+
+
+def _items(n, fail_at=None, pulled=None):
+    for i in range(n):
+        if i == fail_at:
+            raise ConnectionError('feed dropped')
+        if pulled is not None:
+            pulled.append(i)
+        yield {'title': f'Agent Builder update {i}', 'source': 'vertex-ai-releases', 'category': 'roadmap',
+               'description': 'Vertex', 'summary': 'x', 'date': f'2026-02-{1 + i % 28:02d}T12:00:00Z'}
+
+
+def test_batched_and_dedupe():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    items = [{'id': 'a'}, {'id': 'b'}, {'id': 'a'}, {'id': 'c'}]
+    assert [i['id'] for i in dedupe(items)] == ['a', 'b', 'c']
+
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_stream_is_lazy_and_resumes_after_interruption(mock_vs, tmp_path):
+    mock_vs.return_value.enabled = False
+    agent = TPCAgent()
+    agent.client = None
+    agent.impact_model = None
+    checkpoint = StreamCheckpoint(str(tmp_path / 'cp.db'))
+
+    pulled, seen = [], []
+
+    def on_batch(batch):
+        # Only the current batch has been read from the source
+        assert len(pulled) <= len(seen) + len(batch) + 1
+        seen.extend(batch)
+
+    with pytest.raises(ConnectionError):
+        StreamingPipeline(agent, 'run-1', batch_size=10, checkpoint=checkpoint).run(_items(45, fail_at=33, pulled=pulled), on_batch)
+    assert len(seen) == 30 and checkpoint.count('run-1') == 30
+    assert all(item['bridge'] for item in seen)
+
+    resumed = StreamingPipeline(agent, 'run-1', batch_size=10, checkpoint=checkpoint).run(_items(45))
+    assert resumed['skipped'] == 30 and resumed['items'] == 15
+    assert resumed['completed'] == 45
+    assert agent.archive.query()['total'] == 45
+
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_stream_reports_pages_history_to_the_window_start(mock_vs):
+    mock_vs.return_value.enabled = False
+    agent = TPCAgent()
+    agent.client = None
+    agent.impact_model = None
+    now = datetime.now(timezone.utc)
+    fetched = []
+
+    def page_of_history(url, page):
+        # Ten releases per page, three days apart, newest first
+        fetched.append(page)
+        return [{'title': f'ADK v{page}.{i}', 'summary': 'Release notes',
+                 'date': (now - timedelta(days=30 * (page - 1) + 3 * i)).isoformat()} for i in range(10)]
+
+    sources = {'google-adk': {'feed': 'https://github.com/google/adk-python/releases.atom', 'category': 'roadmap', 'description': 'ADK'}}
+    with patch('ai_tpc_agent.core.agent.fetch_history_page', side_effect=page_of_history):
+        summary = agent.stream_reports(90, 'run-90d', batch_size=7, sources=sources)
+
+    # Pages 1-3 cover 87 days; page 4 opens exactly 90 days back (inside the midnight cutoff),
+    # then crosses it and ends the source
+    assert fetched == [1, 2, 3, 4]
+    assert summary['items'] == 31 and summary['batches'] == 5
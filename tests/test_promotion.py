@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock, patch
+from rich.console import Console
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.promotion import render_promotion
+
+SNAPSHOT = {
+    'tldr': 'Agents everywhere 🚀',
+    'items': [
+        {'title': 'Agent Engine GA', 'source': 'vertex-ai-releases', 'category': 'roadmap', 'date': '2026-02-06T12:00:00Z',
+         'bridge': 'Pitch managed agents to platform teams.', 'summary': 'Long technical summary'},
+        {'title': 'Claude 5 launch', 'source': 'anthropic-news', 'category': 'partners', 'date': '2026-02-05T12:00:00Z',
+         'summary': 'Technical detail ' * 40, 'business_summary': 'Customers get a stronger coding model on Vertex.'},
+    ],
+}
+
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_promote_learnings_makes_no_model_calls(mock_vs):
+    agent = TPCAgent()
+    agent.client = MagicMock()
+    console = Console(record=True, width=200)
+    with patch('ai_tpc_agent.core.agent.console', console):
+        agent.promote_learnings(SNAPSHOT, days=7)
+
+    agent.client.models.generate_content.assert_not_called()
+    text = console.export_text()
+    assert 'Pitch managed agents' in text
+    assert 'Customers get a stronger coding model on Vertex.' in text
+
+
+def test_snapshot_without_business_summary_falls_back_to_summary():
+    console = Console(record=True, width=200)
+    legacy = {'items': [dict(SNAPSHOT['items'][1], business_summary=None)]}
+    render_promotion(console, legacy, heading='Archive 2026-02-01 to today')
+    text = console.export_text()
+    assert 'Archive 2026-02-01 to today' in text
+    assert 'Technical detail' in text
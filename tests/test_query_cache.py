@@ -0,0 +1,47 @@
+from unittest.mock import patch
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.query_cache import QueryCache, normalize_query
+
+def test_normalize_query():
+    assert normalize_query("  What's new in   Agent Builder? ") == "what's new in agent builder"
+    assert normalize_query('"What\'s new in Agent Builder"') == normalize_query("what's new in agent builder")
+
+def test_lru_eviction_and_hit_rate():
+    cache = QueryCache(max_entries=2, ttl_seconds=60)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)  # evicts 'b', the least recently used
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['entries'] == 2
+
+@patch('ai_tpc_agent.core.query_cache.time.monotonic')
+def test_ttl_expiry(mock_time):
+    mock_time.return_value = 100.0
+    cache = QueryCache(ttl_seconds=10)
+    cache.put('q', ['result'])
+    mock_time.return_value = 109.0
+    assert cache.get('q') == ['result']
+    mock_time.return_value = 111.0
+    assert cache.get('q') is None
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_query_knowledge_is_cached_until_corpus_write(mock_vector_store_class):
+    agent = TPCAgent()
+    agent.vector_store.query.return_value = [{'document': 'Agent Builder GA'}]
+    agent.vector_store.on_write.assert_called_once_with(agent.query_cache.invalidate)
+
+    first = agent.query_knowledge("What's new in Agent Builder?")
+    second = agent.query_knowledge("what's new in agent builder")
+    assert first == second
+    assert agent.vector_store.query.call_count == 1
+
+    agent.query_cache.invalidate()
+    agent.query_knowledge("What's new in Agent Builder?")
+    assert agent.vector_store.query.call_count == 2
+    assert agent.query_knowledge("What's new in Agent Builder?", n_results=10) is not None
+    assert agent.vector_store.query.call_count == 3
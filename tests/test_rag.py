@@ -36,8 +36,29 @@ def test_upsert_pulses(mock_upload, mock_list, mock_init):
         "bridge": "bridge"
     }
     
+    listener = MagicMock()
+    store.on_write(listener)
     store.upsert_pulses([test_pulse])
     assert mock_upload.called
+    assert listener.called
+
+@patch('vertexai.init')
+@patch('vertexai.preview.rag.list_corpora')
+@patch('vertexai.preview.rag.upload_file')
+def test_parallel_uploads_of_same_pulse_use_separate_files(mock_upload, mock_list, mock_init):
+    mock_corpus = MagicMock()
+    mock_corpus.display_name = "tpc_pulses_corpus"
+    mock_list.return_value = [mock_corpus]
+    uploaded = []
+    mock_upload.side_effect = lambda corpus_name, path, display_name: uploaded.append((path, open(path).read(), display_name))
+
+    store = TPCVectorStore()
+    pulse = {"id": "dup", "title": "Test Pulse", "source": "src", "summary": "sum", "bridge": "bridge"}
+    store.upsert_pulses([dict(pulse) for _ in range(4)], max_workers=4)
+
+    assert len({path for path, _, _ in uploaded}) == 4
+    assert all("Title: Test Pulse" in text and name == "dup.txt" for _, text, name in uploaded)
+    assert not any(os.path.exists(path) for path, _, _ in uploaded)
 
 @patch('vertexai.init')
 @patch('vertexai.preview.rag.list_corpora')
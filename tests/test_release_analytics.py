@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+from ai_tpc_agent.core.release_analytics import is_prerelease, release_cadence, maturity_score, format_scorecard
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+def _monthly(n, start_days_ago, yanked=()):
+    return [[f'1.{i}.0', (NOW - timedelta(days=start_days_ago - 30 * i)).strftime('%Y-%m-%dT%H:%M:%S'), i in yanked]
+            for i in range(n)]
+
+def test_is_prerelease():
+    assert is_prerelease('1.0.0rc1') and is_prerelease('2.0.0b3') and is_prerelease('0.4.dev2')
+    assert not is_prerelease('1.2.0') and not is_prerelease('1.2.0+local')
+    assert is_prerelease('v1.0.0-beta') and is_prerelease('3.0.0.dev') and is_prerelease('1.0a1')
+    assert not any(is_prerelease(v) for v in ('v2.3.1-cuda', '0.4.0-arm64', 'release-abc', '1.0.post1', '2.1.0-debian'))
+
+def test_release_cadence_statistics():
+    releases = _monthly(25, 750, yanked={3}) + [['2.0.0rc1', (NOW - timedelta(days=5)).isoformat(), False], ['0.0.1', None, False]]
+    cadence = release_cadence(releases, now=NOW)
+
+    assert cadence['release_count'] == 27
+    assert cadence['dated_release_count'] == 26
+    assert cadence['stable_release_count'] == 25
+    assert round(cadence['age_days']) == 750
+    assert round(cadence['days_since_last']) == 5
+    assert cadence['interval_days']['p50'] == 30.0
+    assert cadence['yanked_ratio'] == 1 / 26
+    assert cadence['releases_last_year'] == 13
+
+def test_maturity_score_is_deterministic_and_tiered():
+    mature = release_cadence(_monthly(30, 900), now=NOW)
+    young = release_cadence([['0.1.0a1', (NOW - timedelta(days=20)).isoformat(), False]], now=NOW)
+
+    first, second = maturity_score(mature), maturity_score(mature)
+    assert first == second
+    assert first['tier'] == 'Enterprise Grade' and first['score'] > 90
+    assert maturity_score(young)['tier'] == 'Early Alpha'
+    assert '/100' in format_scorecard(mature, first)
+
+def test_empty_release_history():
+    cadence = release_cadence([], now=NOW)
+    score = maturity_score(cadence)
+    assert cadence['days_since_last'] is None
+    assert score['tier'] == 'Early Alpha'
+    assert 'n/a' in format_scorecard(cadence, score)
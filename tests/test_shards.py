@@ -0,0 +1,71 @@
+import copy
+from unittest.mock import patch
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+from ai_tpc_agent.main import app
+from ai_tpc_agent.core.agent import TPCAgent
+from ai_tpc_agent.core.shards import parse_shard, select_shard, write_artifact, read_artifacts
+
+SOURCES = {f'source-{c}': {'feed': f'https://example.com/{c}.xml', 'description': c, 'category': 'roadmap'} for c in 'abcdefg'}
+
+
+class KeywordScorer:
+    """Stands in for a trained ImpactModel: scores from the release number in the title."""
+
+    def predict(self, items):
+        return np.array([float(int(i['title'].rsplit(' ', 1)[-1]) * 7 % 100) for i in items])
+
+    def confident(self, predictions):
+        return np.ones(len(predictions), dtype=bool)
+
+
+def _knowledge():
+    return [{'title': f'{name} release {n}', 'source': name, 'category': 'roadmap', 'description': name,
+             'summary': 'Release notes', 'date': f'2026-02-{1 + n % 27:02d}T12:00:00Z'}
+            for n, name in enumerate(sorted(SOURCES) * 6)]
+
+
+def test_parse_and_select_shards():
+    assert parse_shard('2/4') == (2, 4)
+    for bad in ('0/4', '5/4', '2', 'a/b'):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+    parts = [select_shard(SOURCES, i, 3) for i in (1, 2, 3)]
+    assert sorted(n for p in parts for n in p) == sorted(SOURCES)
+    assert max(map(len, parts)) - min(map(len, parts)) <= 1
+
+
+def test_read_artifacts_validates_split(tmp_path):
+    a = write_artifact(str(tmp_path / 'a.json.gz'), (1, 3), 2, {'items': [], 'window': []})
+    b = write_artifact(str(tmp_path / 'b.json.gz'), (3, 3), 2, {'items': [], 'window': []})
+    assert read_artifacts([a, b])[0]['missing'] == [2]
+    with pytest.raises(ValueError):
+        read_artifacts([a, a])
+    with pytest.raises(ValueError):
+        read_artifacts([a, write_artifact(str(tmp_path / 'c.json.gz'), (2, 4), 2, {})])
+
+    result = CliRunner().invoke(app, ['merge', str(tmp_path / 'shards' / '*.json.gz')])
+    assert result.exit_code == 1 and result.output.startswith('Error:')
+
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_merged_shards_match_single_run(mock_vs, tmp_path):
+    mock_vs.return_value.enabled = False
+    agent = TPCAgent()
+    agent.client = None
+    agent.impact_model = KeywordScorer()
+    knowledge = _knowledge()
+
+    single = agent.synthesize_reports(copy.deepcopy(knowledge))
+
+    paths = []
+    for i in (1, 2, 3):
+        owned = select_shard(SOURCES, i, 3)
+        shard = agent.synthesize_shard([copy.deepcopy(k) for k in knowledge if k['source'] in owned])
+        paths.append(write_artifact(str(tmp_path / f'shard-{i}.json.gz'), (i, 3), 30, shard))
+    merged = agent.merge_shards(read_artifacts(paths))
+
+    assert [i['title'] for i in merged['items']] == [i['title'] for i in single['items']]
+    assert all(i['bridge'] for i in merged['items'])
+    assert [s['shard'] for s in merged['ledger']['shards']] == ['1/3', '2/3', '3/3']
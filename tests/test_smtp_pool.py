@@ -0,0 +1,146 @@
+import socket
+import socketserver
+import threading
+from email import message_from_bytes, policy
+from unittest.mock import patch
+import pytest
+from ai_tpc_agent.core.email_bridge import EmailBridge
+from ai_tpc_agent.core.smtp_pool import SMTPDeliveryPool
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP stand-in: EHLO, AUTH PLAIN, MAIL, RCPT, DATA, RSET, NOOP, QUIT."""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply('220 stub ready')
+        rcpts = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            cmd = line.decode().strip()
+            verb = cmd.split(' ')[0].upper()
+            if verb in ('EHLO', 'HELO'):
+                self.reply('250-stub')
+                self.reply('250 AUTH PLAIN')
+            elif verb == 'AUTH':
+                with server.lock:
+                    server.logins += 1
+                self.reply('535 bad credentials' if server.reject_auth else '235 ok')
+            elif verb == 'MAIL':
+                rcpts = []
+                self.reply('250 ok')
+            elif verb == 'RCPT':
+                rcpt = cmd.split(':', 1)[1].strip().strip('<>')
+                if rcpt in server.refused:
+                    self.reply('550 no such user')
+                    continue
+                rcpts.append(rcpt)
+                self.reply('250 ok')
+            elif verb == 'DATA':
+                self.reply('354 go ahead')
+                data = b''
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk == b'.\r\n':
+                        break
+                    data += chunk
+                with server.lock:
+                    flaky = server.fail_once.pop(rcpts[0], None) if rcpts else None
+                if flaky:
+                    self.reply('421 try again later')
+                    return
+                with server.lock:
+                    for r in rcpts:
+                        server.messages.append((r, data))
+                self.reply('250 queued')
+            elif verb in ('RSET', 'NOOP'):
+                self.reply('250 ok')
+            elif verb == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:
+                self.reply('502 not implemented')
+
+
+@pytest.fixture
+def smtp_stub():
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _SMTPHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.logins = 0
+    server.messages = []
+    server.refused = set()
+    server.fail_once = {}
+    server.reject_auth = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_reuses_connections(smtp_stub):
+    port = smtp_stub.server_address[1]
+    pool = SMTPDeliveryPool('127.0.0.1', port, 'tpc@example.com', 'pw', pool_size=2, rate_per_second=0, use_starttls=False)
+    recipients = [f'fa{i}@example.com' for i in range(20)]
+
+    results = pool.deliver('tpc@example.com', b'Subject: hi\r\n\r\nbody\r\n', recipients)
+
+    assert all(status == 'sent' for status in results.values())
+    assert len(smtp_stub.messages) == 20
+    assert smtp_stub.connections == 2
+    assert smtp_stub.logins == 2
+    r, data = smtp_stub.messages[0]
+    assert data.startswith(f'To: {r}\r\n'.encode())
+
+def test_pool_retries_transient_and_skips_refused(smtp_stub):
+    port = smtp_stub.server_address[1]
+    smtp_stub.refused.add('gone@example.com')
+    smtp_stub.fail_once['flaky@example.com'] = True
+    pool = SMTPDeliveryPool('127.0.0.1', port, 'tpc@example.com', 'pw', pool_size=1, rate_per_second=0,
+                            backoff_seconds=0, use_starttls=False)
+
+    results = pool.deliver('tpc@example.com', b'Subject: hi\r\n\r\nbody\r\n',
+                           ['ok@example.com', 'gone@example.com', 'flaky@example.com'])
+
+    assert results['ok@example.com'] == 'sent'
+    assert results['flaky@example.com'] == 'sent'
+    assert results['gone@example.com'].startswith('failed')
+    assert smtp_stub.connections == 2  # one reconnect after the 421
+
+def test_pool_stops_after_authentication_failure(smtp_stub):
+    port = smtp_stub.server_address[1]
+    smtp_stub.reject_auth = True
+    pool = SMTPDeliveryPool('127.0.0.1', port, 'tpc@example.com', 'wrong', pool_size=2, rate_per_second=0,
+                            backoff_seconds=0, use_starttls=False)
+    recipients = [f'fa{i}@example.com' for i in range(50)]
+
+    results = pool.deliver('tpc@example.com', b'Subject: hi\r\n\r\nbody\r\n', recipients)
+
+    assert len(results) == 50 and all(status.startswith('failed') for status in results.values())
+    assert smtp_stub.logins <= 2  # at most one attempt per pooled connection
+    assert sum('authentication failed' in status for status in results.values()) >= 48
+
+def test_email_bridge_builds_message_once(smtp_stub):
+    port = smtp_stub.server_address[1]
+    bridge = EmailBridge('a@example.com, b@example.com;c@example.com', 'tpc@example.com', 'pw',
+                         smtp_server='127.0.0.1', smtp_port=port, rate_per_second=0, use_starttls=False)
+    items = [{'title': 'Gemini 3.1 GA', 'source': 'vertex-ai-releases', 'impact_score': 98, 'summary': 'x'}]
+
+    with patch.object(EmailBridge, '_format_html_report', wraps=bridge._format_html_report) as render:
+        results = bridge.post_report(items, tldr='Synthesis', date_range='2026-02-01 to 2026-02-02')
+
+    assert render.call_count == 1
+    assert sorted(results) == ['a@example.com', 'b@example.com', 'c@example.com']
+    msg = message_from_bytes(smtp_stub.messages[0][1], policy=policy.default)
+    assert msg['To'] == smtp_stub.messages[0][0]
+    assert msg['Subject'] == '📡 AI TPC Pulse: 1 New Technical Updates (2026-02-01 to 2026-02-02)'
+    assert 'Gemini 3.1 GA' in msg.get_body(('html',)).get_content()
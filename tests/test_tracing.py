@@ -0,0 +1,123 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import pytest
+from typer.testing import CliRunner
+from ai_tpc_agent.core.tracing import Tracer, TracedClient, tracer, traced, record_retry, render_profile
+from ai_tpc_agent.main import app
+from ai_tpc_agent.core.agent import TPCAgent
+
+@pytest.fixture
+def active_tracer():
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+    tracer.reset()
+
+def test_disabled_tracer_records_nothing():
+    t = Tracer()
+    with t.span('stage') as span:
+        span.add('bytes', 10)
+    assert t.spans == [] and t.summary() == []
+
+def test_spans_nest_and_aggregate_counters():
+    t = Tracer()
+    t.enable()
+    with t.span('run'):
+        for size in (100, 250):
+            with t.span('fetch') as span:
+                span.add('bytes', size)
+                t.add('retries')
+    summary = {row['stage']: row for row in t.summary()}
+
+    assert summary['run']['depth'] == 0 and summary['fetch']['depth'] == 1
+    assert summary['fetch']['calls'] == 2
+    assert summary['fetch']['bytes'] == 350 and summary['fetch']['retries'] == 2
+    assert summary['run']['total_seconds'] >= summary['fetch']['total_seconds']
+
+def test_errors_are_recorded_and_reraised():
+    t = Tracer()
+    t.enable()
+    with pytest.raises(ValueError):
+        with t.span('boom'):
+            raise ValueError('x')
+    assert t.summary()[0]['errors'] == 1
+
+def test_spans_from_threads_are_collected():
+    t = Tracer()
+    t.enable()
+    def work():
+        with t.span('work') as span:
+            span.add('bytes', 1)
+    workers = [threading.Thread(target=work) for _ in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert t.summary()[0]['calls'] == 4
+
+def test_traced_client_records_model_tokens(active_tracer):
+    client = MagicMock()
+    client.models.generate_content.return_value.usage_metadata.prompt_token_count = 120
+    client.models.generate_content.return_value.usage_metadata.candidates_token_count = 30
+
+    TracedClient(client).models.generate_content(model='gemini-2.5-flash', contents='hi')
+
+    row = active_tracer.summary()[0]
+    assert row['stage'] == 'model.generate_content'
+    assert (row['input_tokens'], row['output_tokens']) == (120, 30)
+
+def test_traced_decorator_and_retry_hook(active_tracer):
+    @traced('stage.work')
+    def work():
+        record_retry()
+        return 'ok'
+
+    assert work() == 'ok'
+    assert active_tracer.summary()[0]['retries'] == 1
+
+def test_exports(tmp_path, active_tracer):
+    with active_tracer.span('cli.report'):
+        with active_tracer.span('tools.fetch_feed', source='vertex') as span:
+            span.add('bytes', 42)
+    active_tracer.export_chrome_trace(str(tmp_path / 'trace.json'))
+    active_tracer.export_json(str(tmp_path / 'profile.json'))
+
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    assert {e['name'] for e in events} == {'cli.report', 'tools.fetch_feed'}
+    assert all(e['ph'] == 'X' and e['dur'] >= 0 for e in events)
+    profile = json.loads((tmp_path / 'profile.json').read_text())
+    assert profile['spans'][1]['attrs'] == {'source': 'vertex', 'bytes': 42}
+
+def test_cli_profile_flag_writes_chrome_trace(tmp_path):
+    out = tmp_path / 'trace.json'
+    result = CliRunner().invoke(app, ['--profile', '--profile-output', str(out), '--profile-format', 'chrome', 'history'])
+
+    assert result.exit_code == 0, result.output
+    assert 'Pulse Profile' in result.output
+    events = json.loads(out.read_text())['traceEvents']
+    assert events[0]['name'] == 'cli.history'
+    assert not tracer.enabled
+
+@patch('ai_tpc_agent.core.agent.TPCVectorStore')
+def test_threaded_enrichment_nests_under_its_stage(mock_vs, active_tracer):
+    from rich.console import Console
+    mock_vs.return_value.enabled = False
+    agent = TPCAgent()
+    agent.client = MagicMock()
+    agent.client.models.generate_content.side_effect = lambda **kwargs: time.sleep(0.02) or SimpleNamespace(text='📈 Talk track')
+    agent.enrich_workers = 4
+    items = [{'title': f'Update {i}', 'source': 'vertex-ai-releases', 'category': 'roadmap', 'summary': 'x' * 80} for i in range(8)]
+
+    with tracer.span('cli.report') as root:
+        agent.enrich_items(items)
+
+    rows = {r['stage']: r for r in tracer.summary()}
+    assert [name for name, r in rows.items() if r['depth'] == 0] == ['cli.report']
+    assert rows['agent.enrich_items']['depth'] == 1 and rows['agent.enrich_item']['depth'] == 2
+    assert rows['agent.enrich_item']['calls'] == 8
+    console = Console(record=True, width=200)
+    render_profile(console, wall_seconds=root.duration)
+    assert f'({root.duration:.2f}s wall)' in console.export_text()